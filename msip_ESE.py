@@ -3,18 +3,30 @@
 # ------------------Import external library/commands---------------#
 
 from __future__ import print_function
+import time
+
+# The script startup time stamps [step name, time], reported by -timeStartup option
+startup_time_stamps = [["START", time.time()]]
+
+# The heavy modules (xlrd, tarfile, shutil, concurrent.futures) are imported only by the functions which use them
 from abc import ABCMeta, abstractmethod
 import os
 import sys
 from subprocess import Popen
 from subprocess import PIPE
-import tarfile
-import shutil
-import time
+import threading
 import datetime
-from xlrd import open_workbook as read_excel_module
-from xlrd import XLRDError
 import errno
+import collections
+import hashlib
+import json
+import re
+import mmap
+import struct
+import fcntl
+import glob
+
+startup_time_stamps.append(["IMPORTS", time.time()])
 
 __author__ = 'Vladimir'
 
@@ -58,6 +70,65 @@ ALL FUNCTIONS:
 # Sample run script execution wait time. Default = 3 minute, You can change it
 sample_process_wait_time = 3
 
+# Sample run script execution wait time per PEX tool in minutes. If the tool is missing, sample_process_wait_time is used. You can change it
+sample_process_tool_wait_time = {"ICV": 3,
+                                 "HERCULES": 3,
+                                 "CALIBRE": 3}
+
+# Sample run script completion check interval. Default = 5 seconds, You can change it
+sample_process_poll_interval = 5
+
+# Number of consecutive completion checks with the same size and modification time of the sample extraction outputs, before the process is closed.
+# Default = 3, You can change it
+sample_process_stable_polls = 3
+
+# Maximum number of external jobs executed in parallel. Default = 4, You can change it or use -maxParallelJobs option
+max_parallel_jobs = 4
+
+# Maximum number of PEX jobs executed in parallel, within the maximum number of external jobs. Default = 0, the same as maximum number of external jobs.
+# You can change it or use -maxParallelPexJobs option
+max_parallel_pex_jobs = 0
+
+# Available flow schedulers. STEPS is executing the flow steps one after another, DAG is starting each unit of work (sample extract per metal stack,
+# test case update per test case spec, PEX environment per GDS, PEX per GDS per project, SIM per test case) as soon as its own inputs are ready
+available_flow_schedulers = ["STEPS", "DAG"]
+
+# The flow scheduler. Default = STEPS, You can change it or use -flowScheduler option
+flow_scheduler = available_flow_schedulers[0]
+
+# Available job backends. LOCAL is executing the external commands as local processes. SPOOL is submitting the external commands into the DATA/JOB_SPOOL
+# directory, from where the spool dispatcher is executing them (the local stand-in of the compute farm batch queue)
+available_job_backends = ["LOCAL", "SPOOL"]
+
+# The job backend of the external commands. Default = LOCAL, You can change it or use -jobBackend option
+job_backend = available_job_backends[0]
+
+# The spool job backend directory name (inside DATA directory) and job status check interval in seconds. You can change it
+job_spool_directory_name = "JOB_SPOOL"
+job_spool_poll_interval = 1
+
+# Maximum time in seconds to wait for the spool job. The job is cancelled if it is not finished in time. Default = 0 (no limit), You can change it
+job_spool_wait_timeout = 0
+
+# External process output is streamed into log files by chunks of this size (bytes). Only the last chunks are kept in memory for reports
+external_process_output_chunk_size = 64 * 1024
+external_process_output_tail_chunks = 4
+
+# Maximum time in seconds to wait for the process output after the process is finished. The child processes of the process can keep the output open,
+# then the output is truncated. You can change it
+external_process_output_join_timeout = 30
+
+# Locks for the files shared between parallel jobs
+log_file_lock = threading.Lock()
+lib_defs_file_lock = threading.Lock()
+
+# The job backend instance of the external commands. The local job backend is used until the script sets the selected one
+active_job_backend = None
+
+# The -maxParallelJobs slots shared by all thread pools of the script, so the nested thread pools are not multiplying the limit
+parallel_jobs_semaphore = threading.BoundedSemaphore(max_parallel_jobs)
+parallel_jobs_thread_state = threading.local()
+
 # The script environment directories list
 environment_directories_name_list = ["LOGS",  # Index[0] Logs directory name
                                      "REPORTS",  # Index[1] Reports directory name
@@ -69,7 +140,7 @@ environment_directories_name_list = ["LOGS",  # Index[0] Logs directory name
                                      ]
 
 # Available Options For the Script
-available_script_options = ["-excelFile",  # Index[0] Excel file
+available_script_options = ["-excelFile",  # Index[0] Excel file, directory of excel files or glob pattern of excel files
                             "-targetProjectName",  # Index[1] Target Project Name
                             "-targetProjectRelease",  # Index[2] Target Project Release
                             "-referenceProjectName",  # Index[3] Reference Project Name
@@ -78,7 +149,14 @@ available_script_options = ["-excelFile",  # Index[0] Excel file
                             "-executedTestCasePackage",  # Index[6] Executed test case package(s)
                             "-projectsRootDirectory",  # Index[7] Projects root directory path
                             "-forceUpdateTestCase",  # Index[8] Force Updating Test Case Package
-                            "-executeFlow"  # Index[9]  Execute only selected step. Available values ENV_UPDATE/TEST_CASE_UPDATE/LVS/PEX/SIM/REPORT/CLEAN/ALL
+                            "-executeFlow",  # Index[9]  Execute only selected step. Available values ENV_UPDATE/TEST_CASE_UPDATE/LVS/PEX/SIM/REPORT/CLEAN/ALL
+                            "-maxParallelJobs",  # Index[10] Maximum number of external jobs executed in parallel
+                            "-incrementalUpdateTestCase",  # Index[11] Updating only changed files of the existing test case
+                            "-timeStartup",  # Index[12] Reporting the script startup time
+                            "-maxParallelPexJobs",  # Index[13] Maximum number of PEX jobs executed in parallel
+                            "-flowScheduler",  # Index[14] Flow scheduler. Available values STEPS/DAG
+                            "-jobBackend",  # Index[15] Job backend of the external commands. Available values LOCAL/SPOOL
+                            "-resume"  # Index[16] Skipping the units of work finished by the previous run(s), by the run journal of LOGS directory
                             ]
 
 # Available Steps Of The Flow For The Script
@@ -90,6 +168,9 @@ available_flows = ["UPDATE_ENV",
                    "CLEAN",
                    "ALL"]
 
+# The excel files extensions, used for selecting excel files from the directory
+excel_file_extensions = [".xls", ".xlsx", ".xlsm"]
+
 # Available excel parameters. NOTE!!! If the list value changed please make appropriate change in ReadExcel class for get_* functions
 # Important do not make any change in list order, as the script recognised the values by exact index. If there is need to do modification please update
 # available_excel_options variable in the script file
@@ -136,6 +217,13 @@ available_excel_options = ["Test Case Name",
                            "Reference Simulation Tool Version",
                            "Other Comments"]
 
+# The excel options of the project setup and PEX settings, which are taken from the first test case spec and should be the same in all specs:
+# Target/Reference CCS/PCS and release, LVS tool, deck and setup files, RCXT version, deck and starcmd
+excel_specs_project_options_indexes = [15, 16, 17, 18] + list(range(21, 37))
+
+# Upper case excel option name -> excel option name, for case insensitive excel option search
+available_excel_options_lookup = dict((option_name.upper(), option_name) for option_name in available_excel_options)
+
 # All available data regarding project setup
 project_setup_data = ["PEX TOOL NAME",  # Index[0]  The LVS tool name ICV/CALIBRE/HERCULES
                       "PEX TOOL VERSION",  # Index[1]  The LVS tool version
@@ -148,6 +236,17 @@ project_setup_data = ["PEX TOOL NAME",  # Index[0]  The LVS tool name ICV/CALIBR
 # Test Case Directory Structure
 project_test_case_directories_list = ["EXCEL", "GDS", "LVS_NETLIST", "TEST_BENCH", "MEASURE_FILES", "OTHER_INCLUDES", "USER_RESULTS"]
 untar_directory_name = "UNTAR"
+test_case_manifest_file_name = "test_case_manifest.json"
+
+# Test case files materialization methods, tried in the list order. The file is copied if all methods failed. You can change it
+available_materialization_methods = ["REFLINK", "HARDLINK", "SYMLINK", "COPY"]
+test_case_materialization_methods = available_materialization_methods[:3]
+
+# The Linux ioctl request for reflink file clone
+reflink_ioctl_request = 0x40049409
+
+# Test case files moved from the package: [excel option index, test case directory index]
+test_case_files_directories_map = [[6, 3], [7, 1], [8, 2], [11, 4], [12, 5], [13, 6], [14, 6]]
 
 # The project environment file/directories name
 project_environment_file_name = "env.tcl"
@@ -160,6 +259,22 @@ project_sample_oa_library_names_list = ["SampleLibrary"]
 project_sample_oa_cell_name = "SampleExtract"
 project_sample_runscript_file_name = "sample_runscript.sh"
 project_sample_runscript_location_dir_name = "SAMPLE_RUNSCRIPT_FILES"
+project_sample_runscript_fingerprint_file_name = "sample_runscript.fingerprint"
+pex_inputs_fingerprint_file_name = "pex_inputs.fingerprint"
+project_catalog_file_name = "projects_catalog.json"
+gds_config_cache_file_name = "gds_config_cache.json"
+run_journal_file_name = "run_journal.jsonl"
+excel_spec_cache_file_name = "excel_specs_cache.json"
+
+# Content-addressed store of the test case files in DATA directory, the test case files are links to the store objects. You can change it
+test_case_object_store_enabled = True
+object_store_directory_name = "OBJECT_STORE"
+object_store_index_file_name = "object_store.json"
+
+# The DATA files shared by the runs are changed under the lock file <file>.lock. Each run using the object store keeps the shared usage lock,
+# so the garbage collection is executed only if no other run is using the store
+data_file_lock_extension = ".lock"
+object_store_usage_lock_file_name = "object_store.usage.lock"
 available_project_tools_name = ["ICV",  # INDEX 0 Default value
                                 "HERCULES",
                                 "CALIBRE"]
@@ -175,10 +290,44 @@ project_extract_ideal_file_extension = ".raw"
 gds_file_extension = ".gds"
 netlist_file_extension = [".cdl", ".sp", ".cir"]
 gds_config_file_extension = ".config"
+
+# GDS config files generation mode. Default = "NATIVE", the GDS file is read by the script and icwbev is used only if the script cannot read it.
+# "ICWBEV" - all GDS files are analysed by icwbev. You can change it
+available_gds_config_generation_modes = ["NATIVE", "ICWBEV"]
+gds_config_generation_mode = available_gds_config_generation_modes[0]
+
+# GDSII stream format record types used for top cell and layers detection
+gds_record_types = {"HEADER": 0x00,
+                    "ENDLIB": 0x04,
+                    "STRNAME": 0x06,
+                    "LAYER": 0x0D,
+                    "DATATYPE": 0x0E,
+                    "SNAME": 0x12,
+                    "TEXTTYPE": 0x16,
+                    "NODETYPE": 0x2A,
+                    "BOXTYPE": 0x2E}
+
+# Maximum number of GDS files analysed in one icwbev session. Default = 0 (all GDS files of the test case package in one session), You can change it
+icwbev_max_gds_files_per_session = 0
+
+# The metal stack written into the "METAL_STACK:" line of the generated GDS config files, and used if the config file does not contain this line.
+# The GDS file does not contain its metal stack, so the line of the config file can be changed for the test case
+default_metal_stack = "12M_2X_vh_1Ya_v_4Y_hvhv_2Yy2Z"
 tar_file_extension = ".tar.gz"
 
 available_package_directory_tags_list = ["insideTarFile:", "insideTestCasePackagePath:"]
 
+# StarRC output directories created in each extraction run directory
+extract_star_directories_list = ["STAR_rcc_typical", "STAR_rc_typical", "STAR_srccpcc_typical", "STAR_cc_typical"]
+
+# The stored sample runscript slots. Key = the slot text in sample runscript, Value = [text before slot value, slot name, text after slot value]
+sample_runscript_template_slots = {'export RUN_DIR="";': ["export RUN_DIR=", "RUN_DIR", ";"],
+                                   'export TOP_CELL_NAME="";': ["export TOP_CELL_NAME=", "TOP_CELL_NAME", ";"],
+                                   'export GDS_FILE="";': ["export GDS_FILE=", "GDS_FILE", ";"],
+                                   'export LVS_NETLIST="";': ["export LVS_NETLIST=", "LVS_NETLIST", ""],
+                                   'export OUTPUT_DIR=""': ["export OUTPUT_DIR=", "OUTPUT_DIR", ""],
+                                   'cd ${RUN_DIR};': ["cd ${RUN_DIR};\n", "STAR_DIRECTORIES", ""]}
+
 top_cell_subckt_file_name = "topCellSubcktFile"
 subckt_start_recognition_word = ".subckt"
 subckt_end_recognition_word = ".end"
@@ -236,6 +385,79 @@ def get_file_size(file_item):
         return 0
 
 
+def get_file_digest(file_item):
+    """
+    The function is returning SHA1 digest of the file content, or empty string if the file cannot be read
+    :param file_item:
+    :return:
+    """
+
+    file_digest = hashlib.sha1()
+
+    try:
+        with open(file_item, mode="rb") as file_object:
+            for file_chunk in iter(lambda: file_object.read(1024 * 1024), b""):
+                file_digest.update(file_chunk)
+    except (IOError, OSError):
+        return ""
+
+    return file_digest.hexdigest()
+
+
+def get_referenced_files(file_item):
+    """
+    The function is returning all existing files, which are referenced by absolute path in the text file (decks, option files, starcmd of the setup file).
+    The files written by the output redirections are skipped
+    :param file_item:
+    :return: Sorted list of the referenced files
+    """
+
+    try:
+        with open(file_item, mode="r") as file_object:
+            file_content = file_object.read()
+    except (IOError, OSError, UnicodeDecodeError):
+        return []
+
+    # The files written by the output redirection are not the inputs
+    return sorted(set([file_path for redirection, file_path in re.findall(r"(>\s*[\"']?)?(/[^\s\"'{}\[\];:=$]+)", file_content)
+                       if get_string_length(redirection) < 1 and os.path.isfile(file_path)]))
+
+
+def read_json_file(file_item, default_value):
+    """
+    The function is returning the content of the JSON file, or the default value if the file cannot be read
+    :param file_item:
+    :param default_value:
+    :return:
+    """
+
+    try:
+        with open(file_item, mode="r") as file_object:
+            return json.load(file_object)
+    except (IOError, OSError, ValueError):
+        return default_value
+
+
+def write_json_file(file_item, value):
+    """
+    The function is writing the value into JSON file. The file is replaced at once, so the readers never see partially written file
+    :param file_item:
+    :param value:
+    :return: True if written, False if not
+    """
+
+    temporary_file = file_item + "." + str(os.getpid()) + "." + str(threading.current_thread().ident) + ".tmp"
+
+    try:
+        with open(temporary_file, mode="w") as file_object:
+            json.dump(value, file_object, sort_keys=True)
+        os.replace(temporary_file, file_item)
+    except (IOError, OSError, TypeError):
+        return False
+
+    return True
+
+
 def get_current_time():
     """
     The function is returning time in string format
@@ -276,7 +498,7 @@ def get_script_options_string():
 
     final_string = ""
     for option_name in available_script_options:
-        if option_name == available_script_options[8]:
+        if option_name in [available_script_options[8], available_script_options[11], available_script_options[12], available_script_options[16]]:
             final_string += string_column_decoration([str(option_name)], ["# Available Value:\t| TRUE | (default is FALSE)"], 5, 2)
         elif option_name == available_script_options[9]:
             all_values = ""
@@ -284,43 +506,132 @@ def get_script_options_string():
                 all_values += "| " + value + " |"
             all_values += " (default is ALL)"
             final_string += string_column_decoration([str(option_name)], ["# Available Values:\t" + all_values], 5, 2)
+        elif option_name in [available_script_options[14], available_script_options[15]]:
+            available_values, default_value = {available_script_options[14]: [available_flow_schedulers, flow_scheduler],
+                                               available_script_options[15]: [available_job_backends, job_backend]}[option_name]
+            all_values = ""
+            for value in available_values:
+                all_values += "| " + value + " |"
+            all_values += " (default is " + default_value + ")"
+            final_string += string_column_decoration([str(option_name)], ["# Available Values:\t" + all_values], 5, 2)
         else:
             final_string += string_column_decoration([str(option_name)], ["# Available Value:\t'" + str(option_name).replace("-", "") + "'"], 5, 2)
 
     return final_string
 
 
+def get_startup_time_report():
+    """
+    The function is returning the time of each script startup step, from the script start until the main function
+    :return:
+    """
+
+    report_string = "STARTUP TIME:\n"
+    for previous_time_stamp, time_stamp in zip(startup_time_stamps, startup_time_stamps[1:]):
+        report_string += "\t" + time_stamp[0] + "\t" * set_number_of_tabs(time_stamp[0], 3) + "{0:.1f} ms".format((time_stamp[1] - previous_time_stamp[1]) * 1000) + "\n"
+    report_string += "\tTOTAL" + "\t" * set_number_of_tabs("TOTAL", 3) + "{0:.1f} ms".format((startup_time_stamps[-1][1] - startup_time_stamps[0][1]) * 1000) + "\n"
+
+    return report_string
+
+
+def get_excel_files_list(excel_file_location):
+    """
+    The function is returning all excel files of the location. The location is excel file, directory of excel files or glob pattern
+    :param excel_file_location:
+    :return:
+    """
+
+    if os.path.isdir(excel_file_location):
+        return sorted([os.path.join(excel_file_location, file_name) for file_name in get_directory_items_list(excel_file_location)
+                       if os.path.splitext(file_name)[1].lower() in excel_file_extensions and os.path.isfile(os.path.join(excel_file_location, file_name))])
+    if glob.has_magic(excel_file_location):
+        return sorted([file_name for file_name in glob.glob(excel_file_location) if os.path.isfile(file_name)])
+
+    return [excel_file_location]
+
+
+def get_package_member_name(excel_information):
+    """
+    The function is returning package file name from the excel information, without package directory tags
+    :param excel_information:
+    :return:
+    """
+
+    excel_information = str(excel_information)
+    for package_directory_tag in available_package_directory_tags_list:
+        excel_information = excel_information.replace(package_directory_tag, "")
+
+    return excel_information
+
+
+def get_normalized_member_name(member_name):
+    """
+    The function is returning package member name without leading "./" and duplicated separators, or None if the member is outside of the package
+    :param member_name:
+    :return:
+    """
+
+    member_name = os.path.normpath(str(member_name).strip())
+    if os.path.isabs(member_name) or member_name == os.pardir or member_name.startswith(os.pardir + os.sep):
+        return None
+
+    return member_name
+
+
 # noinspection PyUnboundLocalVariable
-def untar_zip_package(zip_file, path_to_extract):
+def untar_zip_package(zip_file, path_to_extract, required_members=None, member_callback=None):
     """
-    The function is un taring tar.gz file
+    The function is un taring tar.gz file in one forward pass over the compressed stream.
+    If required members are given only these files are extracted and the reading is stopped when all of them are extracted
     :param path_to_extract:
     :param zip_file:
-    :return:
+    :param required_members: Set of normalized member names, all members are extracted if it is empty
+    :param member_callback: The function is called with the path of each extracted file
+    :return: List of extracted files
     """
 
+    import tarfile
+
+    extracted_files_list = []
+
     if check_for_file_existence(get_file_path(zip_file), get_file_name_from_path(zip_file)):
         try:
-            tar_file_object = tarfile.open(zip_file)
-        except IOError:
+            tar_file_object = tarfile.open(zip_file, mode="r|gz")
+        except (IOError, tarfile.TarError):
             exit("ERROR!: Cannot extract .tar.gz file\n\t" + zip_file)
 
-        try:
-            tar_file_members = tar_file_object.getmembers()
-        except tarfile.TarError:
-            exit("ERROR!: Cannot extract .tar.gz file\n\t" + zip_file)
+        remaining_members = set(required_members) if required_members else None
 
-        for member in tar_file_members:
-            member = str(member).split("<TarInfo \'")[1].split("'")[0]
-            try:
+        try:
+            for member in tar_file_object:
+                member_name = get_normalized_member_name(member.name)
+                if member_name is None:
+                    continue
+                if remaining_members is not None:
+                    if not member.isfile() or member_name not in remaining_members:
+                        continue
+                    remaining_members.discard(member_name)
+
+                # The existing file can be a link to another file, so it is replaced instead of overwritten
+                if member.isfile() and os.path.lexists(os.path.join(path_to_extract, member_name)):
+                    os.remove(os.path.join(path_to_extract, member_name))
                 tar_file_object.extract(member, path=path_to_extract)
-            except tarfile.ExtractError:
-                exit("ERROR!: Cannot extract .tar.gz file\n\t" + zip_file)
+                if member.isfile():
+                    extracted_files_list.append(os.path.join(path_to_extract, member_name))
+                    if member_callback is not None:
+                        member_callback(os.path.join(path_to_extract, member_name))
+
+                if remaining_members is not None and get_list_length(remaining_members) < 1:
+                    break
+        except (IOError, OSError, tarfile.TarError):
+            exit("ERROR!: Cannot extract .tar.gz file\n\t" + zip_file)
 
         tar_file_object.close()
     else:
         exit("ERROR!:\tCannot find zip file:\t" + str(zip_file))
 
+    return extracted_files_list
+
 
 def get_directory_items_list(directory_path):
     """
@@ -339,6 +650,31 @@ def get_directory_items_list(directory_path):
         return []
 
 
+def scan_directory_files(directory_path):
+    """
+    The function is returning all files under the directory and its sub directories as os.DirEntry objects, using one os.scandir call per directory
+    :param directory_path:
+    :return:
+    """
+
+    directories_to_scan = [directory_path]
+
+    while get_list_length(directories_to_scan) > 0:
+        try:
+            directory_entries = os.scandir(directories_to_scan.pop())
+        except OSError:
+            continue
+
+        for directory_entry in directory_entries:
+            try:
+                if directory_entry.is_dir(follow_symlinks=False):
+                    directories_to_scan.append(directory_entry.path)
+                elif directory_entry.is_file():
+                    yield directory_entry
+            except OSError:
+                continue
+
+
 def clean_directories(class_object_name, directory_path):
     """
     The function is cleaning all unnecessary files from the selected directory
@@ -347,6 +683,8 @@ def clean_directories(class_object_name, directory_path):
     :return:
     """
 
+    import shutil
+
     item_names_to_be_removed = ["UNTAR"]
 
     print_to_stdout(class_object_name, "Cleaning directory:\n\t" + directory_path)
@@ -362,14 +700,150 @@ def clean_directories(class_object_name, directory_path):
     print_to_stdout(class_object_name, "Cleaning process completed successfully" + directory_path)
 
 
-def execute_external_command(command):
+def set_active_job_backend(job_backend_object):
     """
-    The function is executing process through Popen function
-    :param command:
+    The function is setting the job backend, which is executing all external commands
+    :param job_backend_object:
+    :return:
+    """
+
+    global active_job_backend
+
+    active_job_backend = job_backend_object
+
+
+def set_parallel_jobs_limit(max_jobs):
+    """
+    The function is setting the number of jobs executed in parallel by all thread pools of the script together
+    :param max_jobs:
     :return:
     """
 
-    return Popen(command, shell=True, stdout=PIPE, stderr=PIPE)
+    global parallel_jobs_semaphore
+
+    parallel_jobs_semaphore = threading.BoundedSemaphore(max(1, int(max_jobs)))
+
+
+def run_limited_job(job_function, *job_arguments):
+    """
+    The function is executing the job in one of the shared parallel jobs slots. The limited jobs started by the job in the same thread are using its slot.
+    Only the jobs which are not waiting for other limited jobs should be limited, otherwise the slots can be exhausted by the waiting jobs
+    :param job_function:
+    :param job_arguments:
+    :return: The job function result
+    """
+
+    global parallel_jobs_semaphore
+
+    if getattr(parallel_jobs_thread_state, "slot_acquired", False):
+        return job_function(*job_arguments)
+
+    with parallel_jobs_semaphore:
+        parallel_jobs_thread_state.slot_acquired = True
+        try:
+            return job_function(*job_arguments)
+        finally:
+            parallel_jobs_thread_state.slot_acquired = False
+
+
+def execute_external_command(command, log_file_prefix=None):
+    """
+    The function is submitting the command through the active job backend. The command stdout/stderr are written into <log_file_prefix>.stdout/.stderr files
+    :param command:
+    :param log_file_prefix: By default it is the executed command file path
+    :return: Popen like job handle
+    """
+
+    global active_job_backend
+
+    if log_file_prefix is None:
+        log_file_prefix = str(command).split()[0]
+
+    if active_job_backend is None:
+        active_job_backend = LocalJobBackend()
+
+    return active_job_backend.submit(command, log_file_prefix)
+
+
+def wait_for_external_command(process_object):
+    """
+    The function is waiting for the command started by execute_external_command and for its output logging
+    :param process_object:
+    :return: The command return code
+    """
+
+    return process_object.wait()
+
+
+def wait_for_process_completion(process_object, timeout_seconds, poll_interval, completion_check=None, stable_polls=1):
+    """
+    The function is waiting until the process is finished or the completion check reports the same ready process outputs for several consecutive checks
+    :param process_object:
+    :param timeout_seconds:
+    :param poll_interval:
+    :param completion_check: Function without arguments, returning the state of the process outputs (for example sizes) when they are ready and None if not
+    :param stable_polls: Number of consecutive checks with the same outputs state, as the outputs can still be written by the process
+    :return: True if the process is completed and False if the timeout is reached
+    """
+
+    end_time = time.time() + timeout_seconds
+    previous_outputs_state = None
+    stable_outputs_polls = 0
+
+    while True:
+        if process_object.poll() is not None:
+            return True
+
+        if completion_check is not None:
+            outputs_state = completion_check()
+            if outputs_state is not None and outputs_state == previous_outputs_state:
+                stable_outputs_polls += 1
+            else:
+                stable_outputs_polls = 1 if outputs_state is not None else 0
+            previous_outputs_state = outputs_state
+
+            if stable_outputs_polls >= max(1, stable_polls):
+                if process_object.poll() is not None:
+                    return True
+                process_timeout(process_object, "The process outputs are ready and not changed. Closing the process")
+                return True
+
+        remaining_time = end_time - time.time()
+        if remaining_time <= 0:
+            return False
+
+        time.sleep(min(poll_interval, remaining_time))
+
+
+def run_parallel_jobs(job_function, job_arguments_list, max_jobs, limited_jobs=True):
+    """
+    The function is executing the job function for each arguments list of the job arguments list, using bounded thread pool
+    :param job_function:
+    :param job_arguments_list:
+    :param max_jobs: Maximum number of jobs executed in parallel
+    :param limited_jobs: The jobs are using the shared parallel jobs slots. False for the jobs which are starting limited jobs in other threads
+    :return: List of [job arguments, job result, job exception] in the same order as job arguments list
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    all_results = []
+    if get_list_length(job_arguments_list) < 1:
+        return all_results
+
+    with ThreadPoolExecutor(max_workers=max(1, int(max_jobs))) as executor:
+        if limited_jobs:
+            all_futures = [executor.submit(run_limited_job, job_function, *job_arguments) for job_arguments in job_arguments_list]
+        else:
+            all_futures = [executor.submit(job_function, *job_arguments) for job_arguments in job_arguments_list]
+        for job_arguments, job_future in zip(job_arguments_list, all_futures):
+            try:
+                all_results.append([job_arguments, job_future.result(), None])
+            except (Exception, SystemExit) as job_exception:
+                # exit() calls inside the job are also collected, instead of finishing the script
+                all_results.append([job_arguments, None, job_exception])
+
+    return all_results
 
 
 def process_timeout(process_object, text_to_display):
@@ -496,10 +970,11 @@ def print_to_stdout(class_object_name, text_to_print):
     :return:
     """
 
-    if "NEW LINE" != str(text_to_print).upper():
-        print(str(get_current_time() + ":\t\t" + str(text_to_print)), file=class_object_name.object_stdout_file)
-    else:
-        print("\n", file=class_object_name.object_stdout_file)
+    with log_file_lock:
+        if "NEW LINE" != str(text_to_print).upper():
+            print(str(get_current_time() + ":\t\t" + str(text_to_print)), file=class_object_name.object_stdout_file)
+        else:
+            print("\n", file=class_object_name.object_stdout_file)
 
 
 def print_to_stderr(object_name, text_to_print):
@@ -510,7 +985,8 @@ def print_to_stderr(object_name, text_to_print):
     :return:
     """
 
-    print(str(get_current_time() + ":ERROR!:\t" + str(text_to_print)), file=object_name.object_stderr_file)
+    with log_file_lock:
+        print(str(get_current_time() + ":ERROR!:\t" + str(text_to_print)), file=object_name.object_stderr_file)
     exit("\n\nScript finished with errors 0_o. Please check log files\n\n")
 
 
@@ -572,6 +1048,193 @@ def check_if_string_is_empty(string_name):
         return True
 
 
+def compile_sample_runscript_template(sample_runscript_content):
+    """
+    The function is compiling the sample runscript content into template.
+    The template is a list, where even items are the runscript text and odd items are the slot names from sample_runscript_template_slots
+    :param sample_runscript_content:
+    :return:
+    """
+
+    slots_pattern = "(" + "|".join([re.escape(slot_text) for slot_text in sorted(sample_runscript_template_slots.keys(), key=len, reverse=True)]) + ")"
+
+    template = []
+    text_before_slot = ""
+
+    for part_index, content_part in enumerate(re.split(slots_pattern, sample_runscript_content)):
+        if part_index % 2 == 0:
+            text_before_slot += content_part
+        else:
+            slot_info = sample_runscript_template_slots[content_part]
+            template += [text_before_slot + slot_info[0], slot_info[1]]
+            text_before_slot = slot_info[2]
+
+    template.append(text_before_slot)
+
+    return template
+
+
+def render_sample_runscript_template(template, slot_values):
+    """
+    The function is returning the runscript content, by filling template slots with the values
+    :param template: The compile_sample_runscript_template function result
+    :param slot_values: Hash. Key = slot name, Value = slot value
+    :return:
+    """
+
+    return "".join([slot_values.get(template_part, "") if part_index % 2 else template_part for part_index, template_part in enumerate(template)])
+
+
+def read_gds_file_info(gds_file):
+    """
+    The function is reading GDSII stream file and returning its top cell name and all used layers, without launching any tool.
+    The top cell is the last structure which is not referenced by other structures
+    :param gds_file:
+    :return: [top cell name, list of "LAYER:DATATYPE" strings] or None if the file is not a readable or complete GDSII file
+    """
+
+    record_header = struct.Struct(">HB")
+    # LAYER and DATATYPE are unsigned, the layers above 32767 should not be reported as negative numbers
+    record_short_value = struct.Struct(">H")
+
+    all_structure_names = []
+    all_referenced_names = set()
+    all_layers = set()
+    current_layer = None
+    library_is_ended = False
+
+    try:
+        gds_file_object = open(gds_file, mode="rb")
+    except (IOError, OSError):
+        return None
+
+    try:
+        gds_content = mmap.mmap(gds_file_object.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        gds_file_object.close()
+        return None
+
+    try:
+        content_size = len(gds_content)
+        if content_size < 4 or record_header.unpack_from(gds_content, 0)[1] != gds_record_types["HEADER"]:
+            return None
+
+        position = 0
+        while position + 4 <= content_size:
+            record_length, record_type = record_header.unpack_from(gds_content, position)
+            # The truncated file is not analysed, as its layers can be missing
+            if record_length < 4 or position + record_length > content_size:
+                return None
+
+            if record_type == gds_record_types["STRNAME"]:
+                all_structure_names.append(gds_content[position + 4:position + record_length].rstrip(b"\0").decode("ascii", "replace"))
+            elif record_type == gds_record_types["SNAME"]:
+                all_referenced_names.add(gds_content[position + 4:position + record_length].rstrip(b"\0").decode("ascii", "replace"))
+            elif record_type == gds_record_types["LAYER"]:
+                current_layer = record_short_value.unpack_from(gds_content, position + 4)[0]
+            elif record_type in (gds_record_types["DATATYPE"], gds_record_types["TEXTTYPE"], gds_record_types["NODETYPE"], gds_record_types["BOXTYPE"]):
+                if current_layer is not None:
+                    all_layers.add((current_layer, record_short_value.unpack_from(gds_content, position + 4)[0]))
+                    current_layer = None
+            elif record_type == gds_record_types["ENDLIB"]:
+                library_is_ended = True
+                break
+
+            position += record_length
+    except struct.error:
+        return None
+    finally:
+        gds_content.close()
+        gds_file_object.close()
+
+    if not library_is_ended:
+        return None
+
+    root_cell_names = [structure_name for structure_name in all_structure_names if structure_name not in all_referenced_names]
+    if get_list_length(root_cell_names) < 1:
+        return None
+
+    return [root_cell_names[-1], [str(layer) + ":" + str(data_type) for layer, data_type in sorted(all_layers)]]
+
+
+def read_gds_config_file(gds_file):
+    """
+    The function is reading the GDS config file of the GDS file
+    :param gds_file:
+    :return: [top cell name, list of layers] or None if the config file cannot be read or has no top cell name
+    """
+
+    top_cell_name = None
+    all_layers = []
+
+    try:
+        with open(gds_file + gds_config_file_extension, mode="r") as config_file_object:
+            for line in config_file_object:
+                if line.startswith("TOP_CELL_NAME:"):
+                    top_cell_name = line.split(":", 1)[1].strip()
+                elif line.startswith("ALL_LAYERS:"):
+                    all_layers = line.split(":", 1)[1].split()
+    except (IOError, OSError):
+        return None
+
+    if top_cell_name is None or get_string_length(top_cell_name) < 1:
+        return None
+
+    return [top_cell_name, all_layers]
+
+
+def write_gds_config_file(gds_file, top_cell_name, all_layers, metal_stack=default_metal_stack):
+    """
+    The function is writing the GDS config file next to the GDS file, in the same format as icwbev export
+    :param gds_file:
+    :param top_cell_name:
+    :param all_layers:
+    :param metal_stack:
+    :return:
+    """
+
+    config_file_object = open_file_for_writing(get_file_path(gds_file), get_file_name_from_path(gds_file) + gds_config_file_extension)
+    config_file_object.write("TOP_CELL_NAME:\t\t\t " + str(top_cell_name) + "\n")
+    config_file_object.write("ALL_LAYERS:\t\t\t " + " ".join(all_layers) + "\n")
+    config_file_object.write("METAL_STACK:\t\t\t " + str(metal_stack) + "\n")
+    config_file_object.close()
+
+
+def materialize_file(source_file, target_file, materialization_methods):
+    """
+    The function is creating the target file from the source file by the first succeeded method, the file is copied if all methods failed.
+    The existing target file is replaced
+    :param source_file:
+    :param target_file:
+    :param materialization_methods: List of methods from available_materialization_methods
+    :return: The used method or None if the file cannot be created
+    """
+
+    import shutil
+
+    for materialization_method in list(materialization_methods) + [available_materialization_methods[3]]:
+        try:
+            if os.path.lexists(target_file):
+                os.remove(target_file)
+
+            if materialization_method == available_materialization_methods[0]:
+                with open(source_file, mode="rb") as source_file_object:
+                    with open(target_file, mode="wb") as target_file_object:
+                        fcntl.ioctl(target_file_object.fileno(), reflink_ioctl_request, source_file_object.fileno())
+            elif materialization_method == available_materialization_methods[1]:
+                os.link(source_file, target_file)
+            elif materialization_method == available_materialization_methods[2]:
+                os.symlink(os.path.abspath(source_file), target_file)
+            else:
+                shutil.copy(source_file, target_file)
+
+            return materialization_method
+        except (IOError, OSError):
+            continue
+
+    return None
+
+
 def create_directory(path_to_create, directory_to_create):
     """
     The function is creating directory on the selected path
@@ -583,6 +1246,9 @@ def create_directory(path_to_create, directory_to_create):
     if not check_for_dir_existence(path_to_create, directory_to_create):
         try:
             os.mkdir(os.path.join(path_to_create, directory_to_create))
+        except FileExistsError:
+            # The directory is created by the parallel job
+            pass
         except OSError:
             exit("ERROR: Cannot create directory\n\t" + str(os.path.join(path_to_create, directory_to_create)))
 
@@ -707,1264 +1373,3129 @@ class SubClass(Data):
         pass
 
 
-class ScriptArguments:
+class FileLock:
     """
-    The class is grabbing input parameters of the script
+    The class is the lock of the file shared by the parallel runs of the script. The lock is released also if the run is killed
     """
 
-    global available_script_options
-
-    def __init__(self):
+    def __init__(self, lock_file):
         """
-        Input Class's __init__ function
+        Initial function of the class
+        :param lock_file:
         """
 
-        self.user_arguments = self.get_all_arguments()
-
-        for input_argument_value in self.user_arguments:
-            self.check_if_help_option(input_argument_value)
+        self.lock_file = lock_file
+        self.lock_file_object = None
 
-    @staticmethod
-    def get_all_arguments():
+    def acquire(self, shared_lock=False, blocking=True):
         """
-        The function is checking and getting the script inputs information
-        :return:
+        The function is acquiring the lock. The held lock is converted to the required one
+        :param shared_lock: Shared lock for the readers, exclusive lock by default
+        :param blocking: Waiting until the lock is released by other runs
+        :return: True if the lock is acquired, False if not
         """
 
-        user_arguments = sys.argv
+        try:
+            if self.lock_file_object is None:
+                self.lock_file_object = open(self.lock_file, mode="a")
+            lock_operation = fcntl.LOCK_SH if shared_lock else fcntl.LOCK_EX
+            fcntl.flock(self.lock_file_object.fileno(), lock_operation if blocking else lock_operation | fcntl.LOCK_NB)
+        except (IOError, OSError):
+            return False
 
-        if get_list_length(user_arguments) < 2:
-            print_description("ERROR!:\tNo any option selected")
-        else:
-            del user_arguments[0]
-            return user_arguments
+        return True
 
-    @staticmethod
-    def check_if_help_option(input_argument):
+    def release(self):
         """
-        The function is checking if the user use help option in arguments
-        :param input_argument:
+        The function is releasing the lock
         :return:
         """
 
-        available_help_options = ["-h", "--h", "-help", "--help"]
-
-        for help_option in available_help_options:
-            if input_argument == help_option:
-                print_description("Help Option Selected")
+        if self.lock_file_object is not None:
+            self.lock_file_object.close()
+            self.lock_file_object = None
 
-    def get_user_all_inputs(self):
-        """
-        The main function of the arguments grabbing class
-        :return: The class object
-        """
+    def __enter__(self):
+        self.acquire()
+        return self
 
-        return self.user_arguments
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        self.release()
 
 
-class MsipEse:
+class ProcessOutputPump:
     """
-    The main class of the script's "RUN" execution part
+    The class is streaming the external process stdout/stderr into log files while the process is running, so the process never blocks on full pipe
     """
 
-    global environment_directories_name_list
-    global available_excel_options
-    global available_project_tools_name
-
-    # --------------------------------------------------- #
-    # ------------ Initialase Default Values ------------ #
-    # --------------------------------------------------- #
-
-    def __init__(self):
+    def __init__(self, process_object, log_file_prefix):
         """
-        Project Main Run Class __init__ function
+        Initial function of the class, starting one thread for each output stream
+        :param process_object:
+        :param log_file_prefix:
         """
 
-        # Environment Properties
+        self.output_tail = collections.deque(maxlen=external_process_output_tail_chunks)
+        self.output_tail_lock = threading.Lock()
+        self.pump_threads = []
 
-        # The objects log Name
-        self.object_log_name = get_class_name(self)
+        for stream_object, log_file in [[process_object.stdout, log_file_prefix + ".stdout"], [process_object.stderr, log_file_prefix + ".stderr"]]:
+            pump_thread = threading.Thread(target=self.pump_stream, args=(stream_object, log_file))
+            pump_thread.daemon = True
+            pump_thread.start()
+            self.pump_threads.append(pump_thread)
 
-        self.object_stdout_file = None
-        self.object_stderr_file = None
+    def pump_stream(self, stream_object, log_file):
+        """
+        The function is writing stream content into the log file, until the stream is closed
+        :param stream_object:
+        :param log_file:
+        :return:
+        """
 
-        # The script File Name and Basename
-        self.script_file_name = get_file_name_from_path(__file__)
-        self.script_file_base_name = get_file_name_from_path(__file__).replace(".py", "")
+        try:
+            log_file_object = open(log_file, mode="wb")
+        except IOError:
+            # The stream should be drained even if there is no log file
+            log_file_object = None
 
-        # The script execution environment path
-        self.script_environment_path = None
-        self.set_script_environment_path("/slowfs/us01dwt3p170/msip_ESE")
+        for output_chunk in iter(lambda: stream_object.read1(external_process_output_chunk_size), b""):
+            if log_file_object is not None:
+                log_file_object.write(output_chunk)
+                log_file_object.flush()
+            with self.output_tail_lock:
+                self.output_tail.append(output_chunk)
 
-        # The projects root directory
-        self.projects_root_dir = None
-        self.set_projects_root_dir("/remote/cad-rep/projects")
+        stream_object.close()
+        if log_file_object is not None:
+            log_file_object.close()
 
-        # The script Log directory
-        self.script_log_dir = None
+    def join(self, timeout=None):
+        """
+        The function is waiting until all output is written into log files
+        :param timeout: Maximum time in seconds to wait for all streams, None for no limit
+        :return: True if all output is written, False if the timeout is reached
+        """
 
-        # The internal data directory
-        self.script_data_directory = None
+        end_time = time.time() + timeout if timeout is not None else None
+        for pump_thread in self.pump_threads:
+            pump_thread.join(max(0, end_time - time.time()) if end_time is not None else None)
 
-        # The reports path directory
-        self.script_reports_directory = None
+        return not any([pump_thread.is_alive() for pump_thread in self.pump_threads])
 
-        # The results path directory
-        self.script_results_directory = None
+    def get_output_tail(self):
+        """
+        The function is returning the last part of the process output
+        :return:
+        """
 
-        # The run path directory
-        self.script_run_directory = None
+        with self.output_tail_lock:
+            return b"".join(self.output_tail).decode("utf-8", "replace")
 
-        # The scripts path directory
-        self.scripts_files_directory = None
 
-        # The test cases files path directory
-        self.scripts_test_cases_directory = None
+class ExternalJob:
+    """
+    The Popen like handle of the external command submitted through the job backend
+    """
 
-        # The user arguments
-        self.user_script_inputs = []
+    def __init__(self, job_backend_object, command, log_file_prefix):
+        """
+        Initial function of the class
+        :param job_backend_object:
+        :param command:
+        :param log_file_prefix:
+        """
 
-        # Setting all environment properties to default
-        self.set_script_env_property()
+        self.job_backend = job_backend_object
+        self.command = command
+        self.log_file_prefix = log_file_prefix
+        self.job_id = None
+        self.returncode = None
 
-        # Excel Properties
+    def poll(self):
+        """
+        The function is returning the command return code, or None if the command is not finished yet
+        :return:
+        """
 
-        self.excel_setup = {}
-        # Initialisation of excel_setup hash
-        self.set_excel_setup_none_value()
+        if self.returncode is None:
+            self.returncode = self.job_backend.poll(self)
 
-        # Project Properties
+        return self.returncode
 
-        # Test case excel file
-        self.excel_file = None
+    def wait(self):
+        """
+        The function is waiting until the command is finished and its logs are collected
+        :return: The command return code
+        """
 
-        # Target Project Type
-        self.target_project_type = None
+        self.returncode = self.job_backend.wait(self)
 
-        # Target Project Name
-        self.target_project_name = None
+        return self.returncode
 
-        # Target Project Release
-        self.target_project_release = None
+    def kill(self):
+        """
+        The function is cancelling the command
+        :return:
+        """
 
-        # Target Project Metal Stack List
-        self.target_project_metal_stack_list = []
+        self.job_backend.cancel(self)
 
-        # Target Project Layer Map File Layers
-        self.target_project_layers = {}
+    def get_output_tail(self):
+        """
+        The function is returning the last part of the command output
+        :return:
+        """
 
-        # Reference Project Type
-        self.reference_project_type = None
+        return self.job_backend.collect_logs(self)
 
-        # Reference Project Name
-        self.reference_project_name = None
 
-        # Reference Project Release
-        self.reference_project_release = None
+class JobBackend(object):
+    """
+    The metaclass of the external commands job backends
+    """
 
-        # Target Reference Metal Stack List
-        self.reference_project_metal_stack_list = []
+    __metaclass__ = ABCMeta
 
-        # Reference Project Layer Map File Layers
-        self.reference_project_layers = {}
+    @abstractmethod
+    def submit(self, command, log_file_prefix):
+        """
+        The function is submitting the command
+        :param command:
+        :param log_file_prefix:
+        :return: The ExternalJob handle of the command
+        """
 
-        # Executed Test Case Package
-        self.executed_test_case_package = None
+        pass
 
-        # The test cases hash. Key = test case name, Value = test case path
-        self.project_test_cases = {}
+    @abstractmethod
+    def poll(self, job):
+        """
+        The function is returning the job return code, or None if the job is not finished yet
+        :param job:
+        :return:
+        """
 
-        # Target PEX Tool name
-        self.target_project_pex_tool_name = None
-        self.set_target_project_pex_tool_name(None)
+        pass
 
-        # Reference PEX Tool name
-        self.reference_project_pex_tool_name = None
-        self.set_reference_project_pex_tool_name(None)
+    @abstractmethod
+    def wait(self, job):
+        """
+        The function is waiting until the job is finished and its logs are written into <log_file_prefix>.stdout/.stderr files
+        :param job:
+        :return: The job return code
+        """
 
-        # Target PEX Tool name
-        self.target_project_pex_tool_version = None
-        self.set_target_project_pex_tool_version(None)
+        pass
 
-        # Reference PEX Tool name
-        self.reference_project_pex_tool_version = None
-        self.set_reference_project_pex_tool_version(None)
+    @abstractmethod
+    def cancel(self, job):
+        """
+        The function is cancelling the queued or running job
+        :param job:
+        :return:
+        """
 
-        # Target PEX Tool name
-        self.target_project_pex_tool_deck = None
-        self.set_target_project_pex_tool_deck(None)
+        pass
 
-        # Reference PEX Tool name
-        self.reference_project_pex_tool_deck = None
-        self.set_reference_project_pex_tool_deck(None)
+    @abstractmethod
+    def collect_logs(self, job):
+        """
+        The function is returning the last part of the job output
+        :param job:
+        :return:
+        """
 
-        # Target PEX Tool name
-        self.target_project_pex_tool_option_file = None
-        self.set_target_project_pex_tool_option_file(None)
+        pass
 
-        # Reference PEX Tool name
-        self.reference_project_pex_tool_option_file = None
-        self.set_reference_project_pex_tool_option_file(None)
+    def clean_jobs(self):
+        """
+        The function is removing the data of the finished jobs
+        :return:
+        """
 
-        self.target_project_pex_tool_source_file = None
-        self.set_target_project_pex_tool_source_file(None)
+        pass
 
-        # Reference PEX Tool name
-        self.reference_project_pex_tool_source_file = None
-        self.set_reference_project_pex_tool_source_file(None)
 
-        # Target EXTRACT Tool
-        self.target_project_extract_tool_version = None
-        self.set_target_project_extract_tool_version(None)
+class LocalJobBackend(JobBackend):
+    """
+    The job backend executing the commands as local processes. The process stdout/stderr are streamed into log files while the process is running
+    """
 
-        # Reference EXTRACT Tool
-        self.reference_project_extract_tool_version = None
-        self.set_reference_project_extract_tool_version(None)
+    def submit(self, command, log_file_prefix):
+        """
+        The function is starting the command as a local process and streaming its output into the log files
+        :param command:
+        :param log_file_prefix:
+        :return: The ExternalJob handle of the command
+        """
 
-        # Target EXTRACT Tool
-        self.target_project_extract_tool_deck = None
-        self.set_target_project_extract_tool_deck(None)
+        job = ExternalJob(self, command, log_file_prefix)
+        job.process_object = Popen(command, shell=True, stdout=PIPE, stderr=PIPE)
+        job.job_id = str(job.process_object.pid)
+        job.output_pump = ProcessOutputPump(job.process_object, log_file_prefix)
 
-        # Reference EXTRACT Tool
-        self.reference_project_extract_tool_deck = None
-        self.set_reference_project_extract_tool_deck(None)
+        return job
 
-        # Target EXTRACT Tool
-        self.target_project_extract_tool_starcmd = None
-        self.set_target_project_extract_tool_starcmd(None)
+    def poll(self, job):
+        """
+        The function is returning the process return code, or None if the process is not finished yet
+        :param job:
+        :return:
+        """
 
-        # Reference EXTRACT Tool
-        self.reference_project_extract_tool_starcmd = None
-        self.set_reference_project_extract_tool_starcmd(None)
+        return job.process_object.poll()
 
-        # Force adding test case enable
-        self.force_add_test_case = False
+    def wait(self, job):
+        """
+        The function is waiting until the process is finished and its output is written into the log files
+        :param job:
+        :return: The process return code
+        """
 
-        # Script flow values
-        self.update_environment = False
-        self.update_test_case = False
-        self.execute_pex = False
-        self.execute_simulation = False
-        self.execute_report = False
-        self.execute_clean_project = False
+        return_code = job.process_object.wait()
+        # The child processes of the finished process can keep the output pipes open, so the output is not waited forever
+        if not job.output_pump.join(external_process_output_join_timeout):
+            print("WARNING!:\tThe output of the process is truncated, as it is not closed in " + str(external_process_output_join_timeout) +
+                  " seconds after the process is finished:\t" + job.log_file_prefix)
 
-    # --------------------------------------------------- #
-    # ----------------- Class Functions ----------------- #
-    # --------------------------------------------------- #
+        return return_code
 
-    def check_for_reference_project_execution(self):
+    def cancel(self, job):
         """
-        The function is returning True if there is reference project setup and False if not
+        The function is killing the process
+        :param job:
         :return:
         """
 
-        if self.get_reference_project_name is not None:
-            return True
-        else:
-            return False
+        job.process_object.kill()
 
-    def check_script_setup_correctness(self):
+    def collect_logs(self, job):
         """
-        The script is checking if the script setup is correct
+        The function is returning the last part of the process output
+        :param job:
         :return:
         """
 
-        target_project_path = os.path.join(str(self.get_projects_root_dir),
-                                           str(self.get_target_project_type),
-                                           str(self.get_target_project_name),
-                                           str(self.get_target_project_release))
+        return job.output_pump.get_output_tail()
 
-        if not check_for_dir_existence(target_project_path, project_cad_directory_name):
-            print_to_stderr(self, "Cannot find target project. Please check Script inputs. No such directory:\t'" + str(
-                os.path.join(target_project_path, project_cad_directory_name)) + "'")
 
-    def enable_update_environment(self):
+class SpoolJobBackend(JobBackend):
+    """
+    The job backend submitting the commands into the spool directory. Each job is a directory with command, state, exit_status, stdout and stderr files.
+    The spool dispatcher thread is executing the queued jobs with the limited number of job slots, like a batch queue of the compute farm
+    """
+
+    def __init__(self, spool_directory, max_jobs):
         """
-        The function is enabling Script flow #
-        :return:
+        Initial function of the class
+        :param spool_directory:
+        :param max_jobs: Number of job slots
         """
 
-        self.update_environment = True
+        self.spool_directory = spool_directory
+        os.makedirs(self.spool_directory, exist_ok=True)
+        self.max_jobs = max(1, int(max_jobs))
 
-    def disable_update_environment(self):
+        self.queued_jobs = collections.deque()
+        # Key = job id, Value = the job process, None until the process is started
+        self.running_jobs = {}
+        self.cancelled_jobs = set()
+        # The jobs of this backend. The spool directory can be shared with other runs, so only these jobs are cleaned
+        self.submitted_jobs = set()
+        self.job_counter = 0
+        self.spool_condition = threading.Condition()
+        self.dispatcher_thread = None
+
+    def get_job_directory(self, job_id):
         """
-        The function is disabling Script flow #
+        The function is returning the spool directory of the job
+        :param job_id:
         :return:
         """
 
-        self.update_environment = False
+        return os.path.join(self.spool_directory, job_id)
 
-    def check_if_update_environment(self):
+    def write_job_file(self, job_id, file_name, file_content):
         """
-        The function is returning script flow value
+        The function is writing the spool file of the job. The file is replaced atomically, so the readers never see partially written file.
+        Nothing is written if the job directory is removed
+        :param job_id:
+        :param file_name:
+        :param file_content:
         :return:
         """
 
-        return self.update_environment
+        job_file = os.path.join(self.get_job_directory(job_id), file_name)
+        try:
+            with open(job_file + ".tmp", mode="w") as job_file_object:
+                job_file_object.write(file_content + "\n")
+            os.replace(job_file + ".tmp", job_file)
+        except (IOError, OSError):
+            pass
 
-    def enable_execute_pex(self):
+    def read_job_file(self, job_id, file_name):
         """
-        The function is enabling Script flow #
+        The function is returning the content of the spool file of the job, or None if the file does not exist
+        :param job_id:
+        :param file_name:
         :return:
         """
 
-        self.execute_pex = True
+        try:
+            with open(os.path.join(self.get_job_directory(job_id), file_name), mode="r") as job_file_object:
+                return job_file_object.read().strip()
+        except IOError:
+            return None
 
-    def disable_execute_pex(self):
+    def submit(self, command, log_file_prefix):
         """
-        The function is disabling Script flow #
-        :return:
+        The function is creating the spool directory of the job and queueing the job. The dispatcher thread is started with the first job
+        :param command:
+        :param log_file_prefix:
+        :return: The ExternalJob handle of the command
         """
 
-        self.execute_pex = False
+        job = ExternalJob(self, command, log_file_prefix)
 
-    def check_if_execute_pex(self):
-        """
-        The function is returning script flow value
-        :return:
-        """
+        with self.spool_condition:
+            self.job_counter += 1
+            job.job_id = time.strftime("%Y%m%d%H%M%S") + "_" + str(os.getpid()) + "_" + str(self.job_counter)
 
-        return self.execute_pex
+        os.makedirs(self.get_job_directory(job.job_id))
+        self.write_job_file(job.job_id, "command", str(command))
+        self.write_job_file(job.job_id, "state", "QUEUED")
 
-    def enable_update_test_case(self):
-        """
-        The function is enabling Script flow #
-        :return:
-        """
+        with self.spool_condition:
+            self.submitted_jobs.add(job.job_id)
+            self.queued_jobs.append(job.job_id)
+            if self.dispatcher_thread is None:
+                self.dispatcher_thread = threading.Thread(target=self.dispatch_jobs)
+                self.dispatcher_thread.daemon = True
+                self.dispatcher_thread.start()
+            self.spool_condition.notify_all()
 
-        self.update_test_case = True
+        return job
 
-    def disable_update_test_case(self):
+    def dispatch_jobs(self):
         """
-        The function is disabling Script flow #
+        The spool dispatcher. Starting the queued jobs in the submission order, when there is a free job slot
         :return:
         """
 
-        self.update_test_case = False
+        with self.spool_condition:
+            while True:
+                while get_list_length(self.queued_jobs) < 1 or get_list_length(self.running_jobs.keys()) >= self.max_jobs:
+                    self.spool_condition.wait()
 
-    def check_if_update_test_case(self):
+                job_id = self.queued_jobs.popleft()
+                self.running_jobs[job_id] = None
+                job_thread = threading.Thread(target=self.run_job, args=(job_id,))
+                job_thread.daemon = True
+                job_thread.start()
+
+    def run_job(self, job_id):
         """
-        The function is returning script flow value
+        The function is executing the spool job and storing its exit status
+        :param job_id:
         :return:
         """
 
-        return self.update_test_case
+        job_directory = self.get_job_directory(job_id)
+        exit_status = -9
 
-    def enable_execute_simulation(self):
-        """
-        The function is enabling Script flow #
+        try:
+            with open(os.path.join(job_directory, "stdout"), mode="wb") as stdout_file_object, \
+                    open(os.path.join(job_directory, "stderr"), mode="wb") as stderr_file_object:
+                with self.spool_condition:
+                    if job_id not in self.cancelled_jobs:
+                        try:
+                            self.running_jobs[job_id] = Popen(self.read_job_file(job_id, "command"), shell=True, stdout=stdout_file_object, stderr=stderr_file_object)
+                        except OSError:
+                            exit_status = 127
+
+                if self.running_jobs[job_id] is not None:
+                    self.write_job_file(job_id, "state", "RUNNING")
+                    exit_status = self.running_jobs[job_id].wait()
+        except (IOError, OSError):
+            # The job directory is removed before the job is started
+            pass
+        finally:
+            self.write_job_file(job_id, "exit_status", str(exit_status))
+            self.write_job_file(job_id, "state", "CANCELLED" if job_id in self.cancelled_jobs else "DONE")
+
+            with self.spool_condition:
+                del self.running_jobs[job_id]
+                self.spool_condition.notify_all()
+
+    def poll(self, job):
+        """
+        The function is returning the exit status of the spool job, or None if the job is not finished yet
+        :param job:
         :return:
         """
 
-        self.execute_simulation = True
+        exit_status = self.read_job_file(job.job_id, "exit_status")
+        if exit_status is None:
+            return None
 
-    def disable_execute_simulation(self):
+        try:
+            return int(exit_status)
+        except ValueError:
+            return -9
+
+    def wait(self, job):
         """
-        The function is disabling Script flow #
-        :return:
+        The function is waiting until the spool job is finished and copying its stdout/stderr files into the log files.
+        The job is cancelled if it is not finished in job_spool_wait_timeout seconds
+        :param job:
+        :return: The job exit status, -9 if the job directory is removed
         """
 
-        self.execute_simulation = False
+        end_time = time.time() + job_spool_wait_timeout
+        while self.poll(job) is None:
+            # The job directory can be removed by other run, then the exit status is never written
+            if not os.path.isdir(self.get_job_directory(job.job_id)):
+                print("WARNING!:\tThe spool job directory is removed:\t" + self.get_job_directory(job.job_id))
+                return -9
+            if job_spool_wait_timeout > 0 and time.time() > end_time:
+                print("WARNING!:\tThe spool job is not finished in " + str(job_spool_wait_timeout) + " seconds, cancelling it:\t" + self.get_job_directory(job.job_id))
+                self.cancel(job)
+                end_time = time.time() + job_spool_wait_timeout
+            time.sleep(job_spool_poll_interval)
 
-    def check_if_execute_simulation(self):
-        """
-        The function is returning script flow value
-        :return:
-        """
+        self.collect_logs(job)
 
-        return self.execute_simulation
+        return self.poll(job)
 
-    def enable_execute_report(self):
+    def cancel(self, job):
         """
-        The function is enabling Script flow #
+        The function is removing the queued job from the queue, or killing the process of the running job
+        :param job:
         :return:
         """
 
-        self.execute_report = True
+        with self.spool_condition:
+            self.cancelled_jobs.add(job.job_id)
+            if job.job_id in self.queued_jobs:
+                self.queued_jobs.remove(job.job_id)
+                self.write_job_file(job.job_id, "exit_status", "-9")
+                self.write_job_file(job.job_id, "state", "CANCELLED")
+                return
+            process_object = self.running_jobs.get(job.job_id)
 
-    def disable_execute_report(self):
+        if process_object is not None and process_object.poll() is None:
+            process_object.kill()
+
+    def collect_logs(self, job):
         """
-        The function is disabling Script flow #
-        :return:
+        The function is copying the stdout/stderr files of the spool job into the log files
+        :param job:
+        :return: The last part of the job output
         """
 
-        self.execute_report = False
+        output_tail = b""
+        for stream_name in ["stdout", "stderr"]:
+            try:
+                with open(os.path.join(self.get_job_directory(job.job_id), stream_name), mode="rb") as stream_file_object:
+                    stream_content = stream_file_object.read()
+            except IOError:
+                continue
 
-    def check_if_execute_report(self):
-        """
-        The function is returning script flow value
-        :return:
-        """
+            try:
+                with open(job.log_file_prefix + "." + stream_name, mode="wb") as log_file_object:
+                    log_file_object.write(stream_content)
+            except IOError:
+                pass
+            output_tail += stream_content[-external_process_output_chunk_size * external_process_output_tail_chunks:]
 
-        return self.execute_report
+        return output_tail.decode("utf-8", "replace")
 
-    def enable_execute_clean_project(self):
+    def clean_jobs(self):
         """
-        The function is enabling Script flow #
+        The function is removing the spool directories of the finished and cancelled jobs of this backend
         :return:
         """
 
-        self.execute_clean_project = True
+        import shutil
 
-    def disable_execute_clean_project(self):
-        """
-        The function is disabling Script flow #
-        :return:
-        """
+        with self.spool_condition:
+            submitted_jobs = sorted(self.submitted_jobs)
 
-        self.execute_clean_project = False
+        for job_id in submitted_jobs:
+            if self.read_job_file(job_id, "state") in ["DONE", "CANCELLED"]:
+                shutil.rmtree(self.get_job_directory(job_id), ignore_errors=True)
+                with self.spool_condition:
+                    self.submitted_jobs.discard(job_id)
 
-    def check_if_execute_clean_project(self):
-        """
-        The function is returning script flow value
-        :return:
-        """
 
-        return self.execute_clean_project
+class FlowScheduler:
+    """
+    The class is executing the flow graph. Each node is one unit of work, which is started as soon as all its dependency nodes are completed,
+    so independent parts of the flow are not waiting for each other
+    """
 
-    def set_executed_flow(self, flow_option_value):
+    def __init__(self, max_jobs, pool_limits=None):
         """
-        The function is setting the executed flow
-        :param flow_option_value:
-        :return:
+        Initial function of the class
+        :param max_jobs: Maximum number of nodes executed in parallel, including the nodes of all pools
+        :param pool_limits: Maximum number of parallel nodes of the named node pools, within max_jobs. Key = pool name, Value = maximum number of nodes
         """
 
-        if str(flow_option_value).upper() == "NONE":
-            return
-        elif flow_option_value == available_flows[0]:
-            self.enable_update_environment()  # 1. Enabled
-            self.disable_update_test_case()  # Disabled
-            self.disable_execute_pex()  # Disabled
-            self.disable_execute_simulation()  # Disabled
-            self.disable_execute_report()  # Disabled
-            self.disable_execute_clean_project()  # Disabled
-        elif flow_option_value == available_flows[1]:
-            self.disable_update_environment()  # Disabled
-            self.enable_update_test_case()  # 2. Enabled
-            self.disable_execute_pex()  # Disabled
-            self.disable_execute_simulation()  # Disabled
-            self.disable_execute_report()  # Disabled
-            self.disable_execute_clean_project()  # Disabled
-        elif flow_option_value == available_flows[2]:
-            # Executing Flow Step 3
-            self.disable_update_environment()  # Disabled
-            self.disable_update_test_case()  # Disabled
-            self.enable_execute_pex()  # 3. Enabled
-            self.disable_execute_simulation()  # Disabled
-            self.disable_execute_report()  # Disabled
-            self.disable_execute_clean_project()  # Disabled
-        elif flow_option_value == available_flows[3]:
-            # Executing Flow Step 4
-            self.disable_update_environment()  # Disabled
-            self.disable_update_test_case()  # Disabled
-            self.disable_execute_pex()  # Disabled
-            self.enable_execute_simulation()  # 4. Enabled
-            self.disable_execute_report()  # Disabled
-            self.disable_execute_clean_project()  # Disabled
-        elif flow_option_value == available_flows[4]:
-            # Executing Flow Step 5
-            self.disable_update_environment()  # Disabled
-            self.disable_update_test_case()  # Disabled
-            self.disable_execute_pex()  # Disabled
-            self.disable_execute_simulation()  # Disabled
-            self.enable_execute_report()  # 5. Enabled
-            self.disable_execute_clean_project()  # Disabled
-        elif flow_option_value == available_flows[5]:
-            # Executing Flow Step 5
-            self.disable_update_environment()  # Disabled
-            self.disable_update_test_case()  # Disabled
-            self.disable_execute_pex()  # Disabled
-            self.disable_execute_simulation()  # Disabled
-            self.disable_execute_report()  # Disabled
-            self.enable_execute_clean_project()  # 6. Enabled
-        else:
-            # Executing All Steps of The Flow
-            self.enable_update_environment()
-            self.enable_update_test_case()
-            self.enable_execute_pex()
-            self.enable_execute_simulation()
-            self.enable_execute_report()
-            self.enable_execute_clean_project()
+        self.max_jobs = max(1, int(max_jobs))
+        self.pool_limits = {"DEFAULT": self.max_jobs}
+        if pool_limits is not None:
+            for pool_name, pool_limit in pool_limits.items():
+                self.pool_limits[pool_name] = min(max(1, int(pool_limit)), self.max_jobs)
+        self.running_nodes = dict([[pool_name, 0] for pool_name in self.pool_limits.keys()])
 
-    def enable_force_add_test_case(self):
+        # Key = node name, Value = {function, arguments, dependencies, pool, limited, status, result, exception}. Status is PENDING/RUNNING/DONE/FAILED/SKIPPED
+        self.nodes = collections.OrderedDict()
+        self.nodes_condition = threading.Condition()
+
+    def add_node(self, node_name, node_function, node_arguments=(), node_dependencies=(), node_pool="DEFAULT", limited_node=True):
         """
-        The function is enabling force adding test case enable option
-        :return:
+        The function is adding the node into the graph. The nodes can be added also by the running nodes, and the dependency nodes can be added later than the node
+        :param node_name:
+        :param node_function:
+        :param node_arguments:
+        :param node_dependencies: Names of the nodes, which should be completed before the node
+        :param node_pool:
+        :param limited_node: The node is using the shared parallel jobs slots. False for the nodes which are starting limited jobs in other threads
+        :return: True if the node is added, False if the node already exists
         """
 
-        self.force_add_test_case = True
+        with self.nodes_condition:
+            if node_name in self.nodes:
+                return False
 
-    def disable_force_add_test_case(self):
+            self.nodes[node_name] = {"function": node_function,
+                                     "arguments": list(node_arguments),
+                                     "dependencies": list(node_dependencies),
+                                     "pool": node_pool if node_pool in self.pool_limits else "DEFAULT",
+                                     "limited": limited_node,
+                                     "status": "PENDING",
+                                     "result": None,
+                                     "exception": None}
+            self.nodes_condition.notify_all()
+
+        return True
+
+    def check_for_node_existence(self, node_name):
         """
-        The function is disabling force adding test case enable option
+        The function is checking if the node is in the graph
+        :param node_name:
         :return:
         """
 
-        self.force_add_test_case = False
+        with self.nodes_condition:
+            return node_name in self.nodes
 
-    @property
-    def get_force_add_test_case_option(self):
+    def get_node_state(self, node):
         """
-        The function is returning force adding test case option
-        :return:
+        The function is checking the dependencies of the pending node. Should be called with the nodes lock
+        :param node:
+        :return: READY if all dependencies are completed, SKIPPED if any dependency is failed or skipped, otherwise WAITING
         """
 
-        return self.force_add_test_case
+        for dependency_name in node["dependencies"]:
+            if dependency_name not in self.nodes:
+                return "WAITING"
+            dependency_status = self.nodes[dependency_name]["status"]
+            if dependency_status in ["FAILED", "SKIPPED"]:
+                return "SKIPPED"
+            if dependency_status != "DONE":
+                return "WAITING"
 
-    def set_target_project_pex_tool_name(self, value):
+        return "READY"
+
+    def run_node(self, node_name):
         """
-        The function is setting target project PEX tool name
-        :param value:
+        The function is executing the node function and storing its result
+        :param node_name:
         :return:
         """
 
-        for tool_name in available_project_tools_name:
-            if str(value).upper() == tool_name:
-                self.target_project_pex_tool_name = tool_name
-                return
+        node = self.nodes[node_name]
+        node_result = None
+        node_exception = None
+        try:
+            if node["limited"]:
+                node_result = run_limited_job(node["function"], *node["arguments"])
             else:
-                self.target_project_pex_tool_name = available_project_tools_name[0]
+                node_result = node["function"](*node["arguments"])
+        except (Exception, SystemExit) as job_exception:
+            # exit() calls inside the node are also collected, instead of finishing the script
+            node_exception = job_exception
+
+        with self.nodes_condition:
+            node["result"] = node_result
+            node["exception"] = node_exception
+            node["status"] = "DONE" if node_exception is None else "FAILED"
+            self.running_nodes[node["pool"]] -= 1
+            self.nodes_condition.notify_all()
+
+    def run(self):
+        """
+        The main function of the class. Executing all nodes of the graph, until there is no node to start
+        :return: List of [node name, node status, node result, node exception, node arguments] in the order the nodes are added
+        """
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.max_jobs) as executor:
+            with self.nodes_condition:
+                while True:
+                    node_status_changed = True
+                    while node_status_changed:
+                        node_status_changed = False
+                        for node_name, node in list(self.nodes.items()):
+                            if node["status"] != "PENDING":
+                                continue
+                            node_state = self.get_node_state(node)
+                            if node_state == "SKIPPED":
+                                node["status"] = "SKIPPED"
+                                node_status_changed = True
+                            elif node_state == "READY" and sum(self.running_nodes.values()) < self.max_jobs and \
+                                    self.running_nodes[node["pool"]] < self.pool_limits[node["pool"]]:
+                                node["status"] = "RUNNING"
+                                self.running_nodes[node["pool"]] += 1
+                                executor.submit(self.run_node, node_name)
+
+                    if sum(self.running_nodes.values()) > 0:
+                        self.nodes_condition.wait()
+                        continue
+
+                    # Nothing is running, so the nodes waiting for never added dependencies cannot be started anymore
+                    pending_nodes = [node for node in self.nodes.values() if node["status"] == "PENDING"]
+                    if get_list_length(pending_nodes) < 1:
+                        break
+                    for node in pending_nodes:
+                        node["status"] = "SKIPPED"
+
+        return [[node_name, node["status"], node["result"], node["exception"], node["arguments"]] for node_name, node in self.nodes.items()]
 
-        return
 
-    @property
-    def get_target_project_pex_tool_name(self):
-        """
-        The function is returning target project pex tool name
-        :return:
-        """
+class ScriptArguments:
+    """
+    The class is grabbing input parameters of the script
+    """
 
-        return self.target_project_pex_tool_name
+    global available_script_options
 
-    def set_reference_project_pex_tool_name(self, value):
+    def __init__(self):
         """
-        The function is setting target project PEX tool name
-        :param value:
-        :return:
+        Input Class's __init__ function
         """
 
-        for tool_name in available_project_tools_name:
-            if str(value).upper() == tool_name:
-                self.reference_project_pex_tool_name = tool_name
-            else:
-                self.reference_project_pex_tool_name = available_project_tools_name[0]
+        self.user_arguments = self.get_all_arguments()
 
-    @property
-    def get_reference_project_pex_tool_name(self):
+        for input_argument_value in self.user_arguments:
+            self.check_if_help_option(input_argument_value)
+
+    @staticmethod
+    def get_all_arguments():
         """
-        The function is returning target project pex tool name
+        The function is checking and getting the script inputs information
         :return:
         """
 
-        return self.reference_project_pex_tool_name
+        user_arguments = sys.argv
 
-    def set_target_project_pex_tool_version(self, value):
+        if get_list_length(user_arguments) < 2:
+            print_description("ERROR!:\tNo any option selected")
+        else:
+            del user_arguments[0]
+            return user_arguments
+
+    @staticmethod
+    def check_if_help_option(input_argument):
         """
-        The function is setting target project PEX tool version
-        :param value:
+        The function is checking if the user use help option in arguments
+        :param input_argument:
         :return:
         """
 
-        self.target_project_pex_tool_version = value
+        available_help_options = ["-h", "--h", "-help", "--help"]
 
-    @property
-    def get_target_project_pex_tool_version(self):
+        for help_option in available_help_options:
+            if input_argument == help_option:
+                print_description("Help Option Selected")
+
+    def get_user_all_inputs(self):
         """
-        The function is returning target project pex tool name
-        :return:
+        The main function of the arguments grabbing class
+        :return: The class object
         """
 
-        return self.target_project_pex_tool_version
+        return self.user_arguments
 
-    def set_reference_project_pex_tool_version(self, value):
-        """
-        The function is setting target project PEX tool name
-        :param value:
-        :return:
-        """
 
-        self.reference_project_pex_tool_version = value
+class MsipEse:
+    """
+    The main class of the script's "RUN" execution part
+    """
 
-    @property
-    def get_reference_project_pex_tool_version(self):
-        """
-        The function is returning target project pex tool name
-        :return:
-        """
+    global environment_directories_name_list
+    global available_excel_options
+    global available_project_tools_name
 
-        return self.reference_project_pex_tool_version
+    # --------------------------------------------------- #
+    # ------------ Initialase Default Values ------------ #
+    # --------------------------------------------------- #
 
-    def set_target_project_extract_tool_version(self, value):
+    def __init__(self):
         """
-        The function is setting target project PEX tool version
-        :param value:
-        :return:
+        Project Main Run Class __init__ function. The properties without default value are only initialised, without calling their set_* functions
         """
 
-        self.target_project_extract_tool_version = value
+        # Environment Properties
+
+        # The objects log Name
+        self.object_log_name = get_class_name(self)
+
+        self.object_stdout_file = None
+        self.object_stderr_file = None
+
+        # The script File Name and Basename
+        self.script_file_name = get_file_name_from_path(__file__)
+        self.script_file_base_name = get_file_name_from_path(__file__).replace(".py", "")
+
+        # The script execution environment path
+        self.script_environment_path = None
+        self.set_script_environment_path("/slowfs/us01dwt3p170/msip_ESE")
+
+        # The projects root directory
+        self.projects_root_dir = None
+        self.set_projects_root_dir("/remote/cad-rep/projects")
+
+        # The script Log directory
+        self.script_log_dir = None
+
+        # The internal data directory
+        self.script_data_directory = None
+
+        # The reports path directory
+        self.script_reports_directory = None
+
+        # The results path directory
+        self.script_results_directory = None
+
+        # The run path directory
+        self.script_run_directory = None
+
+        # The scripts path directory
+        self.scripts_files_directory = None
+
+        # The test cases files path directory
+        self.scripts_test_cases_directory = None
+
+        # The user arguments
+        self.user_script_inputs = []
+
+        # Setting all environment properties to default
+        self.set_script_env_property()
+
+        # Excel Properties
+
+        self.excel_setup = {}
+        # Initialisation of excel_setup hash
+        self.set_excel_setup_none_value()
+        # All test case specs of the excel files: [excel file, sheet name, excel setup hash]
+        self.excel_specs = []
+
+        # Project Properties
+
+        # Test case excel file
+        self.excel_file = None
+
+        # Target Project Type
+        self.target_project_type = None
+
+        # Target Project Name
+        self.target_project_name = None
+
+        # Target Project Release
+        self.target_project_release = None
+
+        # Target Project Metal Stack List
+        self.target_project_metal_stack_list = []
+
+        # Target Project Layer Map File Layers
+        self.target_project_layers = {}
+
+        # Reference Project Type
+        self.reference_project_type = None
+
+        # Reference Project Name
+        self.reference_project_name = None
+
+        # Reference Project Release
+        self.reference_project_release = None
+
+        # Target Reference Metal Stack List
+        self.reference_project_metal_stack_list = []
+
+        # Reference Project Layer Map File Layers
+        self.reference_project_layers = {}
+
+        # Executed Test Case Package
+        self.executed_test_case_package = None
+
+        # The test cases hash. Key = test case name, Value = test case path
+        self.project_test_cases = {}
+
+        # Target PEX Tool name
+        self.target_project_pex_tool_name = None
+        self.set_target_project_pex_tool_name(None)
+
+        # Reference PEX Tool name
+        self.reference_project_pex_tool_name = None
+        self.set_reference_project_pex_tool_name(None)
+
+        # Target PEX Tool name
+        self.target_project_pex_tool_version = None
+
+        # Reference PEX Tool name
+        self.reference_project_pex_tool_version = None
+
+        # Target PEX Tool name
+        self.target_project_pex_tool_deck = None
+
+        # Reference PEX Tool name
+        self.reference_project_pex_tool_deck = None
+
+        # Target PEX Tool name
+        self.target_project_pex_tool_option_file = None
+
+        # Reference PEX Tool name
+        self.reference_project_pex_tool_option_file = None
+
+        self.target_project_pex_tool_source_file = None
+
+        # Reference PEX Tool name
+        self.reference_project_pex_tool_source_file = None
+
+        # Target EXTRACT Tool
+        self.target_project_extract_tool_version = None
+
+        # Reference EXTRACT Tool
+        self.reference_project_extract_tool_version = None
+
+        # Target EXTRACT Tool
+        self.target_project_extract_tool_deck = None
+
+        # Reference EXTRACT Tool
+        self.reference_project_extract_tool_deck = None
+
+        # Target EXTRACT Tool
+        self.target_project_extract_tool_starcmd = None
+
+        # Reference EXTRACT Tool
+        self.reference_project_extract_tool_starcmd = None
+
+        # Force adding test case enable
+        self.force_add_test_case = False
+
+        # Incremental test case update enable
+        self.incremental_update_test_case = False
+
+        # Startup time report enable
+        self.time_startup = False
+
+        # Resuming the previous run enable
+        self.resume = False
+
+        # Maximum number of external jobs executed in parallel
+        self.max_parallel_jobs = max_parallel_jobs
+
+        # Maximum number of PEX jobs executed in parallel
+        self.max_parallel_pex_jobs = max_parallel_pex_jobs
+
+        # The flow scheduler
+        self.flow_scheduler = flow_scheduler
+
+        # The projects catalog instance, created on first usage
+        self.project_catalog = None
+
+        # The GDS config cache instance, created on first usage
+        self.gds_config_cache = None
+
+        # The test case files object store instance, created on first usage
+        self.object_store = None
+
+        # The run journal instance, created on first usage
+        self.run_journal = None
+
+        # GDS content digest -> [the only GDS file of this content analysed in the current run, event set when its analysis is finished].
+        # Shared by all test case specs, so the same GDS content of different specs is analysed once as well
+        self.analysed_gds_digests = {}
+        self.analysed_gds_digests_lock = threading.Lock()
+
+        # The job backend of the external commands and its instance, created on first usage
+        self.job_backend_name = job_backend
+        self.job_backend = None
+
+        # Script flow values
+        self.update_environment = False
+        self.update_test_case = False
+        self.execute_pex = False
+        self.execute_simulation = False
+        self.execute_report = False
+        self.execute_clean_project = False
+
+    # --------------------------------------------------- #
+    # ----------------- Class Functions ----------------- #
+    # --------------------------------------------------- #
+
+    def check_for_reference_project_execution(self):
+        """
+        The function is returning True if there is reference project setup and False if not
+        :return:
+        """
+
+        if self.get_reference_project_name is not None:
+            return True
+        else:
+            return False
+
+    def check_script_setup_correctness(self):
+        """
+        The script is checking if the script setup is correct
+        :return:
+        """
+
+        target_project_path = os.path.join(str(self.get_projects_root_dir),
+                                           str(self.get_target_project_type),
+                                           str(self.get_target_project_name),
+                                           str(self.get_target_project_release))
+
+        if not check_for_dir_existence(target_project_path, project_cad_directory_name):
+            print_to_stderr(self, "Cannot find target project. Please check Script inputs. No such directory:\t'" + str(
+                os.path.join(target_project_path, project_cad_directory_name)) + "'")
+
+    def enable_update_environment(self):
+        """
+        The function is enabling Script flow #
+        :return:
+        """
+
+        self.update_environment = True
+
+    def disable_update_environment(self):
+        """
+        The function is disabling Script flow #
+        :return:
+        """
+
+        self.update_environment = False
+
+    def check_if_update_environment(self):
+        """
+        The function is returning script flow value
+        :return:
+        """
+
+        return self.update_environment
+
+    def enable_execute_pex(self):
+        """
+        The function is enabling Script flow #
+        :return:
+        """
+
+        self.execute_pex = True
+
+    def disable_execute_pex(self):
+        """
+        The function is disabling Script flow #
+        :return:
+        """
+
+        self.execute_pex = False
+
+    def check_if_execute_pex(self):
+        """
+        The function is returning script flow value
+        :return:
+        """
+
+        return self.execute_pex
+
+    def enable_update_test_case(self):
+        """
+        The function is enabling Script flow #
+        :return:
+        """
+
+        self.update_test_case = True
+
+    def disable_update_test_case(self):
+        """
+        The function is disabling Script flow #
+        :return:
+        """
+
+        self.update_test_case = False
+
+    def check_if_update_test_case(self):
+        """
+        The function is returning script flow value
+        :return:
+        """
+
+        return self.update_test_case
+
+    def enable_execute_simulation(self):
+        """
+        The function is enabling Script flow #
+        :return:
+        """
+
+        self.execute_simulation = True
+
+    def disable_execute_simulation(self):
+        """
+        The function is disabling Script flow #
+        :return:
+        """
+
+        self.execute_simulation = False
+
+    def check_if_execute_simulation(self):
+        """
+        The function is returning script flow value
+        :return:
+        """
+
+        return self.execute_simulation
+
+    def enable_execute_report(self):
+        """
+        The function is enabling Script flow #
+        :return:
+        """
+
+        self.execute_report = True
+
+    def disable_execute_report(self):
+        """
+        The function is disabling Script flow #
+        :return:
+        """
+
+        self.execute_report = False
+
+    def check_if_execute_report(self):
+        """
+        The function is returning script flow value
+        :return:
+        """
+
+        return self.execute_report
+
+    def enable_execute_clean_project(self):
+        """
+        The function is enabling Script flow #
+        :return:
+        """
+
+        self.execute_clean_project = True
+
+    def disable_execute_clean_project(self):
+        """
+        The function is disabling Script flow #
+        :return:
+        """
+
+        self.execute_clean_project = False
+
+    def check_if_execute_clean_project(self):
+        """
+        The function is returning script flow value
+        :return:
+        """
+
+        return self.execute_clean_project
+
+    def set_executed_flow(self, flow_option_value):
+        """
+        The function is setting the executed flow
+        :param flow_option_value:
+        :return:
+        """
+
+        if str(flow_option_value).upper() == "NONE":
+            return
+        elif flow_option_value == available_flows[0]:
+            self.enable_update_environment()  # 1. Enabled
+            self.disable_update_test_case()  # Disabled
+            self.disable_execute_pex()  # Disabled
+            self.disable_execute_simulation()  # Disabled
+            self.disable_execute_report()  # Disabled
+            self.disable_execute_clean_project()  # Disabled
+        elif flow_option_value == available_flows[1]:
+            self.disable_update_environment()  # Disabled
+            self.enable_update_test_case()  # 2. Enabled
+            self.disable_execute_pex()  # Disabled
+            self.disable_execute_simulation()  # Disabled
+            self.disable_execute_report()  # Disabled
+            self.disable_execute_clean_project()  # Disabled
+        elif flow_option_value == available_flows[2]:
+            # Executing Flow Step 3
+            self.disable_update_environment()  # Disabled
+            self.disable_update_test_case()  # Disabled
+            self.enable_execute_pex()  # 3. Enabled
+            self.disable_execute_simulation()  # Disabled
+            self.disable_execute_report()  # Disabled
+            self.disable_execute_clean_project()  # Disabled
+        elif flow_option_value == available_flows[3]:
+            # Executing Flow Step 4
+            self.disable_update_environment()  # Disabled
+            self.disable_update_test_case()  # Disabled
+            self.disable_execute_pex()  # Disabled
+            self.enable_execute_simulation()  # 4. Enabled
+            self.disable_execute_report()  # Disabled
+            self.disable_execute_clean_project()  # Disabled
+        elif flow_option_value == available_flows[4]:
+            # Executing Flow Step 5
+            self.disable_update_environment()  # Disabled
+            self.disable_update_test_case()  # Disabled
+            self.disable_execute_pex()  # Disabled
+            self.disable_execute_simulation()  # Disabled
+            self.enable_execute_report()  # 5. Enabled
+            self.disable_execute_clean_project()  # Disabled
+        elif flow_option_value == available_flows[5]:
+            # Executing Flow Step 5
+            self.disable_update_environment()  # Disabled
+            self.disable_update_test_case()  # Disabled
+            self.disable_execute_pex()  # Disabled
+            self.disable_execute_simulation()  # Disabled
+            self.disable_execute_report()  # Disabled
+            self.enable_execute_clean_project()  # 6. Enabled
+        else:
+            # Executing All Steps of The Flow
+            self.enable_update_environment()
+            self.enable_update_test_case()
+            self.enable_execute_pex()
+            self.enable_execute_simulation()
+            self.enable_execute_report()
+            self.enable_execute_clean_project()
+
+    def enable_force_add_test_case(self):
+        """
+        The function is enabling force adding test case enable option
+        :return:
+        """
+
+        self.force_add_test_case = True
+
+    def disable_force_add_test_case(self):
+        """
+        The function is disabling force adding test case enable option
+        :return:
+        """
+
+        self.force_add_test_case = False
+
+    @property
+    def get_force_add_test_case_option(self):
+        """
+        The function is returning force adding test case option
+        :return:
+        """
+
+        return self.force_add_test_case
+
+    def enable_incremental_update_test_case(self):
+        """
+        The function is enabling incremental test case update option
+        :return:
+        """
+
+        self.incremental_update_test_case = True
+
+    @property
+    def get_incremental_update_test_case_option(self):
+        """
+        The function is returning incremental test case update option
+        :return:
+        """
+
+        return self.incremental_update_test_case
+
+    def enable_time_startup(self):
+        """
+        The function is enabling startup time report option
+        :return:
+        """
+
+        self.time_startup = True
+
+    @property
+    def get_time_startup_option(self):
+        """
+        The function is returning startup time report option
+        :return:
+        """
+
+        return self.time_startup
+
+    def enable_resume(self):
+        """
+        The function is enabling resuming the previous run option
+        :return:
+        """
+
+        self.resume = True
+
+    @property
+    def get_resume_option(self):
+        """
+        The function is returning resuming the previous run option
+        :return:
+        """
+
+        return self.resume
+
+    def set_max_parallel_jobs(self, value):
+        """
+        The function is setting maximum number of external jobs executed in parallel
+        :param value:
+        :return:
+        """
+
+        try:
+            self.max_parallel_jobs = int(value)
+        except ValueError:
+            exit("ERROR!:\tWrong value for option '" + available_script_options[10] + "'\t'" + str(value) + "'\n\tPlease use positive number")
+
+        if self.max_parallel_jobs < 1:
+            exit("ERROR!:\tWrong value for option '" + available_script_options[10] + "'\t'" + str(value) + "'\n\tPlease use positive number")
+
+    @property
+    def get_max_parallel_jobs(self):
+        """
+        The function is returning maximum number of external jobs executed in parallel
+        :return:
+        """
+
+        return self.max_parallel_jobs
+
+    def set_max_parallel_pex_jobs(self, value):
+        """
+        The function is setting maximum number of PEX jobs executed in parallel
+        :param value:
+        :return:
+        """
+
+        try:
+            self.max_parallel_pex_jobs = int(value)
+        except ValueError:
+            exit("ERROR!:\tWrong value for option '" + available_script_options[13] + "'\t'" + str(value) + "'\n\tPlease use positive number")
+
+        if self.max_parallel_pex_jobs < 1:
+            exit("ERROR!:\tWrong value for option '" + available_script_options[13] + "'\t'" + str(value) + "'\n\tPlease use positive number")
+
+    @property
+    def get_max_parallel_pex_jobs(self):
+        """
+        The function is returning maximum number of PEX jobs executed in parallel, by default it is the maximum number of external jobs.
+        The PEX jobs are also external jobs, so the value is never more than the maximum number of external jobs
+        :return:
+        """
+
+        if self.max_parallel_pex_jobs < 1:
+            return self.get_max_parallel_jobs
+
+        return min(self.max_parallel_pex_jobs, self.get_max_parallel_jobs)
+
+    def set_job_backend_name(self, value):
+        """
+        The function is setting the job backend of the external commands
+        :param value:
+        :return:
+        """
+
+        if str(value).upper() not in available_job_backends:
+            exit("ERROR!:\tWrong value for option '" + available_script_options[15] + "'\t'" + str(value) + "'\n\tPlease use one of the values:\t" +
+                 str(available_job_backends))
+
+        self.job_backend_name = str(value).upper()
+
+    @property
+    def get_job_backend_name(self):
+        """
+        The function is returning the job backend name of the external commands
+        :return:
+        """
+
+        return self.job_backend_name
+
+    def set_flow_scheduler(self, value):
+        """
+        The function is setting the flow scheduler
+        :param value:
+        :return:
+        """
+
+        if str(value).upper() not in available_flow_schedulers:
+            exit("ERROR!:\tWrong value for option '" + available_script_options[14] + "'\t'" + str(value) + "'\n\tPlease use one of the values:\t" +
+                 str(available_flow_schedulers))
+
+        self.flow_scheduler = str(value).upper()
+
+    @property
+    def get_flow_scheduler(self):
+        """
+        The function is returning the flow scheduler
+        :return:
+        """
+
+        return self.flow_scheduler
+
+    def set_target_project_pex_tool_name(self, value):
+        """
+        The function is setting target project PEX tool name
+        :param value:
+        :return:
+        """
+
+        for tool_name in available_project_tools_name:
+            if str(value).upper() == tool_name:
+                self.target_project_pex_tool_name = tool_name
+                return
+            else:
+                self.target_project_pex_tool_name = available_project_tools_name[0]
+
+        return
+
+    @property
+    def get_target_project_pex_tool_name(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.target_project_pex_tool_name
+
+    def set_reference_project_pex_tool_name(self, value):
+        """
+        The function is setting target project PEX tool name
+        :param value:
+        :return:
+        """
+
+        for tool_name in available_project_tools_name:
+            if str(value).upper() == tool_name:
+                self.reference_project_pex_tool_name = tool_name
+            else:
+                self.reference_project_pex_tool_name = available_project_tools_name[0]
+
+    @property
+    def get_reference_project_pex_tool_name(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.reference_project_pex_tool_name
+
+    def set_target_project_pex_tool_version(self, value):
+        """
+        The function is setting target project PEX tool version
+        :param value:
+        :return:
+        """
+
+        self.target_project_pex_tool_version = value
+
+    @property
+    def get_target_project_pex_tool_version(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.target_project_pex_tool_version
+
+    def set_reference_project_pex_tool_version(self, value):
+        """
+        The function is setting target project PEX tool name
+        :param value:
+        :return:
+        """
+
+        self.reference_project_pex_tool_version = value
+
+    @property
+    def get_reference_project_pex_tool_version(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.reference_project_pex_tool_version
+
+    def set_target_project_extract_tool_version(self, value):
+        """
+        The function is setting target project PEX tool version
+        :param value:
+        :return:
+        """
+
+        self.target_project_extract_tool_version = value
+
+    @property
+    def get_target_project_extract_tool_version(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.target_project_extract_tool_version
+
+    def set_reference_project_extract_tool_version(self, value):
+        """
+        The function is setting target project PEX tool name
+        :param value:
+        :return:
+        """
+
+        self.reference_project_extract_tool_version = value
+
+    @property
+    def get_reference_project_extract_tool_version(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.reference_project_extract_tool_version
+
+    def set_target_project_extract_tool_deck(self, value):
+        """
+        The function is setting target project PEX tool version
+        :param value:
+        :return:
+        """
+
+        self.target_project_extract_tool_deck = value
+
+    @property
+    def get_target_project_extract_tool_deck(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.target_project_extract_tool_deck
+
+    def set_reference_project_extract_tool_deck(self, value):
+        """
+        The function is setting target project PEX tool name
+        :param value:
+        :return:
+        """
+
+        self.reference_project_extract_tool_deck = value
+
+    @property
+    def get_reference_project_extract_tool_deck(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.reference_project_extract_tool_deck
+
+    def set_target_project_extract_tool_starcmd(self, value):
+        """
+        The function is setting target project PEX tool version
+        :param value:
+        :return:
+        """
+
+        self.target_project_extract_tool_starcmd = value
+
+    @property
+    def get_target_project_extract_tool_starcmd(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.target_project_extract_tool_starcmd
+
+    def set_reference_project_extract_tool_starcmd(self, value):
+        """
+        The function is setting target project PEX tool name
+        :param value:
+        :return:
+        """
+
+        self.reference_project_extract_tool_starcmd = value
+
+    @property
+    def get_reference_project_extract_tool_starcmd(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.reference_project_extract_tool_starcmd
+
+    def set_target_project_pex_tool_deck(self, value):
+        """
+        The function is setting target project PEX tool version
+        :param value:
+        :return:
+        """
+
+        self.target_project_pex_tool_deck = value
+
+    @property
+    def get_target_project_pex_tool_deck(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.target_project_pex_tool_deck
+
+    def set_reference_project_pex_tool_deck(self, value):
+        """
+        The function is setting target project PEX tool name
+        :param value:
+        :return:
+        """
+
+        self.reference_project_pex_tool_deck = value
+
+    @property
+    def get_reference_project_pex_tool_deck(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.reference_project_pex_tool_deck
+
+    def set_target_project_pex_tool_option_file(self, value):
+        """
+        The function is setting target project PEX tool version
+        :param value:
+        :return:
+        """
+
+        self.target_project_pex_tool_option_file = value
+
+    @property
+    def get_target_project_pex_tool_option_file(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.target_project_pex_tool_option_file
+
+    def set_reference_project_pex_tool_option_file(self, value):
+        """
+        The function is setting target project PEX tool name
+        :param value:
+        :return:
+        """
+
+        self.reference_project_pex_tool_option_file = value
+
+    @property
+    def get_reference_project_pex_tool_option_file(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.reference_project_pex_tool_option_file
+
+    def set_target_project_pex_tool_source_file(self, value):
+        """
+        The function is setting target project PEX tool version
+        :param value:
+        :return:
+        """
+
+        self.target_project_pex_tool_source_file = value
+
+    @property
+    def get_target_project_pex_tool_source_file(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.target_project_pex_tool_source_file
+
+    def set_reference_project_pex_tool_source_file(self, value):
+        """
+        The function is setting target project PEX tool name
+        :param value:
+        :return:
+        """
+
+        self.reference_project_pex_tool_source_file = value
+
+    @property
+    def get_reference_project_pex_tool_source_file(self):
+        """
+        The function is returning target project pex tool name
+        :return:
+        """
+
+        return self.reference_project_pex_tool_source_file
+
+    def get_excel_setup(self):
+        """
+        The function is returning excel setup hash variable
+        :return:
+        """
+
+        return self.excel_setup
+
+    def set_excel_setup_none_value(self):
+        """
+        The function is setting excel setup
+        :return:
+        """
+
+        # The excel Setup Initialization
+        for optionName in available_excel_options:
+            self.excel_setup[optionName] = None
+
+    def set_excel_specs(self, excel_specs):
+        """
+        The function is setting all test case specs of the excel files, the first spec is used as excel setup of the script
+        :param excel_specs: List of [excel file, sheet name, excel setup hash]
+        :return:
+        """
+
+        self.excel_specs = excel_specs
+        if get_list_length(excel_specs) > 0:
+            self.excel_setup = excel_specs[0][2]
+
+    @property
+    def get_excel_specs(self):
+        """
+        The function is returning all test case specs of the excel files
+        :return:
+        """
+
+        return self.excel_specs
+
+    def set_user_script_arguments(self, user_arguments):
+        """
+        The function is setting user arguments
+        :return:
+        """
+
+        self.user_script_inputs = user_arguments
+
+    @property
+    def get_user_script_arguments(self):
+        """
+        The function is returning scripts user arguments
+        :return:
+        """
+
+        return self.user_script_inputs
+
+    def update_test_case_spec(self, excel_file, sheet_name, excel_setup):
+        """
+        The function is updating the test case of one test case spec
+        :param excel_file:
+        :param sheet_name:
+        :param excel_setup:
+        :return:
+        """
+
+        print_to_stdout(self, "Updating test case spec:\t" + str(excel_file) + "\tSheet:\t" + str(sheet_name))
+        test_cases = self.TestCases(self, excel_setup, excel_file)
+        try:
+            self.get_run_journal.run_unit("TEST_CASE_UPDATE", str(excel_file) + ":" + str(sheet_name), test_cases.update_test_cases)
+        finally:
+            # The other specs are not waiting anymore for the GDS files of the failed spec
+            test_cases.finish_analysed_gds_digests()
+
+    def update_all_test_cases(self):
+        """
+        The function is updating the test cases of all test case specs in parallel and reporting all failed specs at the end
+        :return:
+        """
+
+        if get_list_length(self.get_excel_specs) < 1:
+            self.TestCases(self).update_test_cases()
+            return
+
+        # The test case specs updates are only waiting for their GDS and package jobs, which are using the shared parallel jobs slots
+        failed_specs_report = ""
+        for job_arguments, job_result, job_exception in run_parallel_jobs(self.update_test_case_spec, self.get_excel_specs, self.get_max_parallel_jobs, False):
+            if job_exception is not None:
+                failed_specs_report += "\n\t" + str(job_arguments[0]) + "\tSheet:\t" + str(job_arguments[1]) + "\n\t\t" + str(job_exception)
+
+        if get_string_length(failed_specs_report) > 0:
+            print_to_stderr(self, "Test case update failed for the following test case spec(s):" + failed_specs_report)
+
+    def add_gds_pex_nodes(self, flow_graph, test_case_name, test_case_path, file_name, test_cases_extract):
+        """
+        The function is creating extraction environments of the GDS file and adding its PEX nodes into the flow graph
+        :param flow_graph:
+        :param test_case_name:
+        :param test_case_path:
+        :param file_name:
+        :param test_cases_extract:
+        :return:
+        """
+
+        for project_name, project_release, pex_command in test_cases_extract.create_gds_extract_environment(test_case_name, test_case_path, file_name):
+            flow_graph.add_node("PEX:" + "/".join([test_case_name, project_name, project_release, file_name]), test_cases_extract.run_pex_script, [pex_command],
+                                node_pool="PEX")
+
+    def add_test_case_flow_nodes(self, flow_graph, test_case_name, test_case_path, test_cases_extract, simulation, sample_extract_nodes):
+        """
+        The function is adding PEX environment, PEX and SIM nodes of the test case into the flow graph. Executed as a node, after the test case is updated
+        :param flow_graph:
+        :param test_case_name:
+        :param test_case_path:
+        :param test_cases_extract:
+        :param simulation:
+        :param sample_extract_nodes: Key = metal stack, Value = list of sample extract nodes names of the metal stack
+        :return:
+        """
+
+        gds_files_list = test_cases_extract.get_test_case_gds_files(test_case_path)
+        if get_list_length(gds_files_list) < 1:
+            print_to_stdout(self, "WARNING!:\tNo any GDS file found for test case:\t" + test_case_path)
+            return
+
+        all_projects = [[self.get_target_project_name, self.get_target_project_release]]
+        if self.check_for_reference_project_execution():
+            all_projects.append([self.get_reference_project_name, self.get_reference_project_release])
+
+        pex_nodes = []
+        if self.check_if_execute_pex():
+            for file_name in gds_files_list:
+                metal_stack = test_cases_extract.get_top_cell_name_and_metal(test_case_path, file_name)[1]
+                # The extraction environment is created from the sample runscript, so it waits only for the sample extract of its own metal stack.
+                # If the metal stack is not extracted, it waits for all sample extracts
+                pex_env_dependencies = sample_extract_nodes.get(metal_stack, sum(sample_extract_nodes.values(), []))
+                flow_graph.add_node("PEX_ENV:" + test_case_name + "/" + file_name, self.add_gds_pex_nodes,
+                                    [flow_graph, test_case_name, test_case_path, file_name, test_cases_extract], pex_env_dependencies)
+                for project_name, project_release in all_projects:
+                    pex_nodes.append("PEX:" + "/".join([test_case_name, project_name, project_release, file_name]))
+
+        if self.check_if_execute_simulation():
+            flow_graph.add_node("SIM:" + test_case_name, self.get_run_journal.run_unit, ["SIM", test_case_name, simulation.run_test_case_simulation, [test_case_name]],
+                                pex_nodes)
+
+    def add_sample_extract_nodes(self, flow_graph, project_environment, test_cases_extract, sample_extract_nodes):
+        """
+        The function is limiting the metal stacks to the metal stacks used by the selected test cases and adding their sample extract nodes into the flow graph.
+        Executed as a node, after the test cases are updated
+        :param flow_graph:
+        :param project_environment:
+        :param test_cases_extract:
+        :param sample_extract_nodes: Key = metal stack, Value = list of sample extract nodes names of the metal stack. Filled by the function
+        :return:
+        """
+
+        project_environment.limit_metal_stacks(test_cases_extract.get_required_metal_stacks())
+        for job_arguments in project_environment.get_sample_extract_jobs():
+            node_name = "SAMPLE_EXTRACT:" + "/".join(job_arguments[1:5])
+            flow_graph.add_node(node_name, project_environment.update_sample_run_script, job_arguments)
+            sample_extract_nodes.setdefault(job_arguments[4], []).append(node_name)
+
+    def run_flow_graph(self, project_environment, test_cases_extract, simulation):
+        """
+        The function is executing environment update, test case update, PEX and SIM steps as one flow graph. The sample extract of each metal stack, the update
+        of each test case spec, the extraction environment of each GDS file, the PEX of each GDS file for each project and the SIM of each test case are separate
+        nodes, so each of them is started as soon as its own inputs are ready
+        :param project_environment:
+        :param test_cases_extract:
+        :param simulation:
+        :return:
+        """
+
+        flow_graph = FlowScheduler(self.get_max_parallel_jobs, {"PEX": self.get_max_parallel_pex_jobs})
+
+        # Key = test case name, Value = list of test case update nodes names of the test case
+        test_case_update_nodes = {}
+        if self.check_if_update_test_case():
+            for excel_file, sheet_name, excel_setup in self.get_excel_specs:
+                node_name = "UPDATE_TEST_CASE:" + str(excel_file) + ":" + str(sheet_name)
+                flow_graph.add_node(node_name, self.update_test_case_spec, [excel_file, sheet_name, excel_setup], limited_node=False)
+                test_case_update_nodes.setdefault(str(excel_setup[available_excel_options[0]]), []).append(node_name)
+
+        # Key = metal stack, Value = list of sample extract nodes names of the metal stack, added after the metal stacks are planned
+        sample_extract_nodes = {}
+        plan_nodes = []
+        if self.check_if_update_environment():
+            # The metal stacks are taken from the GDS config files, so they are planned after the test cases are updated
+            plan_nodes.append("PLAN_METAL_STACKS")
+            flow_graph.add_node(plan_nodes[0], self.add_sample_extract_nodes, [flow_graph, project_environment, test_cases_extract, sample_extract_nodes],
+                                sum(test_case_update_nodes.values(), []))
+
+        if self.check_if_execute_pex() or self.check_if_execute_simulation():
+            project_name = self.get_reference_project_name
+            if project_name is None:
+                project_name = self.get_target_project_name
+
+            # The test cases of the updated test case specs are added also if they do not exist yet
+            all_test_cases = {}
+            if self.get_executed_test_case_package is None:
+                for test_case_name in test_case_update_nodes.keys():
+                    all_test_cases[test_case_name] = os.path.join(self.get_test_cases_directory, test_case_name, project_name)
+            all_test_cases.update(test_cases_extract.find_test_cases())
+
+            if get_list_length(all_test_cases.keys()) < 1:
+                print_to_stdout(self, "WARNING!:\tCannot find any test case for project:\t'" + project_name + "' inside directory:\t'" +
+                                str(self.get_test_cases_directory) + "'")
+            else:
+                self.set_project_test_cases(all_test_cases)
+
+            for test_case_name in sorted(all_test_cases.keys()):
+                flow_graph.add_node("TEST_CASE:" + test_case_name, self.add_test_case_flow_nodes,
+                                    [flow_graph, test_case_name, all_test_cases[test_case_name], test_cases_extract, simulation, sample_extract_nodes],
+                                    test_case_update_nodes.get(test_case_name, []) + plan_nodes)
+
+        print_to_stdout(self, "Executing flow graph. Maximum number of parallel jobs:\t" + str(self.get_max_parallel_jobs) + "\tPEX jobs:\t" +
+                        str(self.get_max_parallel_pex_jobs))
+
+        pex_jobs_results = []
+        failed_nodes_report = ""
+        for node_name, node_status, node_result, node_exception, node_arguments in flow_graph.run():
+            if node_name.startswith("PEX:") and node_status != "SKIPPED":
+                pex_jobs_results.append([node_arguments[0], node_result, node_exception])
+            elif node_status == "FAILED":
+                failed_nodes_report += "\n\t" + node_name + "\n\t\t" + str(node_exception)
+            elif node_status == "SKIPPED":
+                failed_nodes_report += "\n\t" + node_name + "\n\t\tSkipped, as the required node is failed"
+
+        if self.check_if_execute_pex():
+            test_cases_extract.report_pex_jobs_results(pex_jobs_results)
+
+        if get_string_length(failed_nodes_report) > 0:
+            print_to_stderr(self, "The following flow graph node(s) are not completed:" + failed_nodes_report)
+
+    def create_script_env_directories(self):
+        """
+        The function is generating
+        :return:
+        """
+
+        directories_list = self.get_script_env_property
+        directories_list.remove(self.get_script_environment_path)
+
+        for directory_path in directories_list:
+            create_directory(self.get_script_environment_path, get_file_name_from_path(directory_path))
+
+    def set_script_env_property(self):
+        """
+        The function is setting all property
+        :return:
+        """
+
+        self.set_log_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[0]))
+        self.set_reports_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[1]))
+        self.set_results_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[2]))
+        self.set_script_run_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[3]))
+        self.set_scripts_files_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[4]))
+        self.set_test_cases_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[5]))
+        self.set_data_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[6]))
 
     @property
-    def get_target_project_extract_tool_version(self):
+    def get_script_env_property(self):
         """
-        The function is returning target project pex tool name
+        The function is returning all properties as a list
         :return:
         """
 
-        return self.target_project_extract_tool_version
+        return [self.get_script_environment_path,
+                self.get_log_directory,
+                self.get_reports_directory,
+                self.get_results_directory,
+                self.get_script_run_directory,
+                self.get_scripts_files_directory,
+                self.get_test_cases_directory,
+                self.get_data_directory]
 
-    def set_reference_project_extract_tool_version(self, value):
+    def create_all_environment_directories(self):
         """
-        The function is setting target project PEX tool name
-        :param value:
+        The function is creating all environment directories
         :return:
         """
 
-        self.reference_project_extract_tool_version = value
+        # Creating environment directories
+        create_multiple_directories(self.get_script_environment_path, self.environment_directories_name_list)
+
+    def set_script_environment_path(self, directory_path):
+        """
+        The function is setting script environment directory
+        :param directory_path:
+        :return:
+        """
+
+        self.script_environment_path = directory_path
 
     @property
-    def get_reference_project_extract_tool_version(self):
+    def get_script_environment_path(self):
         """
-        The function is returning target project pex tool name
+        The function is returning script environment path
         :return:
         """
 
-        return self.reference_project_extract_tool_version
+        return self.script_environment_path
 
-    def set_target_project_extract_tool_deck(self, value):
+    def set_log_directory(self, directory_path):
         """
-        The function is setting target project PEX tool version
-        :param value:
+        The function changing log directory path
+        :param directory_path:
         :return:
         """
 
-        self.target_project_extract_tool_deck = value
+        self.script_log_dir = directory_path
 
     @property
-    def get_target_project_extract_tool_deck(self):
+    def get_log_directory(self):
         """
-        The function is returning target project pex tool name
+        The function is returning LOG directory
         :return:
         """
 
-        return self.target_project_extract_tool_deck
+        return self.script_log_dir
 
-    def set_reference_project_extract_tool_deck(self, value):
+    def set_data_directory(self, directory_path):
         """
-        The function is setting target project PEX tool name
-        :param value:
+        The function is changing data directory path
+        :param directory_path:
+        :return:
+        """
+
+        self.script_data_directory = directory_path
+
+    @property
+    def get_data_directory(self):
+        """
+        The function is returning DATA directory
+        :return:
+        """
+
+        return self.script_data_directory
+
+    def set_reports_directory(self, directory_path):
+        """
+        The function is changing reports directory path
+        :param directory_path:
+        :return:
+        """
+
+        self.script_reports_directory = directory_path
+
+    @property
+    def get_reports_directory(self):
+        """
+        The function is returning reports directory
+        :return:
+        """
+
+        return self.script_reports_directory
+
+    def set_results_directory(self, directory_path):
+        """
+        The function is changing reports directory path
+        :param directory_path:
+        :return:
+        """
+
+        self.script_results_directory = directory_path
+
+    @property
+    def get_results_directory(self):
+        """
+        The function is returning reports directory
+        :return:
+        """
+
+        return self.script_results_directory
+
+    def set_scripts_files_directory(self, directory_path):
+        """
+        The function is changing reports directory path
+        :param directory_path:
+        :return:
+        """
+
+        self.scripts_files_directory = directory_path
+
+    @property
+    def get_scripts_files_directory(self):
+        """
+        The function is returning reports directory
+        :return:
+        """
+
+        return self.scripts_files_directory
+
+    def set_test_cases_directory(self, directory_path):
+        """
+        The function is changing reports directory path
+        :param directory_path:
+        :return:
+        """
+
+        self.scripts_test_cases_directory = directory_path
+
+    @property
+    def get_test_cases_directory(self):
+        """
+        The function is returning reports directory
+        :return:
+        """
+
+        return self.scripts_test_cases_directory
+
+    def set_script_run_directory(self, directory_path):
+        """
+        The function is changing reports directory path
+        :param directory_path:
+        :return:
+        """
+
+        self.script_run_directory = directory_path
+
+    @property
+    def get_script_run_directory(self):
+        """
+        The function is returning reports directory
+        :return:
+        """
+
+        return self.script_run_directory
+
+    def set_projects_root_dir(self, directory_path):
+        """
+        The function is defining projects root directory, by default it is /remote/cad-rep/projects
+        :param directory_path:
+        :return:
+        """
+
+        self.projects_root_dir = directory_path
+
+    @property
+    def get_projects_root_dir(self):
+        """
+        The function is returning projects root directory, by default it is /remote/cad-rep/projects
+        :return:
+        """
+
+        return self.projects_root_dir
+
+    @property
+    def get_project_catalog(self):
+        """
+        The function is returning projects catalog of the projects root directory
+        :return:
+        """
+
+        if self.project_catalog is None or self.project_catalog.projects_root_dir != self.get_projects_root_dir:
+            self.project_catalog = self.ProjectCatalog(self)
+
+        return self.project_catalog
+
+    @property
+    def get_gds_config_cache(self):
+        """
+        The function is returning GDS config cache of the DATA directory
+        :return:
+        """
+
+        if self.gds_config_cache is None:
+            self.gds_config_cache = self.GdsConfigCache(self)
+
+        return self.gds_config_cache
+
+    @property
+    def get_job_backend(self):
+        """
+        The function is returning the job backend instance of the external commands
+        :return:
+        """
+
+        if self.job_backend is None:
+            if self.get_job_backend_name == available_job_backends[1]:
+                self.job_backend = SpoolJobBackend(os.path.join(self.get_data_directory, job_spool_directory_name), self.get_max_parallel_jobs)
+            else:
+                self.job_backend = LocalJobBackend()
+
+        return self.job_backend
+
+    @property
+    def get_run_journal(self):
+        """
+        The function is returning the run journal of the LOGS directory
         :return:
         """
 
-        self.reference_project_extract_tool_deck = value
+        if self.run_journal is None:
+            self.run_journal = self.RunJournal(self)
+
+        return self.run_journal
 
     @property
-    def get_reference_project_extract_tool_deck(self):
+    def get_object_store(self):
         """
-        The function is returning target project pex tool name
+        The function is returning test case files object store of the DATA directory
         :return:
         """
 
-        return self.reference_project_extract_tool_deck
+        if self.object_store is None:
+            self.object_store = self.ObjectStore(self)
 
-    def set_target_project_extract_tool_starcmd(self, value):
+        return self.object_store
+
+    def set_script_excel_file(self, file_location):
         """
-        The function is setting target project PEX tool version
-        :param value:
+        The function is defining projects root directory, by default it is /remote/cad-rep/projects
+        :param file_location:
         :return:
         """
 
-        self.target_project_extract_tool_starcmd = value
+        self.excel_file = file_location
 
     @property
-    def get_target_project_extract_tool_starcmd(self):
+    def get_script_excel_file(self):
         """
-        The function is returning target project pex tool name
+        The function is returning reports directory
         :return:
         """
 
-        return self.target_project_extract_tool_starcmd
+        return self.excel_file
 
-    def set_reference_project_extract_tool_starcmd(self, value):
+    def set_target_project_type(self, value):
         """
-        The function is setting target project PEX tool name
+        The function is defining target project type
         :param value:
         :return:
         """
 
-        self.reference_project_extract_tool_starcmd = value
+        self.target_project_type = value
 
     @property
-    def get_reference_project_extract_tool_starcmd(self):
+    def get_target_project_type(self):
         """
-        The function is returning target project pex tool name
+        The function is defining target project type
         :return:
         """
 
-        return self.reference_project_extract_tool_starcmd
+        return self.target_project_type
 
-    def set_target_project_pex_tool_deck(self, value):
+    def set_target_project_name(self, value):
         """
-        The function is setting target project PEX tool version
+        The function is defining projects root directory, by default it is /remote/cad-rep/projects
         :param value:
         :return:
         """
 
-        self.target_project_pex_tool_deck = value
+        self.target_project_name = value
 
     @property
-    def get_target_project_pex_tool_deck(self):
+    def get_target_project_name(self):
         """
-        The function is returning target project pex tool name
+        The function is returning reports directory
         :return:
         """
 
-        return self.target_project_pex_tool_deck
+        return self.target_project_name
 
-    def set_reference_project_pex_tool_deck(self, value):
+    def set_target_project_release(self, value):
         """
-        The function is setting target project PEX tool name
+        The function is defining projects root directory, by default it is /remote/cad-rep/projects
         :param value:
         :return:
         """
 
-        self.reference_project_pex_tool_deck = value
+        self.target_project_release = value
 
     @property
-    def get_reference_project_pex_tool_deck(self):
+    def get_target_project_release(self):
         """
-        The function is returning target project pex tool name
+        The function is returning reports directory
         :return:
         """
 
-        return self.reference_project_pex_tool_deck
+        return self.target_project_release
 
-    def set_target_project_pex_tool_option_file(self, value):
+    def set_reference_project_type(self, value):
         """
-        The function is setting target project PEX tool version
+        The function is defining target project type
         :param value:
         :return:
         """
 
-        self.target_project_pex_tool_option_file = value
+        self.reference_project_type = value
 
     @property
-    def get_target_project_pex_tool_option_file(self):
+    def get_reference_project_type(self):
         """
-        The function is returning target project pex tool name
+        The function is defining target project type
         :return:
         """
 
-        return self.target_project_pex_tool_option_file
+        return self.reference_project_type
 
-    def set_reference_project_pex_tool_option_file(self, value):
+    def set_reference_project_name(self, value):
         """
-        The function is setting target project PEX tool name
+        The function is defining projects root directory, by default it is /remote/cad-rep/projects
         :param value:
         :return:
         """
 
-        self.reference_project_pex_tool_option_file = value
+        self.reference_project_name = value
 
     @property
-    def get_reference_project_pex_tool_option_file(self):
+    def get_reference_project_name(self):
         """
-        The function is returning target project pex tool name
+        The function is returning reports directory
         :return:
         """
 
-        return self.reference_project_pex_tool_option_file
+        return self.reference_project_name
 
-    def set_target_project_pex_tool_source_file(self, value):
+    def set_reference_project_release(self, value):
         """
-        The function is setting target project PEX tool version
+        The function is defining projects root directory, by default it is /remote/cad-rep/projects
         :param value:
         :return:
         """
 
-        self.target_project_pex_tool_source_file = value
+        self.reference_project_release = value
 
     @property
-    def get_target_project_pex_tool_source_file(self):
+    def get_reference_project_release(self):
         """
-        The function is returning target project pex tool name
+        The function is returning reports directory
         :return:
         """
 
-        return self.target_project_pex_tool_source_file
+        return self.reference_project_release
 
-    def set_reference_project_pex_tool_source_file(self, value):
+    def set_target_project_metal_stack_list(self, list_value):
         """
-        The function is setting target project PEX tool name
-        :param value:
+        The function is defining projects root directory, by default it is /remote/cad-rep/projects
+        :param list_value:
         :return:
         """
 
-        self.reference_project_pex_tool_source_file = value
+        self.target_project_metal_stack_list = []
+        for value in list_value:
+            self.target_project_metal_stack_list.append(value)
 
     @property
-    def get_reference_project_pex_tool_source_file(self):
+    def get_target_project_metal_stack_list(self):
         """
-        The function is returning target project pex tool name
+        The function is returning reports directory
         :return:
         """
 
-        return self.reference_project_pex_tool_source_file
+        return self.target_project_metal_stack_list
 
-    def get_excel_setup(self):
+    def set_reference_project_metal_stack_list(self, list_value):
         """
-        The function is returning excel setup hash variable
+        The function is defining projects root directory, by default it is /remote/cad-rep/projects
+        :param list_value:
         :return:
         """
 
-        return self.excel_setup
+        self.reference_project_metal_stack_list = []
+        for value in list_value:
+            self.reference_project_metal_stack_list.append(value)
 
-    def set_excel_setup_none_value(self):
+    @property
+    def get_reference_project_metal_stack_list(self):
         """
-        The function is setting excel setup
+        The function is returning reports directory
         :return:
         """
 
-        # The excel Setup Initialization
-        for optionName in available_excel_options:
-            self.excel_setup[optionName] = None
+        return self.reference_project_metal_stack_list
 
-    def set_user_script_arguments(self, user_arguments):
+    def set_project_test_cases(self, hash_value):
         """
-        The function is setting user arguments
+        The project is setting project_test_cases hash
+        :param hash_value:
         :return:
         """
 
-        self.user_script_inputs = user_arguments
+        self.project_test_cases = hash_value
 
     @property
-    def get_user_script_arguments(self):
+    def get_project_test_cases(self):
         """
-        The function is returning scripts user arguments
+        The function is returning project_test_cases
         :return:
         """
 
-        return self.user_script_inputs
+        return self.project_test_cases
 
-    def create_script_env_directories(self):
+    def set_executed_test_case_package(self, value):
         """
-        The function is generating
+        The function is defining projects root directory, by default it is /remote/cad-rep/projects
+        :param value:
         :return:
         """
 
-        directories_list = self.get_script_env_property
-        directories_list.remove(self.get_script_environment_path)
-
-        for directory_path in directories_list:
-            create_directory(self.get_script_environment_path, get_file_name_from_path(directory_path))
+        self.executed_test_case_package = value
 
-    def set_script_env_property(self):
+    @property
+    def get_executed_test_case_package(self):
         """
-        The function is setting all property
+        The function is returning reports directory
         :return:
         """
 
-        self.set_log_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[0]))
-        self.set_reports_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[1]))
-        self.set_results_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[2]))
-        self.set_script_run_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[3]))
-        self.set_scripts_files_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[4]))
-        self.set_test_cases_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[5]))
-        self.set_data_directory(os.path.join(self.get_script_environment_path, environment_directories_name_list[6]))
+        return self.executed_test_case_package
 
-    @property
-    def get_script_env_property(self):
+    # The MsipEse class methods
+
+    # --------------------------------------------------- #
+    # ----------------- Internal Class ------------------ #
+    # --------------------------------------------------- #
+
+    class ProjectCatalog:
         """
-        The function is returning all properties as a list
-        :return:
+        The class contains on-disk catalog of the projects root directory: project name -> type -> releases -> metal stacks.
+        Each part of the catalog is read again only if the directory modification time is changed
         """
 
-        return [self.get_script_environment_path,
-                self.get_log_directory,
-                self.get_reports_directory,
-                self.get_results_directory,
-                self.get_script_run_directory,
-                self.get_scripts_files_directory,
-                self.get_test_cases_directory,
-                self.get_data_directory]
+        def __init__(self, msip_ese_object):
+            """
+            Initial function of the class
+            :param msip_ese_object:
+            """
+
+            self.msip_ese_object = msip_ese_object
+            self.projects_root_dir = msip_ese_object.get_projects_root_dir
+            self.catalog_file = os.path.join(msip_ese_object.get_data_directory, project_catalog_file_name)
+            self.catalog_lock = threading.RLock()
+            self.catalog_changed = False
+
+            all_catalogs = read_json_file(self.catalog_file, {})
+            self.catalog = all_catalogs.get(self.projects_root_dir, {}) if isinstance(all_catalogs, dict) else {}
+            for catalog_section in ["types", "projects"]:
+                self.catalog.setdefault(catalog_section, {})
+
+        @staticmethod
+        def get_directory_mtime(directory_path):
+            """
+            The function is returning directory modification time, or None if the directory does not exist
+            :param directory_path:
+            :return:
+            """
+
+            try:
+                return os.stat(directory_path).st_mtime
+            except OSError:
+                return None
+
+        def save(self):
+            """
+            The function is writing the catalog into DATA directory if it was changed
+            :return:
+            """
+
+            with self.catalog_lock:
+                if not self.catalog_changed:
+                    return
+
+                data_directory = get_file_path(self.catalog_file)
+                if not check_for_dir_existence(get_file_path(data_directory), get_file_name_from_path(data_directory)):
+                    return
+
+                with FileLock(self.catalog_file + data_file_lock_extension):
+                    all_catalogs = read_json_file(self.catalog_file, {})
+                    if not isinstance(all_catalogs, dict):
+                        all_catalogs = {}
+                    all_catalogs[self.projects_root_dir] = self.catalog
+
+                    if write_json_file(self.catalog_file, all_catalogs):
+                        self.catalog_changed = False
+
+        def refresh_project_types(self):
+            """
+            The function is updating project names of each project type, which directory is changed
+            :return:
+            """
+
+            with self.catalog_lock:
+                all_types = self.catalog["types"]
+
+                root_mtime = self.get_directory_mtime(self.projects_root_dir)
+                if root_mtime is None:
+                    return
+                if root_mtime != self.catalog.get("mtime"):
+                    available_types = get_directory_items_list(self.projects_root_dir)
+                    for project_type in list(all_types.keys()):
+                        if project_type not in available_types:
+                            del all_types[project_type]
+                    for project_type in available_types:
+                        all_types.setdefault(project_type, {"mtime": None, "projects": []})
+                    self.catalog["mtime"] = root_mtime
+                    self.catalog_changed = True
+
+                for project_type in sorted(all_types.keys()):
+                    type_mtime = self.get_directory_mtime(os.path.join(self.projects_root_dir, project_type))
+                    if type_mtime != all_types[project_type]["mtime"]:
+                        all_types[project_type] = {"mtime": type_mtime, "projects": get_directory_items_list(os.path.join(self.projects_root_dir, project_type))}
+                        self.catalog_changed = True
+
+                self.save()
+
+        def find_project_type(self, project_name):
+            """
+            The function is returning project type of the project, or None if the project is not found
+            :param project_name:
+            :return:
+            """
+
+            with self.catalog_lock:
+                project_info = self.catalog["projects"].get(project_name)
+                if project_info is not None:
+                    if check_for_dir_existence(os.path.join(self.projects_root_dir, project_info["type"]), project_name):
+                        return project_info["type"]
+
+                self.refresh_project_types()
+
+                for project_type in sorted(self.catalog["types"].keys()):
+                    if project_name in self.catalog["types"][project_type]["projects"]:
+                        self.catalog["projects"][project_name] = {"type": project_type, "mtime": None, "releases": [], "metal_stacks": {}}
+                        self.catalog_changed = True
+                        self.save()
+                        return project_type
+
+            return None
+
+        def get_project_info(self, project_type, project_name):
+            """
+            The function is returning catalog information of the project, with up to date releases list
+            :param project_type:
+            :param project_name:
+            :return:
+            """
+
+            with self.catalog_lock:
+                project_info = self.catalog["projects"].get(project_name)
+                if project_info is None or project_info["type"] != project_type:
+                    project_info = {"type": project_type, "mtime": None, "releases": [], "metal_stacks": {}}
+                    self.catalog["projects"][project_name] = project_info
+                    self.catalog_changed = True
+
+                project_mtime = self.get_directory_mtime(os.path.join(self.projects_root_dir, project_type, project_name))
+                if project_mtime != project_info["mtime"]:
+                    project_info["mtime"] = project_mtime
+                    project_info["releases"] = get_directory_items_list(os.path.join(self.projects_root_dir, project_type, project_name))
+                    self.catalog_changed = True
+
+                return project_info
+
+        def get_project_releases(self, project_type, project_name):
+            """
+            The function is returning all releases of the project
+            :param project_type:
+            :param project_name:
+            :return:
+            """
+
+            with self.catalog_lock:
+                project_releases = list(self.get_project_info(project_type, project_name)["releases"])
+                self.save()
+
+            return project_releases
+
+        def get_latest_project_release(self, project_type, project_name):
+            """
+            The function is returning latest release of the project, or None if there is no any release
+            :param project_type:
+            :param project_name:
+            :return:
+            """
+
+            return get_latest_release_version(self.get_project_releases(project_type, project_name))
+
+        def get_project_metal_stacks(self, project_type, project_name, project_release):
+            """
+            The function is returning all metal stacks of the project release
+            :param project_type:
+            :param project_name:
+            :param project_release:
+            :return:
+            """
 
-    def create_all_environment_directories(self):
-        """
-        The function is creating all environment directories
-        :return:
-        """
+            cad_directory = os.path.join(self.projects_root_dir, project_type, project_name, project_release, project_cad_directory_name)
 
-        # Creating environment directories
-        create_multiple_directories(self.get_script_environment_path, self.environment_directories_name_list)
+            with self.catalog_lock:
+                all_metal_stacks = self.get_project_info(project_type, project_name)["metal_stacks"]
+                cad_mtime = self.get_directory_mtime(cad_directory)
+                release_metal_stacks = all_metal_stacks.get(project_release)
+                if release_metal_stacks is None or release_metal_stacks["mtime"] != cad_mtime:
+                    release_metal_stacks = {"mtime": cad_mtime, "metal_stacks": self.msip_ese_object.ProjectEnvironment.get_metal_stack_dir_list(cad_directory)}
+                    all_metal_stacks[project_release] = release_metal_stacks
+                    self.catalog_changed = True
+                self.save()
 
-    def set_script_environment_path(self, directory_path):
+                return list(release_metal_stacks["metal_stacks"])
+
+    class GdsConfigCache:
         """
-        The function is setting script environment directory
-        :param directory_path:
-        :return:
+        The class contains on-disk cache of GDS config information: GDS content digest -> top cell name and layers.
+        The digest of already known GDS file is taken by size and modification time, without reading the file
         """
 
-        self.script_environment_path = directory_path
+        def __init__(self, msip_ese_object):
+            """
+            Initial function of the class
+            :param msip_ese_object:
+            """
 
-    @property
-    def get_script_environment_path(self):
-        """
-        The function is returning script environment path
-        :return:
-        """
+            self.msip_ese_object = msip_ese_object
+            self.cache_file = os.path.join(msip_ese_object.get_data_directory, gds_config_cache_file_name)
+            self.cache_lock = threading.RLock()
+            self.cache_changed = False
 
-        return self.script_environment_path
+            self.cache = read_json_file(self.cache_file, {})
+            if not isinstance(self.cache, dict):
+                self.cache = {}
+            for cache_section in ["files", "digests"]:
+                self.cache.setdefault(cache_section, {})
 
-    def set_log_directory(self, directory_path):
-        """
-        The function changing log directory path
-        :param directory_path:
-        :return:
-        """
+        def save(self):
+            """
+            The function is writing the cache into DATA directory if it was changed. The cache saved by other runs in the meantime is merged,
+            and the files which are not exist anymore are removed from the cache
+            :return:
+            """
 
-        self.script_log_dir = directory_path
+            with self.cache_lock:
+                if not self.cache_changed:
+                    return
 
-    @property
-    def get_log_directory(self):
-        """
-        The function is returning LOG directory
-        :return:
-        """
+                data_directory = get_file_path(self.cache_file)
+                if not check_for_dir_existence(get_file_path(data_directory), get_file_name_from_path(data_directory)):
+                    return
 
-        return self.script_log_dir
+                with FileLock(self.cache_file + data_file_lock_extension):
+                    saved_cache = read_json_file(self.cache_file, {})
+                    if isinstance(saved_cache, dict):
+                        for cache_section in ["files", "digests"]:
+                            if isinstance(saved_cache.get(cache_section), dict):
+                                merged_cache_section = dict(saved_cache[cache_section])
+                                merged_cache_section.update(self.cache[cache_section])
+                                self.cache[cache_section] = merged_cache_section
 
-    def set_data_directory(self, directory_path):
-        """
-        The function is changing data directory path
-        :param directory_path:
-        :return:
-        """
+                    for gds_file in list(self.cache["files"].keys()):
+                        if not os.path.isfile(gds_file):
+                            del self.cache["files"][gds_file]
 
-        self.script_data_directory = directory_path
+                    if write_json_file(self.cache_file, self.cache):
+                        self.cache_changed = False
 
-    @property
-    def get_data_directory(self):
-        """
-        The function is returning DATA directory
-        :return:
-        """
+        def get_gds_file_digest(self, gds_file):
+            """
+            The function is returning content digest of the GDS file. The file is read only if its size or modification time is changed
+            :param gds_file:
+            :return: The digest or empty string if the file cannot be read
+            """
 
-        return self.script_data_directory
+            try:
+                file_stat = os.stat(gds_file)
+            except OSError:
+                return ""
 
-    def set_reports_directory(self, directory_path):
-        """
-        The function is changing reports directory path
-        :param directory_path:
-        :return:
-        """
+            with self.cache_lock:
+                file_info = self.cache["files"].get(gds_file)
+                if file_info is not None and file_info["size"] == file_stat.st_size and file_info["mtime"] == file_stat.st_mtime:
+                    return file_info["digest"]
 
-        self.script_reports_directory = directory_path
+            gds_file_digest = get_file_digest(gds_file)
+            if get_string_length(gds_file_digest) > 0:
+                with self.cache_lock:
+                    self.cache["files"][gds_file] = {"size": file_stat.st_size, "mtime": file_stat.st_mtime, "digest": gds_file_digest}
+                    self.cache_changed = True
 
-    @property
-    def get_reports_directory(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+            return gds_file_digest
 
-        return self.script_reports_directory
+        def get_gds_config(self, gds_file_digest):
+            """
+            The function is returning cached GDS config information
+            :param gds_file_digest:
+            :return: [top cell name, list of layers] or None if the GDS content is not known
+            """
 
-    def set_results_directory(self, directory_path):
-        """
-        The function is changing reports directory path
-        :param directory_path:
-        :return:
-        """
+            with self.cache_lock:
+                gds_config = self.cache["digests"].get(gds_file_digest)
+                if gds_config is None:
+                    return None
 
-        self.script_results_directory = directory_path
+                return [gds_config["top_cell_name"], list(gds_config["layers"])]
 
-    @property
-    def get_results_directory(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+        def add_gds_config(self, gds_file_digest, top_cell_name, all_layers):
+            """
+            The function is adding GDS config information into the cache
+            :param gds_file_digest:
+            :param top_cell_name:
+            :param all_layers:
+            :return:
+            """
 
-        return self.script_results_directory
+            if get_string_length(gds_file_digest) < 1:
+                return
 
-    def set_scripts_files_directory(self, directory_path):
+            with self.cache_lock:
+                self.cache["digests"][gds_file_digest] = {"top_cell_name": top_cell_name, "layers": list(all_layers)}
+                self.cache_changed = True
+
+    class ObjectStore:
         """
-        The function is changing reports directory path
-        :param directory_path:
-        :return:
+        The class contains content-addressed store of the test case files in DATA directory. Each file content is stored once, named by its digest,
+        and the test case files are links to the store objects. The store index keeps the stored objects and the members of each ingested package,
+        the objects used by the test cases are taken from the test case manifests. The store can be shared by parallel runs, so the index is merged with
+        the saved one under the index lock file
         """
 
-        self.scripts_files_directory = directory_path
+        def __init__(self, msip_ese_object):
+            """
+            Initial function of the class
+            :param msip_ese_object:
+            """
 
-    @property
-    def get_scripts_files_directory(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+            self.msip_ese_object = msip_ese_object
+            self.store_directory = os.path.join(msip_ese_object.get_data_directory, object_store_directory_name)
+            self.index_file = os.path.join(self.store_directory, object_store_index_file_name)
+            self.store_lock = threading.RLock()
+            self.store_changed = False
+            self.index_lock = FileLock(self.index_file + data_file_lock_extension)
+
+            self.store_index = read_json_file(self.index_file, {})
+            if not isinstance(self.store_index, dict):
+                self.store_index = {}
+            for index_section in ["files", "objects", "packages"]:
+                self.store_index.setdefault(index_section, {})
+
+            # The store is used by this run until the run is finished, the garbage collection of other runs is waiting for it
+            self.usage_lock = FileLock(os.path.join(self.store_directory, object_store_usage_lock_file_name))
+            try:
+                os.makedirs(self.store_directory, exist_ok=True)
+            except OSError:
+                pass
+            self.usage_lock.acquire(shared_lock=True)
 
-        return self.scripts_files_directory
+        def merge_saved_index(self):
+            """
+            The function is merging the store index saved by other runs into the store index. Should be called with the index lock.
+            The objects removed from the store by other runs are removed from the store index
+            :return:
+            """
 
-    def set_test_cases_directory(self, directory_path):
-        """
-        The function is changing reports directory path
-        :param directory_path:
-        :return:
-        """
+            saved_index = read_json_file(self.index_file, {})
+            if not isinstance(saved_index, dict):
+                saved_index = {}
+
+            for index_section in ["files", "objects", "packages"]:
+                merged_index_section = saved_index.get(index_section, {}) if isinstance(saved_index.get(index_section), dict) else {}
+                merged_index_section.update(self.store_index[index_section])
+                self.store_index[index_section] = merged_index_section
+
+            for file_digest in list(self.store_index["objects"].keys()):
+                if not os.path.isfile(self.get_object_path(file_digest)):
+                    del self.store_index["objects"][file_digest]
+            for zip_file in list(self.store_index["packages"].keys()):
+                if any(file_digest not in self.store_index["objects"] for file_digest in self.store_index["packages"][zip_file]["members"].values()):
+                    del self.store_index["packages"][zip_file]
+            for source_file in list(self.store_index["files"].keys()):
+                if not os.path.isfile(source_file):
+                    del self.store_index["files"][source_file]
+
+        def save(self):
+            """
+            The function is writing the store index into the store directory if it was changed. The index saved by other runs in the meantime is merged
+            :return:
+            """
 
-        self.scripts_test_cases_directory = directory_path
+            with self.store_lock:
+                if not self.store_changed:
+                    return
 
-    @property
-    def get_test_cases_directory(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+                if check_for_dir_existence(get_file_path(self.store_directory), get_file_name_from_path(self.store_directory)):
+                    with self.index_lock:
+                        self.merge_saved_index()
+                        if write_json_file(self.index_file, self.store_index):
+                            self.store_changed = False
 
-        return self.scripts_test_cases_directory
+        def get_object_path(self, file_digest):
+            """
+            The function is returning the store object path of the file content digest
+            :param file_digest:
+            :return:
+            """
 
-    def set_script_run_directory(self, directory_path):
-        """
-        The function is changing reports directory path
-        :param directory_path:
-        :return:
-        """
+            return os.path.join(self.store_directory, file_digest[:2], file_digest)
 
-        self.script_run_directory = directory_path
+        def get_file_digest(self, source_file):
+            """
+            The function is returning content digest of the file. The file is read only if its size or modification time is changed
+            :param source_file:
+            :return: The digest or empty string if the file cannot be read
+            """
 
-    @property
-    def get_script_run_directory(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+            try:
+                file_stat = os.stat(source_file)
+            except OSError:
+                return ""
 
-        return self.script_run_directory
+            with self.store_lock:
+                file_info = self.store_index["files"].get(source_file)
+                if file_info is not None and file_info["size"] == file_stat.st_size and file_info["mtime"] == file_stat.st_mtime:
+                    return file_info["digest"]
 
-    def set_projects_root_dir(self, directory_path):
-        """
-        The function is defining projects root directory, by default it is /remote/cad-rep/projects
-        :param directory_path:
-        :return:
-        """
+            file_digest = get_file_digest(source_file)
+            if get_string_length(file_digest) > 0:
+                with self.store_lock:
+                    self.store_index["files"][source_file] = {"size": file_stat.st_size, "mtime": file_stat.st_mtime, "digest": file_digest}
+                    self.store_changed = True
 
-        self.projects_root_dir = directory_path
+            return file_digest
 
-    @property
-    def get_projects_root_dir(self):
-        """
-        The function is returning projects root directory, by default it is /remote/cad-rep/projects
-        :return:
-        """
+        def add_file(self, source_file, temporary_source=False):
+            """
+            The function is adding the file content into the store, if the content is not stored yet. The store objects are read only,
+            so only temporary source files are hard linked, the other files can be changed by their owners
+            :param source_file:
+            :param temporary_source:
+            :return: The object digest or empty string if the file cannot be stored
+            """
 
-        return self.projects_root_dir
+            file_digest = self.get_file_digest(source_file)
+            if get_string_length(file_digest) < 1:
+                return ""
 
-    def set_script_excel_file(self, file_location):
-        """
-        The function is defining projects root directory, by default it is /remote/cad-rep/projects
-        :param file_location:
-        :return:
-        """
+            object_path = self.get_object_path(file_digest)
+            if os.path.isfile(object_path):
+                return file_digest
 
-        self.excel_file = file_location
+            try:
+                os.makedirs(get_file_path(object_path), exist_ok=True)
+            except OSError:
+                return ""
+
+            temporary_object_path = object_path + "." + str(os.getpid()) + "." + str(threading.current_thread().ident)
+            materialization_methods = available_materialization_methods[:2] if temporary_source else available_materialization_methods[:1]
+            if materialize_file(source_file, temporary_object_path, materialization_methods) is None:
+                return ""
+            try:
+                os.chmod(temporary_object_path, mode=0o555)
+                os.replace(temporary_object_path, object_path)
+            except OSError:
+                return ""
 
-    @property
-    def get_script_excel_file(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+            with self.store_lock:
+                self.store_index["objects"].setdefault(file_digest, {"size": get_file_size(object_path)})
+                self.store_changed = True
 
-        return self.excel_file
+            return file_digest
 
-    def set_target_project_type(self, value):
-        """
-        The function is defining target project type
-        :param value:
-        :return:
-        """
+        def link_object(self, file_digest, target_file, materialization_methods):
+            """
+            The function is creating the target file as link to the store object
+            :param file_digest:
+            :param target_file:
+            :param materialization_methods:
+            :return: The used materialization method or None if the target file cannot be created
+            """
 
-        self.target_project_type = value
+            object_path = self.get_object_path(file_digest)
+            if not os.path.isfile(object_path):
+                return None
 
-    @property
-    def get_target_project_type(self):
-        """
-        The function is defining target project type
-        :return:
-        """
+            materialization_method = materialize_file(object_path, target_file, materialization_methods)
+            if materialization_method is not None:
+                with self.store_lock:
+                    if file_digest not in self.store_index["objects"]:
+                        self.store_index["objects"][file_digest] = {"size": get_file_size(object_path)}
+                        self.store_changed = True
 
-        return self.target_project_type
+            return materialization_method
 
-    def set_target_project_name(self, value):
-        """
-        The function is defining projects root directory, by default it is /remote/cad-rep/projects
-        :param value:
-        :return:
-        """
+        def add_package(self, zip_file, package_members):
+            """
+            The function is storing the objects of the package members, so the package is not extracted again while it is not changed
+            :param zip_file:
+            :param package_members: Dictionary of member name -> object digest
+            :return:
+            """
 
-        self.target_project_name = value
+            try:
+                file_stat = os.stat(zip_file)
+            except OSError:
+                return
 
-    @property
-    def get_target_project_name(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+            with self.store_lock:
+                package_info = self.store_index["packages"].get(zip_file)
+                if package_info is None or package_info["size"] != file_stat.st_size or package_info["mtime"] != file_stat.st_mtime:
+                    package_info = {"size": file_stat.st_size, "mtime": file_stat.st_mtime, "members": {}}
+                    self.store_index["packages"][zip_file] = package_info
+                package_info["members"].update(package_members)
+                self.store_changed = True
 
-        return self.target_project_name
+        def get_package_members(self, zip_file, required_members):
+            """
+            The function is returning the store objects of the package members
+            :param zip_file:
+            :param required_members:
+            :return: Dictionary of member name -> object digest or None if any of the required members is not stored
+            """
 
-    def set_target_project_release(self, value):
-        """
-        The function is defining projects root directory, by default it is /remote/cad-rep/projects
-        :param value:
-        :return:
-        """
+            try:
+                file_stat = os.stat(zip_file)
+            except OSError:
+                return None
 
-        self.target_project_release = value
+            with self.store_lock:
+                package_info = self.store_index["packages"].get(zip_file)
+                if package_info is None or package_info["size"] != file_stat.st_size or package_info["mtime"] != file_stat.st_mtime:
+                    return None
 
-    @property
-    def get_target_project_release(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+                package_members = {}
+                for member_name in required_members:
+                    file_digest = package_info["members"].get(member_name)
+                    if file_digest is None or not os.path.isfile(self.get_object_path(file_digest)):
+                        return None
+                    package_members[member_name] = file_digest
 
-        return self.target_project_release
+                return package_members
 
-    def set_reference_project_type(self, value):
-        """
-        The function is defining target project type
-        :param value:
-        :return:
-        """
+        def get_referenced_digests(self):
+            """
+            The function is returning the digests of all files in the manifests of the test cases.
+            The reflinked and copied test case files do not share the inode with the store object, so the manifest digests are used as references
+            :return: Set of object digests
+            """
 
-        self.reference_project_type = value
+            referenced_digests = set()
+            test_cases_directory = self.msip_ese_object.get_test_cases_directory
+            for test_case_name in get_directory_items_list(test_cases_directory):
+                for project_name in get_directory_items_list(os.path.join(test_cases_directory, test_case_name)):
+                    test_case_manifest = read_json_file(os.path.join(test_cases_directory, test_case_name, project_name, test_case_manifest_file_name), {})
+                    if isinstance(test_case_manifest, dict) and isinstance(test_case_manifest.get("files"), dict):
+                        for file_info in test_case_manifest["files"].values():
+                            if isinstance(file_info, dict) and get_string_length(str(file_info.get("digest") or "")) > 0:
+                                referenced_digests.add(file_info["digest"])
+
+            return referenced_digests
 
-    @property
-    def get_reference_project_type(self):
-        """
-        The function is defining target project type
-        :return:
-        """
+        def collect_garbage(self):
+            """
+            The function is removing the store objects which are not referenced by any test case manifest.
+            The objects just stored by other runs are not referenced yet, so the garbage is collected only if no other run is using the store
+            :return:
+            """
 
-        return self.reference_project_type
+            print_to_stdout(self.msip_ese_object, "Collecting garbage of the object store:\n\t" + self.store_directory)
 
-    def set_reference_project_name(self, value):
-        """
-        The function is defining projects root directory, by default it is /remote/cad-rep/projects
-        :param value:
-        :return:
-        """
+            with self.store_lock:
+                if not self.usage_lock.acquire(blocking=False):
+                    self.usage_lock.acquire(shared_lock=True)
+                    print_to_stdout(self.msip_ese_object, "WARNING!:\tThe object store is used by other run. Skipping garbage collection")
+                    return
+                try:
+                    with self.index_lock:
+                        self.merge_saved_index()
+                        self.remove_garbage_objects(self.get_referenced_digests())
+                        if write_json_file(self.index_file, self.store_index):
+                            self.store_changed = False
+                finally:
+                    self.usage_lock.acquire(shared_lock=True)
 
-        self.reference_project_name = value
+            print_to_stdout(self.msip_ese_object, "Object store garbage collection completed successfully")
 
-    @property
-    def get_reference_project_name(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+        def remove_garbage_objects(self, referenced_digests):
+            """
+            The function is removing the objects which are not referenced from the store index and the object files which are not in the store index.
+            Should be called with the index lock
+            :param referenced_digests:
+            :return:
+            """
 
-        return self.reference_project_name
+            with self.store_lock:
+                all_objects = self.store_index["objects"]
+                for file_digest in sorted(all_objects.keys()):
+                    if file_digest not in referenced_digests:
+                        print_to_stdout(self.msip_ese_object, "\tRemoving object\t" + self.get_object_path(file_digest))
+                        del all_objects[file_digest]
+                        self.store_changed = True
+
+                for zip_file in list(self.store_index["packages"].keys()):
+                    package_members = self.store_index["packages"][zip_file]["members"]
+                    if not os.path.isfile(zip_file) or any(file_digest not in all_objects for file_digest in package_members.values()):
+                        del self.store_index["packages"][zip_file]
+                        self.store_changed = True
+
+                # Removing all object files which are not in the index, including the objects removed above
+                for directory_entry in scan_directory_files(self.store_directory):
+                    if get_file_path(directory_entry.path) != self.store_directory and directory_entry.name not in all_objects:
+                        try:
+                            os.remove(directory_entry.path)
+                        except OSError:
+                            print_to_stdout(self.msip_ese_object, "\tCannot remove object\t" + directory_entry.path)
+                for object_directory_name in get_directory_items_list(self.store_directory):
+                    if os.path.isdir(os.path.join(self.store_directory, object_directory_name)):
+                        try:
+                            os.rmdir(os.path.join(self.store_directory, object_directory_name))
+                        except OSError:
+                            continue
 
-    def set_reference_project_release(self, value):
+    class RunJournal:
         """
-        The function is defining projects root directory, by default it is /remote/cad-rep/projects
-        :param value:
-        :return:
+        The append-only journal of the units of work (sample extract, test case update, GDS config, PEX and SIM) in the LOGS directory.
+        Each unit has START record and DONE or FAILED record. With -resume option the units finished by the previous runs are skipped
         """
 
-        self.reference_project_release = value
+        def __init__(self, msip_ese_object):
+            """
+            Initialisation of the class, reading the units finished by the previous runs
+            """
 
-    @property
-    def get_reference_project_release(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+            self.msip_ese_object = msip_ese_object
+            self.journal_file = os.path.join(self.msip_ese_object.get_log_directory, run_journal_file_name)
+            self.journal_lock = threading.Lock()
 
-        return self.reference_project_release
+            # The next records should not be appended to the partially written record of the killed run
+            self.remove_partial_record(self.journal_file)
 
-    def set_target_project_metal_stack_list(self, list_value):
-        """
-        The function is defining projects root directory, by default it is /remote/cad-rep/projects
-        :param list_value:
-        :return:
-        """
+            # Set of (unit type, unit name) finished since the last not resumed run
+            self.finished_units = self.read_finished_units(self.journal_file)
 
-        self.target_project_metal_stack_list = []
-        for value in list_value:
-            self.target_project_metal_stack_list.append(value)
+        @staticmethod
+        def remove_partial_record(journal_file):
+            """
+            The function is truncating the journal to its last complete record, if the script was killed during the record writing
+            :param journal_file:
+            :return:
+            """
 
-    @property
-    def get_target_project_metal_stack_list(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+            try:
+                with open(journal_file, mode="rb+") as journal_file_object:
+                    journal_content = journal_file_object.read()
+                    if get_string_length(journal_content) > 0 and not journal_content.endswith(b"\n"):
+                        journal_file_object.truncate(journal_content.rfind(b"\n") + 1)
+            except (IOError, OSError):
+                return
 
-        return self.target_project_metal_stack_list
+        @staticmethod
+        def read_finished_units(journal_file):
+            """
+            The function is replaying the journal and returning the units which are finished since the last not resumed run
+            :param journal_file:
+            :return:
+            """
 
-    def set_reference_project_metal_stack_list(self, list_value):
-        """
-        The function is defining projects root directory, by default it is /remote/cad-rep/projects
-        :param list_value:
-        :return:
-        """
+            finished_units = set()
 
-        self.reference_project_metal_stack_list = []
-        for value in list_value:
-            self.reference_project_metal_stack_list.append(value)
+            try:
+                journal_file_object = open(journal_file, mode="r")
+            except IOError:
+                return finished_units
 
-    @property
-    def get_reference_project_metal_stack_list(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+            for line in journal_file_object:
+                try:
+                    journal_record = json.loads(line)
+                except ValueError:
+                    # The damaged record cannot be replayed
+                    continue
+
+                if journal_record.get("unit") == "RUN":
+                    if journal_record.get("state") == "START" and not journal_record.get("resume"):
+                        finished_units.clear()
+                elif journal_record.get("state") == "DONE":
+                    finished_units.add((journal_record.get("unit"), journal_record.get("name")))
+                else:
+                    finished_units.discard((journal_record.get("unit"), journal_record.get("name")))
 
-        return self.reference_project_metal_stack_list
+            journal_file_object.close()
 
-    def set_project_test_cases(self, hash_value):
-        """
-        The project is setting project_test_cases hash
-        :param hash_value:
-        :return:
-        """
+            return finished_units
 
-        self.project_test_cases = hash_value
+        def record(self, unit_type, unit_name, state, details=None):
+            """
+            The function is appending the record into the journal. The record is written to the disk immediately, so it is kept if the script is killed
+            :param unit_type:
+            :param unit_name:
+            :param state: START/DONE/FAILED
+            :param details: Hash of the additional record values
+            :return:
+            """
 
-    @property
-    def get_project_test_cases(self):
-        """
-        The function is returning project_test_cases
-        :return:
-        """
+            journal_record = {"time": get_current_time(), "unit": unit_type, "name": unit_name, "state": state}
+            if details is not None:
+                journal_record.update(details)
 
-        return self.project_test_cases
+            with self.journal_lock:
+                try:
+                    with open(self.journal_file, mode="a") as journal_file_object:
+                        journal_file_object.write(json.dumps(journal_record, sort_keys=True) + "\n")
+                        journal_file_object.flush()
+                        os.fsync(journal_file_object.fileno())
+                except (IOError, OSError):
+                    print_to_stdout(self.msip_ese_object, "WARNING!:\tCannot write the run journal:\t" + self.journal_file)
+
+        def check_if_unit_is_finished(self, unit_type, unit_name):
+            """
+            The function is checking if the unit is finished by the previous run, which is resumed
+            :param unit_type:
+            :param unit_name:
+            :return: True if the unit is finished and -resume option is used, otherwise False
+            """
 
-    def set_executed_test_case_package(self, value):
-        """
-        The function is defining projects root directory, by default it is /remote/cad-rep/projects
-        :param value:
-        :return:
-        """
+            if not self.msip_ese_object.get_resume_option:
+                return False
 
-        self.executed_test_case_package = value
+            with self.journal_lock:
+                return (unit_type, unit_name) in self.finished_units
 
-    @property
-    def get_executed_test_case_package(self):
-        """
-        The function is returning reports directory
-        :return:
-        """
+        def run_unit(self, unit_type, unit_name, unit_function, unit_arguments=(), failed_result_check=None):
+            """
+            The function is executing the unit function between the START and DONE/FAILED records of the unit
+            :param unit_type:
+            :param unit_name:
+            :param unit_function:
+            :param unit_arguments:
+            :param failed_result_check: Function returning True if the unit function result means that the unit is failed
+            :return: The unit function result, or None if the unit is finished by the resumed run
+            """
 
-        return self.executed_test_case_package
+            if self.check_if_unit_is_finished(unit_type, unit_name):
+                print_to_stdout(self.msip_ese_object, "The unit is finished by the previous run, skipping:\t" + unit_type + "\t" + unit_name)
+                return None
 
-    # The MsipEse class methods
+            self.record(unit_type, unit_name, "START")
+            try:
+                unit_result = unit_function(*unit_arguments)
+            except (Exception, SystemExit) as unit_exception:
+                self.record(unit_type, unit_name, "FAILED", {"error": str(unit_exception)})
+                raise
 
-    # --------------------------------------------------- #
-    # ----------------- Internal Class ------------------ #
-    # --------------------------------------------------- #
+            if failed_result_check is not None and failed_result_check(unit_result):
+                self.record(unit_type, unit_name, "FAILED", {"result": str(unit_result)})
+            else:
+                self.record(unit_type, unit_name, "DONE")
+
+            return unit_result
 
     class ProjectEnvironment:
         """
@@ -1989,6 +4520,12 @@ class MsipEse:
 
             self.msip_ese_object = msip_ese_object
 
+            # The sample runscript fingerprints of the current setup. Key = (project type, project name, project release, metal stack), Value = fingerprint
+            self.sample_runscript_fingerprints = {}
+
+            # The sample runscript files which are up to date with the current setup. Contains the same keys as sample_runscript_fingerprints
+            self.up_to_date_sample_runscripts = set()
+
         def setup_target_project_name(self):
             """
             The function is returning project name value
@@ -2035,6 +4572,12 @@ class MsipEse:
             elif self.msip_ese_object.excel_setup[available_excel_options[16]] is not None:
                 self.msip_ese_object.set_target_project_release(self.msip_ese_object.excel_setup[available_excel_options[16]])
                 print_to_stdout(self.msip_ese_object, "FOUND TARGET PROJECT RELEASE\t" + str(self.msip_ese_object.get_target_project_release))
+            elif self.msip_ese_object.get_target_project_type is not None and self.msip_ese_object.get_project_catalog.get_latest_project_release(
+                    self.msip_ese_object.get_target_project_type, self.msip_ese_object.get_target_project_name) is not None:
+                self.msip_ese_object.set_target_project_release(self.msip_ese_object.get_project_catalog.get_latest_project_release(
+                    self.msip_ese_object.get_target_project_type, self.msip_ese_object.get_target_project_name))
+                print_to_stdout(self.msip_ese_object, "WARNING!:\tTarget project release is not defined. Using latest release\t" + str(
+                    self.msip_ese_object.get_target_project_release))
             else:
                 print_to_stderr(self.msip_ese_object, "Cannot find target project release. Please check script/excel file inputs")
 
@@ -2052,6 +4595,12 @@ class MsipEse:
             elif self.msip_ese_object.excel_setup[available_excel_options[18]] is not None:
                 self.msip_ese_object.set_reference_project_release(self.msip_ese_object.excel_setup[available_excel_options[18]])
                 print_to_stdout(self.msip_ese_object, "FOUND REFERENCE PROJECT RELEASE\t" + str(self.msip_ese_object.get_reference_project_release))
+            elif self.msip_ese_object.get_reference_project_type is not None and self.msip_ese_object.get_project_catalog.get_latest_project_release(
+                    self.msip_ese_object.get_reference_project_type, self.msip_ese_object.get_reference_project_name) is not None:
+                self.msip_ese_object.set_reference_project_release(self.msip_ese_object.get_project_catalog.get_latest_project_release(
+                    self.msip_ese_object.get_reference_project_type, self.msip_ese_object.get_reference_project_name))
+                print_to_stdout(self.msip_ese_object, "WARNING!:\tReference project release is not defined. Using latest release\t" + str(
+                    self.msip_ese_object.get_reference_project_release))
             else:
                 print_to_stderr(self.msip_ese_object, "Cannot find reference project name. Please check script/excel file inputs")
 
@@ -2066,15 +4615,10 @@ class MsipEse:
 
             projects_root_dir = self.msip_ese_object.get_projects_root_dir
 
-            project_all_types = get_directory_items_list(projects_root_dir)
+            project_type = self.msip_ese_object.get_project_catalog.find_project_type(project_name)
 
-            if project_all_types is not None:
-                for project_type in project_all_types:
-                    available_project_names = get_directory_items_list(os.path.join(projects_root_dir, project_type))
-                    for value in available_project_names:
-                        if project_name == value:
-                            return project_type
-                print_to_stderr(self.msip_ese_object, "Cannot find project '" + project_name + "' project type under directory\t'" + str(projects_root_dir) + "'")
+            if project_type is not None:
+                return project_type
             else:
                 print_to_stderr(self.msip_ese_object, "Cannot find project '" + project_name + "' project type under directory\t'" + str(projects_root_dir) + "'")
 
@@ -2131,11 +4675,10 @@ class MsipEse:
             """
 
             if get_list_length(self.msip_ese_object.get_target_project_metal_stack_list) < 1:
-                self.msip_ese_object.set_target_project_metal_stack_list(self.get_metal_stack_dir_list(os.path.join(self.msip_ese_object.get_projects_root_dir,
-                                                                                                                    self.msip_ese_object.get_target_project_type,
-                                                                                                                    self.msip_ese_object.get_target_project_name,
-                                                                                                                    self.msip_ese_object.get_target_project_release,
-                                                                                                                    project_cad_directory_name)))
+                self.msip_ese_object.set_target_project_metal_stack_list(self.msip_ese_object.get_project_catalog.get_project_metal_stacks(
+                    self.msip_ese_object.get_target_project_type,
+                    self.msip_ese_object.get_target_project_name,
+                    self.msip_ese_object.get_target_project_release))
                 print_to_stdout(self.msip_ese_object, "FOUND TARGET PROJECT METAL STACKS LIST:\t" + str(self.msip_ese_object.get_target_project_metal_stack_list))
             else:
                 print_to_stdout(self.msip_ese_object, "FOUND TARGET PROJECT METAL STACKS LIST:\t" + str(self.msip_ese_object.get_target_project_metal_stack_list))
@@ -2147,11 +4690,10 @@ class MsipEse:
             """
 
             if get_list_length(self.msip_ese_object.get_reference_project_metal_stack_list) < 1:
-                self.msip_ese_object.set_reference_project_metal_stack_list(self.get_metal_stack_dir_list(os.path.join(self.msip_ese_object.get_projects_root_dir,
-                                                                                                                       self.msip_ese_object.get_reference_project_type,
-                                                                                                                       self.msip_ese_object.get_reference_project_name,
-                                                                                                                       self.msip_ese_object.get_reference_project_release,
-                                                                                                                       project_cad_directory_name)))
+                self.msip_ese_object.set_reference_project_metal_stack_list(self.msip_ese_object.get_project_catalog.get_project_metal_stacks(
+                    self.msip_ese_object.get_reference_project_type,
+                    self.msip_ese_object.get_reference_project_name,
+                    self.msip_ese_object.get_reference_project_release))
                 print_to_stdout(self.msip_ese_object, "FOUND REFERENCE PROJECT METAL STACKS LIST:\t" + str(self.msip_ese_object.get_reference_project_metal_stack_list))
             else:
                 print_to_stdout(self.msip_ese_object, "FOUND REFERENCE PROJECT METAL STACKS LIST:\t" + str(self.msip_ese_object.get_reference_project_metal_stack_list))
@@ -2166,16 +4708,53 @@ class MsipEse:
             print_to_stdout(self.msip_ese_object, "SEARCHING FOR PROJECT INFO\n")
 
             self.setup_target_project_name()
-            self.setup_target_project_release()
             self.setup_target_project_type()
+            self.setup_target_project_release()
             self.setup_target_project_metal_stack_list()
 
             self.setup_reference_project_name()
             if self.msip_ese_object.check_for_reference_project_execution():
-                self.setup_reference_project_release()
                 self.setup_reference_project_type()
+                self.setup_reference_project_release()
                 self.setup_reference_project_metal_stack_list()
 
+        def limit_metal_stacks(self, required_metal_stacks):
+            """
+            The function is limiting target and reference project metal stacks to the metal stacks used by test cases.
+            The script is stopped if none of the project metal stacks is used by test cases
+            :param required_metal_stacks:
+            :return:
+            """
+
+            if get_list_length(required_metal_stacks) < 1:
+                print_to_stdout(self.msip_ese_object, "No any test case metal stack found. Using all metal stacks of the project(s)")
+                return
+
+            print_to_stdout(self.msip_ese_object, "METAL STACKS USED BY TEST CASES:\t" + str(sorted(required_metal_stacks)))
+
+            for metal_stack in sorted(required_metal_stacks):
+                if metal_stack not in self.msip_ese_object.get_target_project_metal_stack_list:
+                    print_to_stdout(self.msip_ese_object, "WARNING!:\tTarget project does not contain metal stack:\t" + metal_stack)
+
+            target_metal_stacks = [metal_stack for metal_stack in self.msip_ese_object.get_target_project_metal_stack_list if metal_stack in required_metal_stacks]
+            if get_list_length(target_metal_stacks) < 1:
+                print_to_stderr(self.msip_ese_object, "No any target project metal stack is used by test cases. Please check \"METAL_STACK:\" line of the GDS config files")
+            self.msip_ese_object.set_target_project_metal_stack_list(target_metal_stacks)
+            print_to_stdout(self.msip_ese_object, "TARGET PROJECT METAL STACKS LIST:\t" + str(self.msip_ese_object.get_target_project_metal_stack_list))
+
+            if self.msip_ese_object.check_for_reference_project_execution():
+                for metal_stack in sorted(required_metal_stacks):
+                    if metal_stack not in self.msip_ese_object.get_reference_project_metal_stack_list:
+                        print_to_stdout(self.msip_ese_object, "WARNING!:\tReference project does not contain metal stack:\t" + metal_stack)
+
+                reference_metal_stacks = [metal_stack for metal_stack in self.msip_ese_object.get_reference_project_metal_stack_list
+                                          if metal_stack in required_metal_stacks]
+                if get_list_length(reference_metal_stacks) < 1:
+                    print_to_stderr(self.msip_ese_object,
+                                    "No any reference project metal stack is used by test cases. Please check \"METAL_STACK:\" line of the GDS config files")
+                self.msip_ese_object.set_reference_project_metal_stack_list(reference_metal_stacks)
+                print_to_stdout(self.msip_ese_object, "REFERENCE PROJECT METAL STACKS LIST:\t" + str(self.msip_ese_object.get_reference_project_metal_stack_list))
+
         @staticmethod
         def generate_ude_command(project_type, project_name, project_release, project_metal_stack, run_directory):
             """
@@ -2216,12 +4795,12 @@ ude \\
 
             target_library_path = create_directories_hierarchy(run_directory, ["LIB", sample_library_name])
 
-            tcl_command = str("""set newSampleLibrary [dm::createLib SampleLibrary -path $RUN_DIR]
+            tcl_command = str("""set newSampleLibrary [dm::createLib $LIBRARY_NAME -path $RUN_DIR]
 
 db::attachTech $newSampleLibrary -refLibName devices
 db::attachTech $newSampleLibrary -refLibName devices
 
-set newSampleCell [dm::createCell SampleExtract -libName SampleLibrary]
+set newSampleCell [dm::createCell SampleExtract -libName $LIBRARY_NAME]
 set layoutCell [dm::createCellView layout -cell $newSampleCell -viewType maskLayout]
 set schematicCell [dm::createCellView schematic -cell $newSampleCell -viewType schematic]
 
@@ -2233,7 +4812,7 @@ de::close [de::getContexts]
 set schematicDesign [de::open $schematicCell]
 se::createInst rpp -libName devices -cellName rpp -viewName symbol -design [ed] -origin {0 0}
 de::save [de::getContexts]
-de::close [de::getContexts]""").replace("$RUN_DIR", target_library_path)
+de::close [de::getContexts]""").replace("$RUN_DIR", target_library_path).replace("$LIBRARY_NAME", sample_library_name)
 
             # Before used "dm::addToLibDefs {0} -path {2}/{0}" + below
             tcl_command += str("\nMSIP_PV::runBatchList lpe RCXT {0} SampleExtract layout {1} {2}/config").format(sample_library_name, tool_name, run_directory)
@@ -2269,26 +4848,31 @@ set outDir "{1}" \n""".format(run_directory, output_directory)
 
             return ""
 
-        def remove_existing_sample_library(self, project_type, project_name, project_release, lib_path):
+        def remove_existing_sample_library(self, project_type, project_name, project_release, lib_path, library_name):
             """
             The function is checking for sample file present and removing if it is exist
             :return:
             """
 
+            import shutil
+
             print_to_stdout(self.msip_ese_object, "Removing Sample Library from Run directory if it is exist, and creating new one")
 
             user_home_directory = os.environ["HOME"]
             project_lib_defs_file = os.path.join(user_home_directory, "cd_lib", project_type, project_name, project_release, "design")
-            lib_defs_file_object = open_file_for_reading(project_lib_defs_file, "lib.defs")
-            new_lib_defs_content = ""
-            for line in lib_defs_file_object.readlines():
-                if "DEFINE SampleLibrary " not in line:
-                    new_lib_defs_content += line
 
-            lib_defs_file_object.close()
-            lib_defs_file_object = open_file_for_writing(project_lib_defs_file, "lib.defs")
-            lib_defs_file_object.write(new_lib_defs_content)
-            lib_defs_file_object.close()
+            # The lib.defs file is shared between all metal stacks of the project
+            with lib_defs_file_lock:
+                lib_defs_file_object = open_file_for_reading(project_lib_defs_file, "lib.defs")
+                new_lib_defs_content = ""
+                for line in lib_defs_file_object.readlines():
+                    if "DEFINE " + library_name + " " not in line:
+                        new_lib_defs_content += line
+
+                lib_defs_file_object.close()
+                lib_defs_file_object = open_file_for_writing(project_lib_defs_file, "lib.defs")
+                lib_defs_file_object.write(new_lib_defs_content)
+                lib_defs_file_object.close()
 
             print_to_stdout(self.msip_ese_object, "Removing sample library directory\t" + os.path.join(lib_path, "LIB"))
 
@@ -2340,7 +4924,7 @@ set outDir "{1}" \n""".format(run_directory, output_directory)
             ude_config_command_file_object.writelines(config_command)
             ude_config_command_file_object.close()
 
-            self.remove_existing_sample_library(project_type, project_name, project_release, command_run_directory)
+            self.remove_existing_sample_library(project_type, project_name, project_release, command_run_directory, sample_library_name)
 
             process = execute_external_command(
                 os.path.join(command_run_directory, "execute_ude_" + project_type + "_" + project_name + "_" + project_release + "_" + project_metal_stack))
@@ -2356,7 +4940,7 @@ set outDir "{1}" \n""".format(run_directory, output_directory)
             :param metal_stack:
             :param run_dir:
             :param pex_tool_name:
-            :return:
+            :return: None if the extraction is completed successfully, or the error text
             """
 
             for sample_library_name in project_sample_oa_library_names_list:
@@ -2365,110 +4949,304 @@ set outDir "{1}" \n""".format(run_directory, output_directory)
                 print_to_stdout(self.msip_ese_object, "GENERATING SAMPLE LIBRARY EXTRACTION FOR METAL STACK:\t" + str(metal_stack))
                 # untar_zip_package(os.path.join(self.msip_ese_object.get_data_directory, project_sample_oa_library_directory_name, sample_library_name + tar_file_extension),
                 #                   target_dir)
-                process = self.generate_sample_environment(str(pex_tool_name).lower(), sample_library_name, project_type, project_name, project_release, metal_stack, target_dir,
-                                                           target_dir)
+                # Outputs of the previous runs should not be taken as the outputs of the current run
+                previous_output_files = self.get_ude_extract_output_files(target_dir, pex_tool_name)
+                # Each metal stack has its own library, as the metal stacks are extracted in parallel with the same lib.defs file
+                process = self.generate_sample_environment(str(pex_tool_name).lower(), sample_library_name + "_" + metal_stack, project_type, project_name, project_release,
+                                                           metal_stack, target_dir, target_dir)
                 print_to_stdout(self.msip_ese_object, "Executing sample extraction command\t" + target_dir)
-                time.sleep(sample_process_wait_time * 60)  # 3 * 60sec = 3 minutes
-                report_text_if_long_run = str("\n\tThe Sample Runscript execution is take more than "
-                                              "" + str(sample_process_wait_time) + " min. ESE flow is killed the sample runscript execution. Please check what is caused the issue"
-                                                                                   "\n\tPath of the command file is:\t" + target_dir + "\n" + str(process.stdout.read()))
-                if not process_timeout(process, report_text_if_long_run):
+                wait_time = sample_process_tool_wait_time.get(str(pex_tool_name).upper(), sample_process_wait_time)
+                process_completed = wait_for_process_completion(process, wait_time * 60, sample_process_poll_interval,
+                                                                lambda: self.check_for_ude_extract_outputs(target_dir, pex_tool_name, previous_output_files),
+                                                                sample_process_stable_polls)
+                if process_completed:
                     print_to_stdout(self.msip_ese_object, "\nEnvironment executed successfully\n")
                 else:
-                    print_to_stderr(self.msip_ese_object, report_text_if_long_run)
+                    process_timeout(process, "")
+                    report_text_if_long_run = str("\n\tThe Sample Runscript execution is take more than "
+                                                  "" + str(wait_time) + " min. ESE flow is killed the sample runscript execution. Please check what is caused the issue"
+                                                                        "\n\tPath of the command file is:\t" + target_dir + "\n" + process.get_output_tail())
+                    return report_text_if_long_run
+
+            return None
+
+        def run_sample_extract(self, pex_tool_name, project_type, project_name, project_release, metal_stack, run_dir):
+            """
+            The function is executing sample extract as the unit of the run journal
+            :param pex_tool_name:
+            :param project_type:
+            :param project_name:
+            :param project_release:
+            :param metal_stack:
+            :param run_dir:
+            :return: None if the extraction is completed successfully or finished by the resumed run, or the error text
+            """
+
+            return self.msip_ese_object.get_run_journal.run_unit("SAMPLE_EXTRACT", "/".join([project_type, project_name, project_release, metal_stack]),
+                                                                 self.extract_sample_cell,
+                                                                 [pex_tool_name, project_type, project_name, project_release, metal_stack, run_dir],
+                                                                 lambda job_error_text: job_error_text is not None)
+
+        def get_sample_runscript_fingerprint(self, project_type, project_name, project_release, metal_stack, pex_tool_name):
+            """
+            The function is returning the fingerprint of the inputs of the sample runscript generation: the project, metal stack, PEX tool and the project env.tcl file
+            :param project_type:
+            :param project_name:
+            :param project_release:
+            :param metal_stack:
+            :param pex_tool_name:
+            :return:
+            """
+
+            environment_file = os.path.join(self.msip_ese_object.get_projects_root_dir, project_type, project_name, project_release, project_cad_directory_name, metal_stack,
+                                            project_environment_file_name)
+
+            fingerprint_values = [project_type, project_name, project_release, metal_stack, str(pex_tool_name).lower(), get_file_digest(environment_file)]
+
+            # The decks and setup files sourced by the env.tcl file can be changed in place, so their content is the part of the fingerprint
+            for setup_file in get_referenced_files(environment_file):
+                fingerprint_values += [setup_file, get_file_digest(setup_file)]
+
+            return hashlib.sha1("\n".join([str(value) for value in fingerprint_values]).encode("utf-8")).hexdigest()
+
+        def get_sample_runscript_directory(self, project_type, project_name, project_release, metal_stack):
+            """
+            The function is returning the directory of the stored sample runscript file
+            :return:
+            """
+
+            return os.path.join(self.msip_ese_object.get_data_directory, project_sample_runscript_location_dir_name, project_type, project_name, project_release, metal_stack,
+                                project_extract_directory_name)
+
+        def check_if_sample_runscript_is_up_to_date(self, project_type, project_name, project_release, metal_stack):
+            """
+            The function is checking if the stored sample runscript file was generated with the current project setup
+            :return: True if up to date, False if not
+            """
+
+            fingerprint = self.sample_runscript_fingerprints.get((project_type, project_name, project_release, metal_stack))
+            sample_runscript_directory = self.get_sample_runscript_directory(project_type, project_name, project_release, metal_stack)
+
+            if fingerprint is None or not get_file_size(os.path.join(sample_runscript_directory, project_sample_runscript_file_name)):
+                return False
+
+            if not check_for_file_existence(sample_runscript_directory, project_sample_runscript_fingerprint_file_name):
+                return False
+
+            fingerprint_file_object = open_file_for_reading(sample_runscript_directory, project_sample_runscript_fingerprint_file_name)
+            stored_fingerprint = fingerprint_file_object.read().strip()
+            fingerprint_file_object.close()
+
+            return stored_fingerprint == fingerprint
+
+        def write_sample_runscript_fingerprint(self, project_type, project_name, project_release, metal_stack):
+            """
+            The function is storing the current setup fingerprint next to the sample runscript file
+            :return:
+            """
+
+            fingerprint = self.sample_runscript_fingerprints.get((project_type, project_name, project_release, metal_stack))
+            sample_runscript_directory = self.get_sample_runscript_directory(project_type, project_name, project_release, metal_stack)
+
+            if fingerprint is not None and get_file_size(os.path.join(sample_runscript_directory, project_sample_runscript_file_name)):
+                fingerprint_file_object = open_file_for_writing(sample_runscript_directory, project_sample_runscript_fingerprint_file_name)
+                fingerprint_file_object.write(fingerprint + "\n")
+                fingerprint_file_object.close()
+
+        def get_sample_extract_jobs(self):
+            """
+            The function is returning all sample extraction jobs of target and reference projects. Each job is the extract_sample_cell arguments list
+            :return:
+            """
+
+            all_jobs = []
+
+            for metal_stack in self.msip_ese_object.get_target_project_metal_stack_list:
+                target_run_path = create_directories_hierarchy(self.msip_ese_object.get_script_run_directory, [self.msip_ese_object.get_target_project_type,
+                                                                                                               self.msip_ese_object.get_target_project_name,
+                                                                                                               self.msip_ese_object.get_target_project_release,
+                                                                                                               metal_stack,
+                                                                                                               project_extract_directory_name])
+
+                all_jobs.append([self.msip_ese_object.get_target_project_pex_tool_name,
+                                 self.msip_ese_object.get_target_project_type,
+                                 self.msip_ese_object.get_target_project_name,
+                                 self.msip_ese_object.get_target_project_release,
+                                 metal_stack,
+                                 target_run_path])
+
+                self.sample_runscript_fingerprints[tuple(all_jobs[-1][1:5])] = self.get_sample_runscript_fingerprint(
+                    self.msip_ese_object.get_target_project_type,
+                    self.msip_ese_object.get_target_project_name,
+                    self.msip_ese_object.get_target_project_release,
+                    metal_stack,
+                    self.msip_ese_object.get_target_project_pex_tool_name)
+
+            if self.msip_ese_object.check_for_reference_project_execution():
+                for metal_stack in self.msip_ese_object.get_reference_project_metal_stack_list:
+                    reference_run_path = create_directories_hierarchy(self.msip_ese_object.get_script_run_directory, [self.msip_ese_object.get_reference_project_type,
+                                                                                                                      self.msip_ese_object.get_reference_project_name,
+                                                                                                                      self.msip_ese_object.get_reference_project_release,
+                                                                                                                      metal_stack,
+                                                                                                                      project_extract_directory_name])
+
+                    all_jobs.append([self.msip_ese_object.get_reference_project_pex_tool_name,
+                                     self.msip_ese_object.get_reference_project_type,
+                                     self.msip_ese_object.get_reference_project_name,
+                                     self.msip_ese_object.get_reference_project_release,
+                                     metal_stack,
+                                     reference_run_path])
+
+                    self.sample_runscript_fingerprints[tuple(all_jobs[-1][1:5])] = self.get_sample_runscript_fingerprint(
+                        self.msip_ese_object.get_reference_project_type,
+                        self.msip_ese_object.get_reference_project_name,
+                        self.msip_ese_object.get_reference_project_release,
+                        metal_stack,
+                        self.msip_ese_object.get_reference_project_pex_tool_name)
+
+            return all_jobs
 
         def run_all_sample_extracts(self):
             """
-            The function is executing sample extract
+            The function is executing sample extract for all metal stacks of target and reference projects in parallel
             :return:
             """
 
             print_to_stdout(self.msip_ese_object, "new line")
             print_to_stdout(self.msip_ese_object, "RUNNING SAMPLE EXTRACT STEP\n")
 
-            all_target_metal_stack = self.msip_ese_object.get_target_project_metal_stack_list
+            all_jobs = []
+            for job_arguments in self.get_sample_extract_jobs():
+                if self.check_if_sample_runscript_is_up_to_date(*job_arguments[1:5]):
+                    print_to_stdout(self.msip_ese_object, "Sample runscript is up to date, skipping sample extraction for:\t" + "/".join(job_arguments[1:5]))
+                    self.up_to_date_sample_runscripts.add(tuple(job_arguments[1:5]))
+                else:
+                    all_jobs.append(job_arguments)
+
+            print_to_stdout(self.msip_ese_object, "Executing " + str(get_list_length(all_jobs)) + " sample extraction(s). Maximum number of parallel jobs:\t" + str(
+                self.msip_ese_object.get_max_parallel_jobs))
+
+            failed_jobs_report = ""
+            for job_arguments, job_result, job_exception in run_parallel_jobs(self.run_sample_extract, all_jobs, self.msip_ese_object.get_max_parallel_jobs):
+                if job_exception is not None:
+                    job_error_text = str(job_exception)
+                elif job_result is not None:
+                    job_error_text = job_result
+                else:
+                    continue
+                failed_jobs_report += "\n\tPROJECT:\t" + "/".join(job_arguments[1:4]) + "\tMETAL STACK:\t" + job_arguments[4] + "\n\t" + job_error_text
+
+            if get_string_length(failed_jobs_report) > 0:
+                print_to_stderr(self.msip_ese_object, "Sample extraction failed for the following job(s):" + failed_jobs_report)
+
+        @staticmethod
+        def get_ude_extract_output_files(run_directory, tool_name):
+            """
+            The function is returning hash of the LVS report and extract files under the run directory. Key = file path, Value = [file size, file modification time]
+            :param run_directory:
+            :param tool_name:
+            :return:
+            """
+
+            output_files = {}
+
+            for file_entry in scan_directory_files(run_directory):
+                if file_entry.name.endswith(project_lvs_report_extensions[tool_name]) or file_entry.name.endswith(project_extract_file_extension):
+                    try:
+                        file_stat = file_entry.stat()
+                    except OSError:
+                        continue
+                    output_files[file_entry.path] = [file_stat.st_size, file_stat.st_mtime]
+
+            return output_files
+
+        @staticmethod
+        def find_ude_extract_output_files(run_directory, tool_name, previous_output_files=None, required_outputs=("LVS_REPORT", "EXTRACT_FILE", "SAMPLE_RUNSCRIPT")):
+            """
+            The function is searching for non empty LVS report, extract file and sample runscript file under the run directory in one pass.
+            The search is stopped as soon as all required outputs are found
+            :param run_directory:
+            :param tool_name:
+            :param previous_output_files: The output files hash before the sample extraction start. Such files are not taken as outputs
+            :param required_outputs:
+            :return: Hash with LVS_REPORT, EXTRACT_FILE and SAMPLE_RUNSCRIPT keys. Value = file path or None if not found
+            """
+
+            if previous_output_files is None:
+                previous_output_files = {}
+
+            output_files = {"LVS_REPORT": None, "EXTRACT_FILE": None, "SAMPLE_RUNSCRIPT": None}
 
-            # Creating running directory
-            for metal_stack in all_target_metal_stack:
-                target_run_path = create_directories_hierarchy(self.msip_ese_object.get_script_run_directory, [self.msip_ese_object.get_target_project_type,
-                                                                                                               self.msip_ese_object.get_target_project_name,
-                                                                                                               self.msip_ese_object.get_target_project_release,
-                                                                                                               metal_stack,
-                                                                                                               project_extract_directory_name])
+            for file_entry in scan_directory_files(run_directory):
+                if file_entry.name == project_sample_runscript_file_name:
+                    output_type = "SAMPLE_RUNSCRIPT"
+                elif file_entry.name.endswith(project_lvs_report_extensions[tool_name]):
+                    output_type = "LVS_REPORT"
+                elif file_entry.name.endswith(project_extract_file_extension):
+                    output_type = "EXTRACT_FILE"
+                else:
+                    continue
 
-                self.extract_sample_cell(self.msip_ese_object.get_target_project_pex_tool_name,
-                                         self.msip_ese_object.get_target_project_type,
-                                         self.msip_ese_object.get_target_project_name,
-                                         self.msip_ese_object.get_target_project_release,
-                                         metal_stack,
-                                         target_run_path)
+                if output_files[output_type] is not None:
+                    continue
 
-            if self.msip_ese_object.check_for_reference_project_execution():
-                all_reference_metal_stack = self.msip_ese_object.get_reference_project_metal_stack_list
+                try:
+                    file_stat = file_entry.stat()
+                except OSError:
+                    continue
 
-                for metal_stack in all_reference_metal_stack:
-                    reference_run_path = create_directories_hierarchy(self.msip_ese_object.get_script_run_directory, [self.msip_ese_object.get_reference_project_type,
-                                                                                                                      self.msip_ese_object.get_reference_project_name,
-                                                                                                                      self.msip_ese_object.get_reference_project_release,
-                                                                                                                      metal_stack,
-                                                                                                                      project_extract_directory_name])
+                if file_stat.st_size > 0 and previous_output_files.get(file_entry.path) != [file_stat.st_size, file_stat.st_mtime]:
+                    output_files[output_type] = file_entry.path
+                    if all(output_files[required_output] is not None for required_output in required_outputs):
+                        break
 
-                    self.extract_sample_cell(self.msip_ese_object.get_reference_project_pex_tool_name,
-                                             self.msip_ese_object.get_reference_project_type,
-                                             self.msip_ese_object.get_reference_project_name,
-                                             self.msip_ese_object.get_reference_project_release,
-                                             metal_stack,
-                                             reference_run_path)
+            return output_files
 
-        def check_for_ude_extract_flow_correctness(self, run_directory, tool_name):
+        def check_for_ude_extract_outputs(self, run_directory, tool_name, previous_output_files):
             """
-            The script is checking for .LVS_ERRORS file correctness and extract file existence
+            The function is checking if the sample extraction produced new non empty LVS report and extract files
             :param run_directory:
             :param tool_name:
-            :return:
+            :param previous_output_files: The output files hash before the sample extraction start
+            :return: List of [file path, file size, file modification time] of both outputs if they are ready, None if not
             """
 
-            lvs_correctness = False
-            extract_correctness = False
-
-            print_to_stdout(self.msip_ese_object, "Checking directory:\t" + str(run_directory))
-
-            for root_path, dirs, files in os.walk(run_directory):
-                for lvs_report in files:
-                    if lvs_report.endswith(project_lvs_report_extensions[tool_name]):
-                        lvs_report_file = os.path.join(root_path, lvs_report)
-                        if get_file_size(lvs_report_file) > 0:
-                            lvs_correctness = True
+            output_files = self.find_ude_extract_output_files(run_directory, tool_name, previous_output_files, ("LVS_REPORT", "EXTRACT_FILE"))
+            if output_files["LVS_REPORT"] is None or output_files["EXTRACT_FILE"] is None:
+                return None
 
-                for extract_report in files:
-                    if extract_report.endswith(project_extract_file_extension):
-                        extract_file = os.path.join(root_path, extract_report)
-                        if get_file_size(extract_file) > 0:
-                            extract_correctness = True
+            outputs_state = []
+            for output_file in [output_files["LVS_REPORT"], output_files["EXTRACT_FILE"]]:
+                try:
+                    file_stat = os.stat(output_file)
+                except OSError:
+                    return None
+                outputs_state.append([output_file, file_stat.st_size, file_stat.st_mtime])
 
-            if lvs_correctness and extract_correctness:
-                return True
-            else:
-                return False
+            return outputs_state
 
-        def get_sample_runscript(self, path_to_search):
+        def get_sample_runscript_from_run_directory(self, run_directory, tool_name):
             """
-            The function is returning sample runscript file
-            :param path_to_search:
-            :return:
+            The function is checking for LVS report and extract file correctness and returning sample runscript file of the sample extraction run directory
+            :param run_directory:
+            :param tool_name:
+            :return: The sample runscript file or None if not found. Exiting if LVS report or extract file is not found
             """
 
-            print_to_stdout(self.msip_ese_object, "Searching sample_runscript file under directory:\t" + str(path_to_search))
+            print_to_stdout(self.msip_ese_object, "Checking directory:\t" + str(run_directory))
+
+            output_files = self.find_ude_extract_output_files(run_directory, tool_name)
 
-            for root_path, dirs, files in os.walk(path_to_search):
-                for sample_file_name in files:
-                    if sample_file_name == project_sample_runscript_file_name:
-                        sample_file = os.path.join(root_path, sample_file_name)
-                        print_to_stdout(self.msip_ese_object, "Found sample file:\t" + str(sample_file))
-                        return sample_file
+            if output_files["LVS_REPORT"] is None or output_files["EXTRACT_FILE"] is None:
+                print_to_stderr(self.msip_ese_object, "Something wrong with sample cell extraction step\n\t\t"
+                                                      "No LVS result or SPF file exist. Please check\n\t\t'" + str(run_directory) + "'")
 
-            print_to_stdout(self.msip_ese_object, "Warning!!: No any sample file found")
-            return None
+            if output_files["SAMPLE_RUNSCRIPT"] is not None:
+                print_to_stdout(self.msip_ese_object, "Found sample file:\t" + str(output_files["SAMPLE_RUNSCRIPT"]))
+            else:
+                print_to_stdout(self.msip_ese_object, "Warning!!: No any sample file found")
+
+            return output_files["SAMPLE_RUNSCRIPT"]
 
         @staticmethod
         def change_module_load_line(line):
@@ -2688,6 +5466,60 @@ set outDir "{1}" \n""".format(run_directory, output_directory)
                                                                          output_dir)
                             target_sample_command_file_object.writelines(line_for_writing)
 
+                file_object.close()
+                target_sample_command_file_object.close()
+
+        def grab_sample_run_script(self, pex_tool_name, project_type, project_name, project_release, metal_stack):
+            """
+            The function is grabbing the sample runscript file of one metal stack and updating it in the script environment
+            :param pex_tool_name:
+            :param project_type:
+            :param project_name:
+            :param project_release:
+            :param metal_stack:
+            :return:
+            """
+
+            if (project_type, project_name, project_release, metal_stack) in self.up_to_date_sample_runscripts:
+                return
+
+            run_path = os.path.join(self.msip_ese_object.get_script_run_directory, project_type, project_name, project_release, metal_stack, project_extract_directory_name)
+            sample_runscript_file = self.get_sample_runscript_from_run_directory(run_path, pex_tool_name)
+
+            destination_path = create_directories_hierarchy(self.msip_ese_object.get_data_directory, [project_sample_runscript_location_dir_name,
+                                                                                                      project_type,
+                                                                                                      project_name,
+                                                                                                      project_release,
+                                                                                                      metal_stack,
+                                                                                                      project_extract_directory_name])
+            self.update_environment_sample_runscript_files(file_item=sample_runscript_file, path_to_place=destination_path, tool_name=pex_tool_name)
+            self.write_sample_runscript_fingerprint(project_type, project_name, project_release, metal_stack)
+
+        def update_sample_run_script(self, pex_tool_name, project_type, project_name, project_release, metal_stack, run_dir):
+            """
+            The function is executing sample extract of one metal stack and grabbing its sample runscript file. Used as one node of the flow graph
+            :param pex_tool_name:
+            :param project_type:
+            :param project_name:
+            :param project_release:
+            :param metal_stack:
+            :param run_dir:
+            :return:
+            """
+
+            if self.check_if_sample_runscript_is_up_to_date(project_type, project_name, project_release, metal_stack):
+                print_to_stdout(self.msip_ese_object, "Sample runscript is up to date, skipping sample extraction for:\t" +
+                                "/".join([project_type, project_name, project_release, metal_stack]))
+                self.up_to_date_sample_runscripts.add((project_type, project_name, project_release, metal_stack))
+                return
+
+            job_error_text = self.run_sample_extract(pex_tool_name, project_type, project_name, project_release, metal_stack, run_dir)
+            if job_error_text is not None:
+                print_to_stderr(self.msip_ese_object, "Sample extraction failed for the following job:\n\tPROJECT:\t" + "/".join([project_type, project_name, project_release]) +
+                                "\tMETAL STACK:\t" + metal_stack + "\n\t" + job_error_text)
+
+            self.grab_sample_run_script(pex_tool_name, project_type, project_name, project_release, metal_stack)
+
         def grab_all_sample_run_scripts(self):
             """
             The main function of the ProjectEnvironment Class
@@ -2697,77 +5529,20 @@ set outDir "{1}" \n""".format(run_directory, output_directory)
             print_to_stdout(self.msip_ese_object, "new line")
             print_to_stdout(self.msip_ese_object, "GRABBING SAMPLE RUNSCRIPT FILES\n")
 
-            all_target_sample_runscript_files = {}
-
-            all_target_metal_stack = self.msip_ese_object.get_target_project_metal_stack_list
-
-            for metal_stack in all_target_metal_stack:
-                target_path = os.path.join(self.msip_ese_object.get_script_run_directory,
-                                           self.msip_ese_object.get_target_project_type,
-                                           self.msip_ese_object.get_target_project_name,
-                                           self.msip_ese_object.get_target_project_release,
-                                           metal_stack,
-                                           project_extract_directory_name
-                                           )
-                if self.check_for_ude_extract_flow_correctness(target_path, self.msip_ese_object.get_target_project_pex_tool_name):
-                    sample_runscript_file = self.get_sample_runscript(target_path)
-                    if sample_runscript_file is not None:
-                        if get_file_size(sample_runscript_file) > 0:
-                            all_target_sample_runscript_files[metal_stack] = sample_runscript_file
-                        else:
-                            all_target_sample_runscript_files[metal_stack] = None
-                    else:
-                        all_target_sample_runscript_files[metal_stack] = None
-                else:
-                    print_to_stderr(self.msip_ese_object, "Something wrong with sample cell extraction step\n\t\t"
-                                                          "No LVS result or SPF file exist. Please check\n\t\t'" + str(target_path) + "'")
-
-            for metal_stack in all_target_metal_stack:
-                destination_path = create_directories_hierarchy(self.msip_ese_object.get_data_directory, [project_sample_runscript_location_dir_name,
-                                                                                                          self.msip_ese_object.get_target_project_type,
-                                                                                                          self.msip_ese_object.get_target_project_name,
-                                                                                                          self.msip_ese_object.get_target_project_release,
-                                                                                                          metal_stack,
-                                                                                                          project_extract_directory_name])
-                self.update_environment_sample_runscript_files(file_item=all_target_sample_runscript_files[metal_stack],
-                                                               path_to_place=destination_path,
-                                                               tool_name=self.msip_ese_object.get_target_project_pex_tool_name)
+            for metal_stack in self.msip_ese_object.get_target_project_metal_stack_list:
+                self.grab_sample_run_script(self.msip_ese_object.get_target_project_pex_tool_name,
+                                            self.msip_ese_object.get_target_project_type,
+                                            self.msip_ese_object.get_target_project_name,
+                                            self.msip_ese_object.get_target_project_release,
+                                            metal_stack)
 
             if self.msip_ese_object.check_for_reference_project_execution():
-                all_reference_sample_runscript_files = {}
-                all_reference_metal_stack = self.msip_ese_object.get_reference_project_metal_stack_list
-
-                for metal_stack in all_reference_metal_stack:
-                    reference_path = os.path.join(self.msip_ese_object.get_script_run_directory,
-                                                  self.msip_ese_object.get_reference_project_type,
-                                                  self.msip_ese_object.get_reference_project_name,
-                                                  self.msip_ese_object.get_reference_project_release,
-                                                  metal_stack,
-                                                  project_extract_directory_name
-                                                  )
-                    if self.check_for_ude_extract_flow_correctness(reference_path, self.msip_ese_object.get_reference_project_pex_tool_name):
-                        sample_runscript_file = self.get_sample_runscript(reference_path)
-                        if sample_runscript_file is not None:
-                            if get_file_size(sample_runscript_file) > 0:
-                                all_reference_sample_runscript_files[metal_stack] = sample_runscript_file
-                            else:
-                                all_reference_sample_runscript_files[metal_stack] = None
-                        else:
-                            all_reference_sample_runscript_files[metal_stack] = None
-                    else:
-                        print_to_stderr(self.msip_ese_object, "Something wrong with sample cell extraction step\n\t\t"
-                                                              "No LVS result or SPF file exist. Please check\n\t\t'" + str(reference_path) + "'")
-
-                for metal_stack in all_reference_metal_stack:
-                    destination_path = create_directories_hierarchy(self.msip_ese_object.get_data_directory, [project_sample_runscript_location_dir_name,
-                                                                                                              self.msip_ese_object.get_reference_project_type,
-                                                                                                              self.msip_ese_object.get_reference_project_name,
-                                                                                                              self.msip_ese_object.get_reference_project_release,
-                                                                                                              metal_stack,
-                                                                                                              project_extract_directory_name])
-                    self.update_environment_sample_runscript_files(file_item=all_reference_sample_runscript_files[metal_stack],
-                                                                   path_to_place=destination_path,
-                                                                   tool_name=self.msip_ese_object.get_reference_project_pex_tool_name)
+                for metal_stack in self.msip_ese_object.get_reference_project_metal_stack_list:
+                    self.grab_sample_run_script(self.msip_ese_object.get_reference_project_pex_tool_name,
+                                                self.msip_ese_object.get_reference_project_type,
+                                                self.msip_ese_object.get_reference_project_name,
+                                                self.msip_ese_object.get_reference_project_release,
+                                                metal_stack)
 
     class ScriptInputs:
         """
@@ -2891,6 +5666,20 @@ set outDir "{1}" \n""".format(run_directory, output_directory)
                     self.msip_ese_object.enable_force_add_test_case()
                 elif script_option_name == available_script_options[9]:
                     self.msip_ese_object.set_executed_flow(script_option_value)
+                elif script_option_name == available_script_options[10]:
+                    self.msip_ese_object.set_max_parallel_jobs(script_option_value)
+                elif script_option_name == available_script_options[11]:
+                    self.msip_ese_object.enable_incremental_update_test_case()
+                elif script_option_name == available_script_options[12]:
+                    self.msip_ese_object.enable_time_startup()
+                elif script_option_name == available_script_options[13]:
+                    self.msip_ese_object.set_max_parallel_pex_jobs(script_option_value)
+                elif script_option_name == available_script_options[14]:
+                    self.msip_ese_object.set_flow_scheduler(script_option_value)
+                elif script_option_name == available_script_options[15]:
+                    self.msip_ese_object.set_job_backend_name(script_option_value)
+                elif script_option_name == available_script_options[16]:
+                    self.msip_ese_object.enable_resume()
 
     class Excel:
         """
@@ -2908,95 +5697,159 @@ set outDir "{1}" \n""".format(run_directory, output_directory)
 
             self.msip_ese_object = msip_ese_object
 
-        def check_excel_option_name_and_value(self, excel_option_name, excel_option_value):
+        @staticmethod
+        def check_excel_option_name_and_value(excel_setup, excel_option_name, excel_option_value):
             """
             The function is checking the option name and value for correctness,
-            and returns None if not correct and added value on appropriate option setup of excel variable self.excelSetup
+            and returns None if not correct and added value on appropriate option setup of excel variable excel_setup
+            :param excel_setup:
             :param excel_option_name:
             :param excel_option_value:
             :return: True if found and False if not
             """
 
-            global available_excel_options
-
-            for optionName in available_excel_options:
-                if excel_option_name.upper() == str(optionName).upper():
-                    if not check_if_string_is_empty(excel_option_value):
-                        self.msip_ese_object.excel_setup[optionName] = excel_option_value
-                        return True
-                    else:
-                        return False
+            option_name = available_excel_options_lookup.get(excel_option_name.upper())
+            if option_name is None or check_if_string_is_empty(excel_option_value):
+                return False
 
-            return False
+            excel_setup[option_name] = excel_option_value
+            return True
 
-        def read_excel(self, excel_file):
+        def read_excel_sheets(self, excel_file):
             """
-            The function is reading excel file
+            The function is reading all sheets of the excel file
             :param excel_file:
-            :return:
+            :return: List of [sheet name, option name -> value hash, list of [row number, comment]] of the sheets with test case options
             """
 
             print_to_stdout(self.msip_ese_object, "READING EXCEL FILE:\t'" + excel_file + "'")
             try:
+                from xlrd import open_workbook as read_excel_module
+                from xlrd import XLRDError
+            except ImportError as import_exception:
+                print_to_stderr(self.msip_ese_object, "Cannot read excel file without xlrd module\t" + excel_file + "\n\t\t" + str(import_exception))
+
+            try:
+                # noinspection PyUnboundLocalVariable
                 excel_workbook_object = read_excel_module(excel_file)
             except XLRDError as xlrdException:
                 print_to_stderr(self.msip_ese_object, "File\t" + excel_file + "\n\t\t" + str(xlrdException))
 
+            excel_sheets = []
+
             # noinspection PyUnboundLocalVariable
             all_sheets_name = excel_workbook_object.sheet_names()
 
             for sheet_name in all_sheets_name:
+                sheet_options = {}
+                sheet_comments = []
                 work_sheet_object = excel_workbook_object.sheet_by_name(sheet_name)
                 row_number = work_sheet_object.nrows
                 for current_row in range(1, row_number):
                     excel_option_name = str(work_sheet_object.cell_value(current_row, 1))
                     excel_option_value = str(work_sheet_object.cell_value(current_row, 2))
                     excel_option_comment = str(work_sheet_object.cell_value(current_row, 4))
-                    row_contains_information = self.check_excel_option_name_and_value(excel_option_name, excel_option_value)
+                    row_contains_information = self.check_excel_option_name_and_value(sheet_options, excel_option_name, excel_option_value)
                     if row_contains_information and (not check_if_string_is_empty(excel_option_comment)):
-                        str_to_display = "IMPORTANT NOTE! USER MAKES COMMENT FOR TEST CASE OPTION IN EXCEL FILE\n\tCOMMENT:\t" + excel_option_comment + "\n\tLINE:\t\t" + str(
-                            current_row + 1)
-                        print(str_to_display)
-                        print_to_stdout(self.msip_ese_object, str_to_display)
+                        sheet_comments.append([current_row + 1, excel_option_comment])
+                if get_list_length(sheet_options) > 0:
+                    excel_sheets.append([sheet_name, sheet_options, sheet_comments])
 
-        def get_information_from_excel_file(self, excel_file):
+            return excel_sheets
+
+        def get_excel_sheets(self, excel_file):
             """
-            Main function of the class
+            The function is returning all sheets of the excel file from the excel spec cache. The excel file is read only if its size and modification time
+            are changed and its content digest is changed as well
             :param excel_file:
-            :return:
+            :return: List of [sheet name, option name -> value hash, list of [row number, comment]]
             """
 
-            if excel_file is None:
-                print_to_stdout(self.msip_ese_object, "No any excel file selected.\nSkip the step")
-            else:
-                if check_for_file_existence(get_file_path(excel_file), get_file_name_from_path(excel_file)):
-                    self.read_excel(excel_file)
-                else:
-                    print_to_stderr(self.msip_ese_object, "Cannot read excel file\t" + os.path.join(get_file_path(excel_file), excel_file))
+            cache_file = os.path.join(self.msip_ese_object.get_data_directory, excel_spec_cache_file_name)
+            excel_file = os.path.abspath(excel_file)
+
+            try:
+                file_stat = os.stat(excel_file)
+            except OSError:
+                return self.read_excel_sheets(excel_file)
+
+            excel_spec_cache = read_json_file(cache_file, {})
+            if not isinstance(excel_spec_cache, dict):
+                excel_spec_cache = {}
+
+            file_info = excel_spec_cache.get(excel_file)
+            if file_info is not None and file_info["size"] == file_stat.st_size:
+                if file_info["mtime"] == file_stat.st_mtime:
+                    print_to_stdout(self.msip_ese_object, "READING EXCEL FILE FROM CACHE:\t'" + excel_file + "'")
+                    return file_info["sheets"]
+                excel_file_digest = get_file_digest(excel_file)
+                if excel_file_digest == file_info["digest"]:
+                    print_to_stdout(self.msip_ese_object, "READING EXCEL FILE FROM CACHE:\t'" + excel_file + "'")
+                    file_info["mtime"] = file_stat.st_mtime
+                    write_json_file(cache_file, excel_spec_cache)
+                    return file_info["sheets"]
+
+            excel_sheets = self.read_excel_sheets(excel_file)
+            excel_spec_cache[excel_file] = {"size": file_stat.st_size, "mtime": file_stat.st_mtime, "digest": get_file_digest(excel_file), "sheets": excel_sheets}
+            for cached_excel_file in list(excel_spec_cache.keys()):
+                if not os.path.isfile(cached_excel_file):
+                    del excel_spec_cache[cached_excel_file]
+            if check_for_dir_existence(get_file_path(self.msip_ese_object.get_data_directory), get_file_name_from_path(self.msip_ese_object.get_data_directory)):
+                write_json_file(cache_file, excel_spec_cache)
+
+            return excel_sheets
+
+        def read_excel(self, excel_file):
+            """
+            The function is reading excel file, each sheet with test case options is a separate test case spec
+            :param excel_file:
+            :return: List of [excel file, sheet name, excel setup hash]
+            """
+
+            excel_specs = []
+
+            for sheet_name, sheet_options, sheet_comments in self.get_excel_sheets(excel_file):
+                excel_setup = dict((option_name, None) for option_name in available_excel_options)
+                excel_setup.update(sheet_options)
+                for comment_row, excel_option_comment in sheet_comments:
+                    str_to_display = "IMPORTANT NOTE! USER MAKES COMMENT FOR TEST CASE OPTION IN EXCEL FILE\n\tCOMMENT:\t" + excel_option_comment + "\n\tLINE:\t\t" + str(
+                        comment_row) + "\n\tSHEET:\t\t" + str(sheet_name)
+                    print(str_to_display)
+                    print_to_stdout(self.msip_ese_object, str_to_display)
+                excel_specs.append([excel_file, sheet_name, excel_setup])
+
+            if get_list_length(excel_specs) < 1:
+                print_to_stderr(self.msip_ese_object, "Cannot find any test case option in excel file\t" + excel_file)
+
+            return excel_specs
+
+        def check_excel_setup(self, excel_file, sheet_name, excel_setup):
+            """
+            The function is reporting and checking the test case spec options
+            :param excel_file:
+            :param sheet_name:
+            :param excel_setup:
+            :return:
+            """
 
             print_to_stdout(self.msip_ese_object, "new line")
-            print_to_stdout(self.msip_ese_object, "User is set following excel's option(s)\n")
-            excel_options = self.msip_ese_object.excel_setup.keys()
+            print_to_stdout(self.msip_ese_object, "User is set following excel's option(s) in file '" + excel_file + "' sheet '" + str(sheet_name) + "'\n")
+            excel_options = excel_setup.keys()
             for option in excel_options:
-                if self.msip_ese_object.excel_setup[option] is not None:
+                if excel_setup[option] is not None:
                     number_of_tabs = "\t" * set_number_of_tabs(option, 5)
-                    print_to_stdout(self.msip_ese_object, str("\t" + option + number_of_tabs + self.msip_ese_object.excel_setup[option]))
+                    print_to_stdout(self.msip_ese_object, str("\t" + option + number_of_tabs + excel_setup[option]))
 
             print_to_stdout(self.msip_ese_object, "new line")
             print_to_stdout(self.msip_ese_object, "Following excel options are not used\n")
             for option in excel_options:
-                if self.msip_ese_object.excel_setup[option] is None:
+                if excel_setup[option] is None:
                     number_of_tabs = "\t" * set_number_of_tabs(option, 5)
-                    print_to_stdout(self.msip_ese_object, str("\t" + option + number_of_tabs + str(self.msip_ese_object.excel_setup[option])))
-
-            # Setting target and reference lvs/pex tool name, by default it is ICV
-
-            self.msip_ese_object.set_target_project_pex_tool_name(self.msip_ese_object.excel_setup[available_excel_options[21]])
-            self.msip_ese_object.set_reference_project_pex_tool_name(self.msip_ese_object.excel_setup[available_excel_options[23]])
+                    print_to_stdout(self.msip_ese_object, str("\t" + option + number_of_tabs + str(excel_setup[option])))
 
             # Checking if correct test case path
 
-            test_case_path = self.msip_ese_object.excel_setup[available_excel_options[5]]
+            test_case_path = excel_setup[available_excel_options[5]]
             if test_case_path is not None:
                 if get_string_length(test_case_path) > 0:
                     if not check_for_file_existence(get_file_path(test_case_path), get_file_name_from_path(test_case_path)):
@@ -3007,9 +5860,83 @@ set outDir "{1}" \n""".format(run_directory, output_directory)
 
             # In This line all spaces was removing to make parsing step of the excel file more easy
             for index_number in range(get_list_length(available_excel_options)):
-                if self.msip_ese_object.excel_setup[available_excel_options[index_number]] is not None:
-                    self.msip_ese_object.excel_setup[available_excel_options[index_number]] = self.msip_ese_object.excel_setup[available_excel_options[index_number]].replace(" ",
-                                                                                                                                                                              "")
+                if excel_setup[available_excel_options[index_number]] is not None:
+                    excel_setup[available_excel_options[index_number]] = excel_setup[available_excel_options[index_number]].replace(" ", "")
+
+        def check_excel_specs_project_setup(self, excel_specs):
+            """
+            The function is checking that all test case specs have the same project setup and PEX settings as the first spec,
+            as the project environment is set up once for all specs
+            :param excel_specs: List of [excel file, sheet name, excel setup hash]
+            :return:
+            """
+
+            mismatches_report = ""
+            for spec_excel_file, sheet_name, excel_setup in excel_specs[1:]:
+                for option_index in excel_specs_project_options_indexes:
+                    option_name = available_excel_options[option_index]
+                    if excel_setup[option_name] != excel_specs[0][2][option_name]:
+                        mismatches_report += "\n\t" + spec_excel_file + "\tSheet:\t" + str(sheet_name) + "\t'" + option_name + "':\t" + str(excel_setup[option_name]) + \
+                                             "\tFirst spec:\t" + str(excel_specs[0][2][option_name])
+
+            if get_string_length(mismatches_report) > 0:
+                print_to_stderr(self.msip_ese_object, "The test case specs have different project setup than the first test case spec:\t" + excel_specs[0][0] +
+                                "\tSheet:\t" + str(excel_specs[0][1]) + mismatches_report + "\n\tPlease run the specs of each project separately")
+
+        def get_information_from_excel_file(self, excel_file):
+            """
+            Main function of the class. The excel file can be directory of excel files or glob pattern of excel files
+            :param excel_file:
+            :return:
+            """
+
+            excel_specs = []
+            if excel_file is None:
+                print_to_stdout(self.msip_ese_object, "No any excel file selected.\nSkip the step")
+            else:
+                excel_files_list = get_excel_files_list(excel_file)
+                if get_list_length(excel_files_list) < 1:
+                    print_to_stderr(self.msip_ese_object, "Cannot find any excel file\t" + excel_file)
+                for excel_file_item in excel_files_list:
+                    if check_for_file_existence(get_file_path(excel_file_item), get_file_name_from_path(excel_file_item)):
+                        excel_specs.extend(self.read_excel(excel_file_item))
+                    else:
+                        print_to_stderr(self.msip_ese_object, "Cannot read excel file\t" + os.path.join(get_file_path(excel_file_item), excel_file_item))
+
+            all_test_cases = {}
+            for spec_excel_file, sheet_name, excel_setup in excel_specs:
+                self.check_excel_setup(spec_excel_file, sheet_name, excel_setup)
+                test_case_key = (excel_setup[available_excel_options[0]], excel_setup[available_excel_options[3]])
+                if test_case_key in all_test_cases:
+                    print_to_stderr(self.msip_ese_object, "The test case '" + str(test_case_key[0]) + "' for '" + str(test_case_key[1]) + "' is defined twice:\n\t" +
+                                    all_test_cases[test_case_key] + "\n\t" + spec_excel_file + "\tSheet:\t" + str(sheet_name))
+                all_test_cases[test_case_key] = spec_excel_file + "\tSheet:\t" + str(sheet_name)
+
+            self.check_excel_specs_project_setup(excel_specs)
+            self.msip_ese_object.set_excel_specs(excel_specs)
+            if get_list_length(excel_specs) > 1:
+                print_to_stdout(self.msip_ese_object, "The project setup is taken from the first test case spec:\t" + excel_specs[0][0] + "\tSheet:\t" + str(excel_specs[0][1]))
+
+            # Setting target and reference lvs/pex tool name, by default it is ICV
+
+            self.msip_ese_object.set_target_project_pex_tool_name(self.msip_ese_object.excel_setup[available_excel_options[21]])
+            self.msip_ese_object.set_reference_project_pex_tool_name(self.msip_ese_object.excel_setup[available_excel_options[23]])
+
+            # Setting target and reference lvs/pex tool versions, decks and setup files
+            self.msip_ese_object.set_target_project_pex_tool_version(self.msip_ese_object.excel_setup[available_excel_options[22]])
+            self.msip_ese_object.set_reference_project_pex_tool_version(self.msip_ese_object.excel_setup[available_excel_options[24]])
+            self.msip_ese_object.set_target_project_pex_tool_deck(self.msip_ese_object.excel_setup[available_excel_options[25]])
+            self.msip_ese_object.set_reference_project_pex_tool_deck(self.msip_ese_object.excel_setup[available_excel_options[26]])
+            self.msip_ese_object.set_target_project_pex_tool_source_file(self.msip_ese_object.excel_setup[available_excel_options[27]])
+            self.msip_ese_object.set_target_project_pex_tool_option_file(self.msip_ese_object.excel_setup[available_excel_options[28]])
+            self.msip_ese_object.set_reference_project_pex_tool_source_file(self.msip_ese_object.excel_setup[available_excel_options[29]])
+            self.msip_ese_object.set_reference_project_pex_tool_option_file(self.msip_ese_object.excel_setup[available_excel_options[30]])
+            self.msip_ese_object.set_target_project_extract_tool_version(self.msip_ese_object.excel_setup[available_excel_options[31]])
+            self.msip_ese_object.set_reference_project_extract_tool_version(self.msip_ese_object.excel_setup[available_excel_options[32]])
+            self.msip_ese_object.set_target_project_extract_tool_deck(self.msip_ese_object.excel_setup[available_excel_options[33]])
+            self.msip_ese_object.set_reference_project_extract_tool_deck(self.msip_ese_object.excel_setup[available_excel_options[34]])
+            self.msip_ese_object.set_target_project_extract_tool_starcmd(self.msip_ese_object.excel_setup[available_excel_options[35]])
+            self.msip_ese_object.set_reference_project_extract_tool_starcmd(self.msip_ese_object.excel_setup[available_excel_options[36]])
 
             return self
 
@@ -3018,8 +5945,25 @@ set outDir "{1}" \n""".format(run_directory, output_directory)
         The class of test cases updates
         """
 
-        def __init__(self, msip_ese_object):
+        def __init__(self, msip_ese_object, excel_setup=None, excel_file=None):
+            """
+            Initial function of the class
+            :param msip_ese_object:
+            :param excel_setup: The test case spec, by default the excel setup of the script
+            :param excel_file: The excel file of the test case spec, by default the excel file of the script
+            """
+
             self.msip_ese_object = msip_ese_object
+            self.excel_setup = excel_setup if excel_setup is not None else msip_ese_object.excel_setup
+            self.excel_file = excel_file if excel_file is not None else msip_ese_object.get_script_excel_file
+
+            # Digests of the GDS files analysed by this test case update for all test case specs
+            self.owned_gds_digests = set()
+
+            # Test case file -> [source, size, modification time, digest, materialization method] of the previous and the current test case update
+            self.previous_manifest_files = {}
+            self.manifest_files = {}
+            self.manifest_lock = threading.Lock()
 
         def check_for_excel_file_required_information(self):
             """
@@ -3028,7 +5972,7 @@ set outDir "{1}" \n""".format(run_directory, output_directory)
             """
 
             for required_options_index in [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 15, 16]:
-                if self.msip_ese_object.excel_setup[available_excel_options[required_options_index]] is None:
+                if self.excel_setup[available_excel_options[required_options_index]] is None:
                     print_to_stderr(self.msip_ese_object,
                                     "Required field in excel file is empty:\t'" + str(available_excel_options[required_options_index]) + "'")
 
@@ -3047,29 +5991,40 @@ set outDir "{1}" \n""".format(run_directory, output_directory)
 
             return False
 
-        def generate_gds_config_file(self, gds_file, untar_directory_path, target_dir):
+        def generate_gds_config_files(self, gds_files_list, untar_directory_path, session_name):
             """
-            The function is generating gds config file
-            :param gds_file:
+            The function is generating gds config files for all GDS files in one icwbev session. The config file is generated next to the GDS file
+            :param gds_files_list:
             :param untar_directory_path:
-            :param target_dir:
+            :param session_name: The icwbev macro and shell files base name
             :return:
             """
 
-            gds_file_name = get_file_name_from_path(gds_file)
+            icwbev_mac_file_content = ""
 
-            print_to_stdout(self.msip_ese_object, "Generating gds config file for GDS:\t'" + gds_file + "'")
-            icwbev_mac_file_content = """layout open GDS_FILE ??
+            for gds_file in gds_files_list:
+                print_to_stdout(self.msip_ese_object, "Generating gds config file for GDS:\t'" + gds_file + "'")
+                # Each GDS is analysed inside catch, so one broken GDS file does not stop the session
+                icwbev_mac_file_content += """if {[catch {
+layout open GDS_FILE ??
 foreach topLevel [layout root cells] {
 cell open $topLevel
 }
 set gds_info [open "TARGET_DIR/GDS_NAME.config" "w+"]
 puts $gds_info "TOP_CELL_NAME:\t\t\t [cell active]"
 puts $gds_info "ALL_LAYERS:\t\t\t [cell layers -all]"
+puts $gds_info "METAL_STACK:\t\t\t DEFAULT_METAL_STACK"
 close $gds_info
-exit""".replace(".config", gds_config_file_extension).replace("GDS_FILE", gds_file).replace("GDS_NAME", gds_file_name).replace("TARGET_DIR", target_dir)
+catch {layout close}
+} gds_error]} {
+puts "ERROR!: Cannot export GDS_FILE layers: $gds_error"
+}
+""".replace("DEFAULT_METAL_STACK", default_metal_stack).replace(".config", gds_config_file_extension).replace("GDS_FILE", gds_file).replace("GDS_NAME", get_file_name_from_path(gds_file)).replace(
+                    "TARGET_DIR", get_file_path(gds_file))
+
+            icwbev_mac_file_content += "exit"
 
-            icwb_mac_file_object = open_file_for_writing(untar_directory_path, gds_file_name + ".mac")
+            icwb_mac_file_object = open_file_for_writing(untar_directory_path, session_name + ".mac")
             icwb_mac_file_object.write(icwbev_mac_file_content)
             icwb_mac_file_object.close()
 
@@ -3083,18 +6038,199 @@ cd RUN_DIR
 
 module unload icwbev_plus
 module load icwbev_plus/2015.06
-icwbev -run GDS_NAME.mac -nodisplay\n
-chmod -R 777 *
-""".replace("RUN_DIR", untar_directory_path).replace("GDS_NAME", gds_file_name)
+icwbev -run SESSION_NAME.mac -nodisplay\n
+""".replace("RUN_DIR", untar_directory_path).replace("SESSION_NAME", session_name)
+            # Only the generated config files are opened for all, the extracted package files can be hard linked into the read only object store
+            for gds_file in gds_files_list:
+                shell_command += "chmod 777 \"" + gds_file + gds_config_file_extension + "\"\n"
 
-            shell_file_object = open_file_for_writing(untar_directory_path, gds_file_name + "_export_gds_layers.sh")
+            shell_file_object = open_file_for_writing(untar_directory_path, session_name + "_export_gds_layers.sh")
             shell_file_object.write(shell_command)
             shell_file_object.close()
 
-            process = execute_external_command(os.path.join(untar_directory_path, gds_file_name + "_export_gds_layers.sh"))
-            process.wait()
+            process = execute_external_command(os.path.join(untar_directory_path, session_name + "_export_gds_layers.sh"))
+            wait_for_external_command(process)
+
+            for gds_file in gds_files_list:
+                print_to_stdout(self.msip_ese_object, "GDS layers are in file\t" + gds_file + gds_config_file_extension)
+
+        @staticmethod
+        def read_test_case_manifest(test_case_directory):
+            """
+            The function is reading the manifest of the test case files
+            :param test_case_directory:
+            :return: Dictionary with "package" and "files" sections
+            """
+
+            test_case_manifest = read_json_file(os.path.join(test_case_directory, test_case_manifest_file_name), {})
+            if not isinstance(test_case_manifest, dict):
+                test_case_manifest = {}
+            test_case_manifest.setdefault("package", {})
+            test_case_manifest.setdefault("files", {})
+
+            return test_case_manifest
+
+        def write_test_case_manifest(self, test_case_directory, package_path):
+            """
+            The function is writing the manifest of all files of the current test case update
+            :param test_case_directory:
+            :param package_path:
+            :return:
+            """
+
+            with self.manifest_lock:
+                test_case_manifest = {"package": self.get_package_state(package_path), "spec": self.get_spec_state(), "files": self.manifest_files}
+                write_json_file(os.path.join(test_case_directory, test_case_manifest_file_name), test_case_manifest)
+
+        def get_spec_state(self):
+            """
+            The function is returning path and content digest of the excel file of the test case spec
+            :return:
+            """
+
+            return {"path": self.excel_file, "digest": get_file_digest(self.excel_file)}
+
+        def get_test_case_target_files(self, test_case_directory):
+            """
+            The function is returning all test case files required by the test case spec
+            :param test_case_directory:
+            :return: Set of target files
+            """
+
+            return set([os.path.join(target_directory, get_file_name_from_path(get_package_member_name(excel_information)))
+                        for excel_information, target_directory in self.get_test_case_files(test_case_directory)])
+
+        def remove_test_case_files(self, previous_target_files):
+            """
+            The function is removing the test case files of the previous test case update, which are not required by the test case spec anymore
+            :param previous_target_files:
+            :return:
+            """
+
+            with self.manifest_lock:
+                removed_target_files = sorted(set(previous_target_files) - set(self.manifest_files.keys()))
+
+            for target_file in removed_target_files:
+                for removed_file in [target_file, target_file + gds_config_file_extension]:
+                    if os.path.lexists(removed_file):
+                        try:
+                            os.remove(removed_file)
+                            print_to_stdout(self.msip_ese_object, "File is removed from the test case:\t" + removed_file)
+                        except OSError:
+                            print_to_stdout(self.msip_ese_object, "WARNING!: Cannot remove file:\t" + removed_file)
+
+        @staticmethod
+        def get_package_state(package_path):
+            """
+            The function is returning path, size and modification time of the test case package
+            :param package_path:
+            :return:
+            """
+
+            try:
+                package_stat = os.stat(package_path)
+            except OSError:
+                return {}
+
+            return {"path": package_path, "size": package_stat.st_size, "mtime": package_stat.st_mtime}
+
+        def check_if_test_case_is_up_to_date(self, test_case_directory, package_path):
+            """
+            The function is checking if the test case package and spec are not changed since the last update and all test case files are in place
+            :param test_case_directory:
+            :param package_path:
+            :return:
+            """
+
+            test_case_manifest = self.read_test_case_manifest(test_case_directory)
+            if get_list_length(test_case_manifest["files"]) < 1 or not os.path.isfile(package_path):
+                return False
+            if test_case_manifest["package"] != self.get_package_state(package_path):
+                return False
+            if test_case_manifest.get("spec") != self.get_spec_state():
+                return False
+            # The files added to or removed from the spec are not in the manifest of the previous update
+            if set(test_case_manifest["files"].keys()) != self.get_test_case_target_files(test_case_directory):
+                return False
+
+            for target_file in test_case_manifest["files"].keys():
+                if not os.path.isfile(target_file):
+                    return False
+                if get_file_path(target_file) == os.path.join(test_case_directory, project_test_case_directories_list[1]) and \
+                        not self.check_if_config_file_is_valid(target_file):
+                    return False
+
+            return True
+
+        def add_manifest_file(self, target_file, source_file, file_digest, materialization_method):
+            """
+            The function is adding the test case file into the manifest of the current test case update
+            :param target_file:
+            :param source_file:
+            :param file_digest:
+            :param materialization_method: The method used for the test case file
+            :return:
+            """
+
+            try:
+                source_stat = os.stat(source_file)
+            except OSError:
+                return
+
+            if get_string_length(file_digest) < 1:
+                file_digest = get_file_digest(source_file)
+
+            with self.manifest_lock:
+                self.manifest_files[target_file] = {"source": source_file, "size": source_stat.st_size, "mtime": source_stat.st_mtime, "digest": file_digest,
+                                                    "method": materialization_method}
+
+        def check_if_file_is_unchanged(self, source_file, target_file, file_digest=""):
+            """
+            The function is checking if the test case file is the same as in the previous test case update.
+            The file content is read only if the source file size is the same but the modification time is changed
+            :param source_file:
+            :param target_file:
+            :param file_digest: The source file digest, if it is already known
+            :return: The source file digest if the file is not changed, None if it is changed
+            """
+
+            previous_file_info = self.previous_manifest_files.get(target_file)
+            if previous_file_info is None or not os.path.isfile(target_file):
+                return None
+
+            try:
+                source_stat = os.stat(source_file)
+            except OSError:
+                return None
+
+            if previous_file_info["size"] != source_stat.st_size:
+                return None
+            if previous_file_info["source"] == source_file and previous_file_info["mtime"] == source_stat.st_mtime:
+                return previous_file_info["digest"]
+
+            if get_string_length(file_digest) < 1:
+                file_digest = get_file_digest(source_file)
+            if file_digest == previous_file_info["digest"]:
+                return file_digest
 
-            print_to_stdout(self.msip_ese_object, "GDS layers are in file\t" + os.path.join(untar_directory_path, gds_file_name + gds_config_file_extension))
+            return None
+
+        def record_materialized_file(self, target_file, materialization_method):
+            """
+            The function is logging the materialization method of the test case file and giving full permissions to the own copies
+            :param target_file:
+            :param materialization_method:
+            :return:
+            """
+
+            print_to_stdout(self.msip_ese_object, "File is materialized by " + materialization_method + ":\t" + target_file)
+
+            # Linked files are sharing permissions with the source file, so only own copies are changed
+            if materialization_method in [available_materialization_methods[0], available_materialization_methods[3]]:
+                try:
+                    os.chmod(target_file, mode=0o777)
+                except OSError:
+                    print_to_stdout(self.msip_ese_object, "Permission denied\t" + target_file)
 
         def move_file(self, excel_information, source, destination):
             """
@@ -3105,31 +6241,204 @@ chmod -R 777 *
             :return:
             """
 
-            excel_information = str(excel_information).replace(available_package_directory_tags_list[0], "").replace(available_package_directory_tags_list[1], "")
-            source = os.path.join(source, excel_information)
-            if check_for_file_existence(get_file_path(source), get_file_name_from_path(source)):
-                if check_for_dir_existence(get_file_path(destination), get_file_name_from_path(destination)):
-                    shutil.copy(source, os.path.join(destination, get_file_name_from_path(source)))
-                    try:
-                        os.chmod(os.path.join(destination, get_file_name_from_path(source)), mode=0o777)
-                    except OSError:
-                        print_to_stdout(self.msip_ese_object, "Permission denied\t" + os.path.join(destination, get_file_name_from_path(source)))
-                    return os.path.join(destination, get_file_name_from_path(source))
-
-            print_to_stderr(self.msip_ese_object, "Cannot copy file from:\t'" + source + "'\tTo\t'" + os.path.join(destination, get_file_name_from_path(source)) + "'")
+            source = os.path.join(source, get_package_member_name(excel_information))
+            if check_for_file_existence(get_file_path(source), get_file_name_from_path(source)):
+                if check_for_dir_existence(get_file_path(destination), get_file_name_from_path(destination)):
+                    # The files of the script run directory are temporary, so they are never symlinked
+                    materialization_methods = test_case_materialization_methods
+                    temporary_source = os.path.abspath(source).startswith(os.path.join(os.path.abspath(self.msip_ese_object.get_script_run_directory), ""))
+                    if temporary_source:
+                        materialization_methods = [method for method in materialization_methods if method != available_materialization_methods[2]]
+
+                    target = os.path.join(destination, get_file_name_from_path(source))
+                    file_digest = self.check_if_file_is_unchanged(source, target)
+                    if file_digest is not None:
+                        print_to_stdout(self.msip_ese_object, "File is not changed:\t" + target)
+                        self.add_manifest_file(target, source, file_digest, self.previous_manifest_files[target].get("method"))
+                        return target
+
+                    file_digest = ""
+                    materialization_method = None
+                    if test_case_object_store_enabled:
+                        file_digest = self.msip_ese_object.get_object_store.add_file(source, temporary_source)
+                        if get_string_length(file_digest) > 0:
+                            materialization_method = self.msip_ese_object.get_object_store.link_object(file_digest, target, test_case_materialization_methods)
+                    if materialization_method is None:
+                        materialization_method = materialize_file(source, target, materialization_methods)
+                    if materialization_method is not None:
+                        self.record_materialized_file(target, materialization_method)
+                        self.add_manifest_file(target, source, file_digest, materialization_method)
+                        return target
+
+            print_to_stderr(self.msip_ese_object, "Cannot copy file from:\t'" + source + "'\tTo\t'" + os.path.join(destination, get_file_name_from_path(source)) + "'")
+
+        @staticmethod
+        def check_if_config_file_is_valid(target_gds_file):
+            """
+            The function is checking for config file correctness
+            :param target_gds_file:
+            :return: True if the config file exists and not empty, False if not
+            """
+
+            if check_for_file_existence(get_file_path(target_gds_file), get_file_name_from_path(target_gds_file) + gds_config_file_extension):
+                if get_file_size(os.path.join(get_file_path(target_gds_file), get_file_name_from_path(target_gds_file) + gds_config_file_extension)) > 0:
+                    return True
+
+            return False
+
+        def check_config_file_existence(self, target_gds_file):
+            """
+            The function is checking for config file correctness
+            :param target_gds_file:
+            :return:
+            """
+
+            if not self.check_if_config_file_is_valid(target_gds_file):
+                print_to_stderr(self.msip_ese_object, "Cannot find gds config file for:\t" + target_gds_file)
+
+        def analyse_gds_file(self, gds_target_file):
+            """
+            The function is generating GDS config file by reading the GDS file natively
+            :param gds_target_file:
+            :return: True if the config file is generated, False if the GDS file should be analysed by icwbev
+            """
+
+            if gds_config_generation_mode != available_gds_config_generation_modes[0]:
+                return False
+
+            gds_file_info = read_gds_file_info(gds_target_file)
+            if gds_file_info is None:
+                print_to_stdout(self.msip_ese_object, "Cannot read GDS file natively, icwbev will be used:\t'" + gds_target_file + "'")
+                return False
+
+            write_gds_config_file(gds_target_file, gds_file_info[0], gds_file_info[1])
+            print_to_stdout(self.msip_ese_object, "GDS layers are in file\t" + gds_target_file + gds_config_file_extension)
+
+            return True
+
+        def prepare_gds_config_file(self, gds_target_file):
+            """
+            The function is generating GDS config file from the GDS config cache or by reading the GDS file natively.
+            Only the first GDS file of each unknown content is analysed, the other GDS files of the same content are marked as shared
+            :param gds_target_file:
+            :return: [GDS content digest, "UNCHANGED"/"CACHED"/"SHARED"/"NATIVE"/"ICWBEV" status of the GDS file]
+            """
+
+            gds_config_cache = self.msip_ese_object.get_gds_config_cache
+            run_journal = self.msip_ese_object.get_run_journal
+
+            if run_journal.check_if_unit_is_finished("GDS_CONFIG", gds_target_file) and self.check_if_config_file_is_valid(gds_target_file):
+                print_to_stdout(self.msip_ese_object, "GDS config file is generated by the previous run\t" + gds_target_file + gds_config_file_extension)
+                return ["", "UNCHANGED"]
+            run_journal.record("GDS_CONFIG", gds_target_file, "START")
+
+            # The config file of not changed GDS file is kept from the previous test case update
+            with self.manifest_lock:
+                manifest_file_info = self.manifest_files.get(gds_target_file)
+            previous_file_info = self.previous_manifest_files.get(gds_target_file)
+            if manifest_file_info is not None and previous_file_info is not None and manifest_file_info["digest"] == previous_file_info["digest"] and \
+                    self.check_if_config_file_is_valid(gds_target_file):
+                print_to_stdout(self.msip_ese_object, "GDS file is not changed, keeping the config file\t" + gds_target_file + gds_config_file_extension)
+                return [manifest_file_info["digest"], "UNCHANGED"]
+
+            gds_file_digest = gds_config_cache.get_gds_file_digest(gds_target_file)
+            if get_string_length(gds_file_digest) > 0:
+                gds_config = gds_config_cache.get_gds_config(gds_file_digest)
+                if gds_config is not None:
+                    write_gds_config_file(gds_target_file, gds_config[0], gds_config[1])
+                    print_to_stdout(self.msip_ese_object, "GDS layers are taken from the cache\t" + gds_target_file + gds_config_file_extension)
+                    return [gds_file_digest, "CACHED"]
+
+                with self.msip_ese_object.analysed_gds_digests_lock:
+                    if self.msip_ese_object.analysed_gds_digests.setdefault(gds_file_digest, [gds_target_file, threading.Event()])[0] != gds_target_file:
+                        return [gds_file_digest, "SHARED"]
+                    self.owned_gds_digests.add(gds_file_digest)
+
+            if self.analyse_gds_file(gds_target_file):
+                return [gds_file_digest, "NATIVE"]
+
+            return [gds_file_digest, "ICWBEV"]
+
+        def finish_analysed_gds_digests(self):
+            """
+            The function is notifying the test case updates waiting for the GDS files analysed by this test case update
+            :return:
+            """
+
+            with self.msip_ese_object.analysed_gds_digests_lock:
+                for gds_file_digest in self.owned_gds_digests:
+                    self.msip_ese_object.analysed_gds_digests[gds_file_digest][1].set()
+                self.owned_gds_digests.clear()
 
-        def check_config_file_existence(self, target_gds_file):
+        def generate_all_gds_config_files(self, gds_target_files_list, untar_directory_path, prepared_gds_files=None):
             """
-            The function is checking for config file correctness
-            :param target_gds_file:
+            The function is generating config files for all GDS files of the package and checking all results at the end.
+            The config of already known GDS content is taken from the GDS config cache and the same GDS content is analysed only once.
+            The GDS files which cannot be read natively are split into icwbev sessions of icwbev_max_gds_files_per_session files, which are executed in parallel
+            :param gds_target_files_list:
+            :param untar_directory_path:
+            :param prepared_gds_files: GDS file -> prepare_gds_config_file result of the GDS files already prepared during the package extraction
             :return:
             """
 
-            if check_for_file_existence(get_file_path(target_gds_file), get_file_name_from_path(target_gds_file) + gds_config_file_extension):
-                if get_file_size(os.path.join(get_file_path(target_gds_file), get_file_name_from_path(target_gds_file) + gds_config_file_extension)) > 0:
-                    return
-
-            print_to_stderr(self.msip_ese_object, "Cannot find gds config file for:\t" + target_gds_file)
+            gds_config_cache = self.msip_ese_object.get_gds_config_cache
+
+            prepared_gds_files = dict(prepared_gds_files) if prepared_gds_files is not None else {}
+            for job_arguments, job_result, job_exception in run_parallel_jobs(self.prepare_gds_config_file,
+                                                                              [[gds_target_file] for gds_target_file in gds_target_files_list
+                                                                               if gds_target_file not in prepared_gds_files],
+                                                                              self.msip_ese_object.get_max_parallel_jobs):
+                prepared_gds_files[job_arguments[0]] = job_result if job_exception is None else ["", "ICWBEV"]
+
+            icwbev_gds_files_list = sorted([gds_target_file for gds_target_file in gds_target_files_list if prepared_gds_files[gds_target_file][1] == "ICWBEV"])
+            session_size = icwbev_max_gds_files_per_session if icwbev_max_gds_files_per_session > 0 else max(1, get_list_length(icwbev_gds_files_list))
+
+            job_arguments_list = []
+            for session_index, first_file_index in enumerate(range(0, get_list_length(icwbev_gds_files_list), session_size)):
+                job_arguments_list.append([icwbev_gds_files_list[first_file_index:first_file_index + session_size], untar_directory_path,
+                                           "gds_config_session_" + str(session_index)])
+
+            failed_gds_files_report = ""
+            for job_arguments, job_result, job_exception in run_parallel_jobs(self.generate_gds_config_files, job_arguments_list,
+                                                                              self.msip_ese_object.get_max_parallel_jobs):
+                for gds_target_file in job_arguments[0]:
+                    if job_exception is not None:
+                        failed_gds_files_report += "\n\t" + gds_target_file + "\n\t\t" + str(job_exception)
+                    elif not self.check_if_config_file_is_valid(gds_target_file):
+                        failed_gds_files_report += "\n\t" + gds_target_file + "\n\t\tCannot find gds config file"
+
+            # Storing the analysed GDS content into the cache and sharing it with the GDS files of the same content
+            for gds_target_file in sorted(gds_target_files_list):
+                gds_file_digest, gds_config_status = prepared_gds_files[gds_target_file]
+                if gds_config_status in ["NATIVE", "ICWBEV"] and self.check_if_config_file_is_valid(gds_target_file):
+                    gds_config = read_gds_config_file(gds_target_file)
+                    if gds_config is not None:
+                        gds_config_cache.add_gds_config(gds_file_digest, gds_config[0], gds_config[1])
+            self.finish_analysed_gds_digests()
+            for gds_target_file in sorted(gds_target_files_list):
+                gds_file_digest, gds_config_status = prepared_gds_files[gds_target_file]
+                if gds_config_status == "SHARED":
+                    # The GDS file of the same content can be analysed by other test case spec, which is still running
+                    with self.msip_ese_object.analysed_gds_digests_lock:
+                        analysed_gds_event = self.msip_ese_object.analysed_gds_digests[gds_file_digest][1]
+                    analysed_gds_event.wait()
+                    gds_config = gds_config_cache.get_gds_config(gds_file_digest)
+                    if gds_config is not None:
+                        write_gds_config_file(gds_target_file, gds_config[0], gds_config[1])
+                    elif not self.analyse_gds_file(gds_target_file):
+                        print_to_stdout(self.msip_ese_object, "WARNING!:\tThe analysis of the same GDS content is failed for:\t" + gds_target_file)
+            gds_config_cache.save()
+
+            for gds_target_file in gds_target_files_list:
+                if gds_target_file not in icwbev_gds_files_list and not self.check_if_config_file_is_valid(gds_target_file):
+                    failed_gds_files_report += "\n\t" + gds_target_file + "\n\t\tCannot find gds config file"
+
+            for gds_target_file in gds_target_files_list:
+                self.msip_ese_object.get_run_journal.record("GDS_CONFIG", gds_target_file, "DONE" if self.check_if_config_file_is_valid(gds_target_file) else "FAILED",
+                                                            {"status": prepared_gds_files[gds_target_file][1]})
+
+            if get_string_length(failed_gds_files_report) > 0:
+                print_to_stderr(self.msip_ese_object, "GDS config file generation failed for the following GDS file(s):" + failed_gds_files_report)
 
         def get_list_from_excel_line(self, line, index_name):
             """
@@ -3147,88 +6456,227 @@ chmod -R 777 *
             else:
                 return []
 
-        def move_test_case_files(self, source_directory, destination_directory, untar_directory_path):
+        def get_test_case_files(self, destination_directory):
+            """
+            The function is returning all files of the test case defined in excel file with their target directories
+            :param destination_directory:
+            :return: List of [excel information, target directory]
+            """
+
+            test_case_files_list = []
+            for excel_option_index, test_case_directory_index in test_case_files_directories_map:
+                for excel_information in self.get_list_from_excel_line(self.excel_setup[available_excel_options[excel_option_index]],
+                                                                       available_excel_options[excel_option_index]):
+                    test_case_files_list.append([excel_information, os.path.join(destination_directory, project_test_case_directories_list[test_case_directory_index])])
+
+            return test_case_files_list
+
+        def move_test_case_files(self, source_directory, destination_directory, untar_directory_path, moved_files=None, prepared_gds_files=None):
             """
             The function is moving all necessary data of the test case from source path to environment
             :param source_directory:
             :param destination_directory:
             :param untar_directory_path:
+            :param moved_files: Target files already moved during the package extraction
+            :param prepared_gds_files: GDS file -> prepare_gds_config_file result of the GDS files already prepared during the package extraction
             :return:
             """
 
-            # Moving test bench files
-            create_directory(destination_directory, project_test_case_directories_list[3])
-            self.move_file(self.msip_ese_object.excel_setup[available_excel_options[6]], source_directory, os.path.join(destination_directory,
-                                                                                                                        project_test_case_directories_list[3]))
-            # Moving LVS and GDS Files
-            gds_files_list = self.get_list_from_excel_line(self.msip_ese_object.excel_setup[available_excel_options[7]], available_excel_options[7])
-            create_directory(destination_directory, project_test_case_directories_list[1])
-            for gds_file in gds_files_list:
-                gds_target_file = self.move_file(gds_file, source_directory, os.path.join(destination_directory, project_test_case_directories_list[1]))
-                self.generate_gds_config_file(gds_target_file, untar_directory_path, get_file_path(gds_target_file))
-                self.check_config_file_existence(gds_target_file)
-
-            lvs_files_list = self.get_list_from_excel_line(self.msip_ese_object.excel_setup[available_excel_options[8]], available_excel_options[8])
-            create_directory(destination_directory, project_test_case_directories_list[2])
-            for lvs_file in lvs_files_list:
-                self.move_file(lvs_file, source_directory, os.path.join(destination_directory, project_test_case_directories_list[2]))
-
-            # Moving Measure Files
-            measure_files_list = self.get_list_from_excel_line(self.msip_ese_object.excel_setup[available_excel_options[11]], available_excel_options[11])
-            create_directory(destination_directory, project_test_case_directories_list[4])
-            for measure_file in measure_files_list:
-                self.move_file(measure_file, source_directory, os.path.join(destination_directory, project_test_case_directories_list[4]))
-
-            # Moving Other Include Files
-            include_files_list = self.get_list_from_excel_line(self.msip_ese_object.excel_setup[available_excel_options[12]], available_excel_options[12])
-            create_directory(destination_directory, project_test_case_directories_list[5])
-            for include_file in include_files_list:
-                self.move_file(include_file, source_directory, os.path.join(destination_directory, project_test_case_directories_list[5]))
-
-            # Moving User result files
-            user_result_files_list = self.get_list_from_excel_line(self.msip_ese_object.excel_setup[available_excel_options[13]], available_excel_options[13])
-            create_directory(destination_directory, project_test_case_directories_list[6])
-            for measure_file in user_result_files_list:
-                self.move_file(measure_file, source_directory, os.path.join(destination_directory, project_test_case_directories_list[6]))
-
-            user_result_files_list = self.get_list_from_excel_line(self.msip_ese_object.excel_setup[available_excel_options[14]], available_excel_options[14])
-            for spf_file in user_result_files_list:
-                self.move_file(spf_file, source_directory, os.path.join(destination_directory, project_test_case_directories_list[6]))
+            import shutil
+
+            moved_files = moved_files if moved_files is not None else set()
+
+            for test_case_directory_index in sorted(set([file_directory_index[1] for file_directory_index in test_case_files_directories_map])):
+                create_directory(destination_directory, project_test_case_directories_list[test_case_directory_index])
+
+            # Moving test bench, GDS, LVS, measure, other include and user result files
+            gds_target_files_list = []
+            for excel_information, target_directory in self.get_test_case_files(destination_directory):
+                target_file = os.path.join(target_directory, get_file_name_from_path(get_package_member_name(excel_information)))
+                if target_file not in moved_files:
+                    target_file = self.move_file(excel_information, source_directory, target_directory)
+                if target_directory == os.path.join(destination_directory, project_test_case_directories_list[1]) and target_file not in gds_target_files_list:
+                    gds_target_files_list.append(target_file)
+            self.generate_all_gds_config_files(gds_target_files_list, untar_directory_path, prepared_gds_files)
 
             # Copy the excel file into the test bench directory
             create_directory(destination_directory, project_test_case_directories_list[0])
-            excel_file = self.msip_ese_object.get_script_excel_file
+            excel_file = self.excel_file
             shutil.copy(excel_file, os.path.join(destination_directory, project_test_case_directories_list[0], get_file_name_from_path(excel_file)))
 
+        def get_package_members_target_directories(self, destination_directory):
+            """
+            The function is returning normalized names of all package files used by the test case with their target directories
+            :param destination_directory:
+            :return: Dictionary of member name -> list of target directories
+            """
+
+            members_target_directories = {}
+            for excel_information, target_directory in self.get_test_case_files(destination_directory):
+                member_name = get_normalized_member_name(get_package_member_name(excel_information))
+                if member_name is not None and member_name != os.curdir:
+                    member_target_directories = members_target_directories.setdefault(member_name, [])
+                    if target_directory not in member_target_directories:
+                        member_target_directories.append(target_directory)
+
+            return members_target_directories
+
+        def ingest_package_member(self, extracted_file, untar_directory_path, target_directories_list, gds_target_directory):
+            """
+            The function is moving just extracted package file to all its target directories and preparing GDS config file if it is a GDS file
+            :param extracted_file:
+            :param untar_directory_path:
+            :param target_directories_list:
+            :param gds_target_directory:
+            :return: [list of moved files, GDS file -> prepare_gds_config_file result]
+            """
+
+            moved_files_list = []
+            prepared_gds_files = {}
+            for target_directory in target_directories_list:
+                target_file = self.move_file(os.path.relpath(extracted_file, untar_directory_path), untar_directory_path, target_directory)
+                moved_files_list.append(target_file)
+                if target_directory == gds_target_directory:
+                    prepared_gds_files[target_file] = self.prepare_gds_config_file(target_file)
+
+            return [moved_files_list, prepared_gds_files]
+
+        def link_package_member(self, file_digest, member_file, target_directories_list, gds_target_directory):
+            """
+            The function is linking the stored package file to all its target directories and preparing GDS config file if it is a GDS file
+            :param file_digest:
+            :param member_file: The package file path, as it would be extracted
+            :param target_directories_list:
+            :param gds_target_directory:
+            :return: [list of linked files, GDS file -> prepare_gds_config_file result]
+            """
+
+            linked_files_list = []
+            prepared_gds_files = {}
+            object_path = self.msip_ese_object.get_object_store.get_object_path(file_digest)
+            for target_directory in target_directories_list:
+                target_file = os.path.join(target_directory, get_file_name_from_path(member_file))
+                linked_files_list.append(target_file)
+                if self.check_if_file_is_unchanged(object_path, target_file, file_digest) is not None:
+                    print_to_stdout(self.msip_ese_object, "File is not changed:\t" + target_file)
+                    materialization_method = self.previous_manifest_files[target_file].get("method")
+                else:
+                    materialization_method = self.msip_ese_object.get_object_store.link_object(file_digest, target_file, test_case_materialization_methods)
+                    if materialization_method is None:
+                        print_to_stderr(self.msip_ese_object, "Cannot link file from the object store:\t'" + member_file + "'\tTo\t'" + target_file + "'")
+                    self.record_materialized_file(target_file, materialization_method)
+
+                self.add_manifest_file(target_file, object_path, file_digest, materialization_method)
+                with self.manifest_lock:
+                    self.manifest_files[target_file]["source"] = member_file
+                if target_directory == gds_target_directory:
+                    prepared_gds_files[target_file] = self.prepare_gds_config_file(target_file)
+
+            return [linked_files_list, prepared_gds_files]
+
+        def ingest_test_case_package(self, zip_file, untar_directory_path, destination_directory):
+            """
+            The function is extracting the test case package and moving each extracted file to the test case directories, while the package is still read.
+            The GDS config files of the extracted GDS files are prepared in parallel as well
+            :param zip_file:
+            :param untar_directory_path:
+            :param destination_directory:
+            :return: [set of moved files, GDS file -> prepare_gds_config_file result]
+            """
+
+            members_target_directories = self.get_package_members_target_directories(destination_directory)
+            for test_case_directory_index in sorted(set([file_directory_index[1] for file_directory_index in test_case_files_directories_map])):
+                create_directory(destination_directory, project_test_case_directories_list[test_case_directory_index])
+            gds_target_directory = os.path.join(destination_directory, project_test_case_directories_list[1])
+
+            ingest_jobs_list = []
+            from concurrent.futures import ThreadPoolExecutor
+            ingest_executor = ThreadPoolExecutor(max_workers=self.msip_ese_object.get_max_parallel_jobs)
+
+            def submit_package_member(extracted_file):
+                member_name = get_normalized_member_name(os.path.relpath(extracted_file, untar_directory_path))
+                ingest_jobs_list.append(ingest_executor.submit(run_limited_job, self.ingest_package_member, extracted_file, untar_directory_path,
+                                                               members_target_directories.get(member_name, []), gds_target_directory))
+
+            # The package is extracted only if its members are not in the object store already
+            stored_package_members = None
+            if test_case_object_store_enabled and get_list_length(members_target_directories) > 0:
+                stored_package_members = self.msip_ese_object.get_object_store.get_package_members(zip_file, members_target_directories.keys())
+
+            try:
+                if stored_package_members is not None:
+                    print_to_stdout(self.msip_ese_object, "All required files of the package are in the object store, skipping package extraction:\t" + zip_file)
+                    for member_name in sorted(stored_package_members.keys()):
+                        ingest_jobs_list.append(ingest_executor.submit(run_limited_job, self.link_package_member, stored_package_members[member_name],
+                                                                       os.path.join(untar_directory_path, member_name), members_target_directories[member_name],
+                                                                       gds_target_directory))
+                else:
+                    untar_zip_package(zip_file, untar_directory_path, set(members_target_directories.keys()), submit_package_member)
+            finally:
+                ingest_executor.shutdown(wait=True)
+
+            moved_files = set()
+            prepared_gds_files = {}
+            for ingest_job in ingest_jobs_list:
+                moved_files_list, member_prepared_gds_files = ingest_job.result()
+                moved_files.update(moved_files_list)
+                prepared_gds_files.update(member_prepared_gds_files)
+
+            if test_case_object_store_enabled and stored_package_members is None:
+                package_members = {}
+                for member_name in members_target_directories.keys():
+                    if check_for_file_existence(untar_directory_path, member_name):
+                        file_digest = self.msip_ese_object.get_object_store.get_file_digest(os.path.join(untar_directory_path, member_name))
+                        if get_string_length(file_digest) > 0:
+                            package_members[member_name] = file_digest
+                self.msip_ese_object.get_object_store.add_package(zip_file, package_members)
+            if test_case_object_store_enabled:
+                self.msip_ese_object.get_object_store.save()
+
+            return [moved_files, prepared_gds_files]
+
         def update_test_cases(self):
             """
             The main function of TestCase class
             """
 
-            if self.msip_ese_object.get_script_excel_file is not None:
+            if self.excel_file is not None:
                 self.check_for_excel_file_required_information()
                 print_to_stdout(self.msip_ese_object, "UPDATING TEST CASES STEP")
-                test_case_directory = create_directories_hierarchy(self.msip_ese_object.get_test_cases_directory, [self.msip_ese_object.excel_setup[available_excel_options[0]],
-                                                                                                                   self.msip_ese_object.excel_setup[available_excel_options[3]]])
-
-                if not self.check_for_test_case_existence(test_case_directory):
-                    self.msip_ese_object.enable_force_add_test_case()
-                else:
-                    self.msip_ese_object.disable_force_add_test_case()
-
-                if self.msip_ese_object.get_force_add_test_case_option:
+                test_case_directory = create_directories_hierarchy(self.msip_ese_object.get_test_cases_directory, [self.excel_setup[available_excel_options[0]],
+                                                                                                                   self.excel_setup[available_excel_options[3]]])
+
+                # The test case is added from scratch if it does not exist yet
+                force_update = self.msip_ese_object.get_force_add_test_case_option or not self.check_for_test_case_existence(test_case_directory)
+
+                package_path = str(self.excel_setup[available_excel_options[5]])
+                previous_target_files = list(self.read_test_case_manifest(test_case_directory)["files"].keys())
+                incremental_update = not force_update and self.msip_ese_object.get_incremental_update_test_case_option
+                if incremental_update:
+                    if self.check_if_test_case_is_up_to_date(test_case_directory, package_path):
+                        print_to_stdout(self.msip_ese_object, "Test case is up to date:\t" + test_case_directory)
+                        return
+                    self.previous_manifest_files = self.read_test_case_manifest(test_case_directory)["files"]
+                    print_to_stdout(self.msip_ese_object, "Updating changed files of the test case:\t" + test_case_directory)
+
+                if force_update or incremental_update:
                     test_case_untar_directory = create_directories_hierarchy(self.msip_ese_object.get_script_run_directory,
-                                                                             [self.msip_ese_object.excel_setup[available_excel_options[0]],
-                                                                              self.msip_ese_object.excel_setup[available_excel_options[3]],
+                                                                             [self.excel_setup[available_excel_options[0]],
+                                                                              self.excel_setup[available_excel_options[3]],
                                                                               untar_directory_name])
-                    if str(self.msip_ese_object.excel_setup[available_excel_options[5]]).endswith(tar_file_extension):
-                        untar_zip_package(self.msip_ese_object.excel_setup[available_excel_options[5]], test_case_untar_directory)
+                    moved_files = set()
+                    prepared_gds_files = {}
+                    if str(self.excel_setup[available_excel_options[5]]).endswith(tar_file_extension):
+                        moved_files, prepared_gds_files = self.ingest_test_case_package(self.excel_setup[available_excel_options[5]],
+                                                                                        test_case_untar_directory, test_case_directory)
                         source_directory_path = test_case_untar_directory
                     else:
-                        source_directory_path = str(self.msip_ese_object.excel_setup[available_excel_options[5]])
+                        source_directory_path = str(self.excel_setup[available_excel_options[5]])
 
                     if check_for_dir_existence(get_file_path(source_directory_path), get_file_name_from_path(source_directory_path)):
-                        self.move_test_case_files(source_directory_path, test_case_directory, test_case_untar_directory)
+                        self.move_test_case_files(source_directory_path, test_case_directory, test_case_untar_directory, moved_files, prepared_gds_files)
+                        self.remove_test_case_files(previous_target_files)
+                        self.write_test_case_manifest(test_case_directory, package_path)
 
     class Extract:
         """
@@ -3244,6 +6692,16 @@ chmod -R 777 *
 
             self.msip_ese_object = msip_ese_object
 
+            # The compiled sample runscript templates. Key = sample runscript directory, Value = template
+            self.sample_runscript_templates = {}
+            self.sample_runscript_templates_lock = threading.Lock()
+
+            # The PEX inputs fingerprints. Key = PEX sh command, Value = [PEX output directory, fingerprint]
+            self.pex_fingerprints = {}
+            # The PEX sh commands skipped as their outputs are up to date
+            self.up_to_date_pex_scripts = set()
+            self.pex_fingerprints_lock = threading.Lock()
+
         def grab_layer_numbers_from_layer_map(self, layer_map_file):
             """
             The function is returning list of layer numbers
@@ -3284,10 +6742,13 @@ chmod -R 777 *
                 for line in runscript_file_object.readlines():
                     if "export STREAM_FILE=" in line:
                         layer_hash[metal_stack] = self.grab_layer_numbers_from_layer_map(line.split('STREAM_FILE="')[1].replace('"', ""))
+                runscript_file_object.close()
 
-        def get_test_cases(self):
+            return layer_hash
+
+        def find_test_cases(self):
             """
-            The function is returning hash with test case packages
+            The function is returning hash with test case packages. Key = test case name, Value = test case path
             :return:
             """
 
@@ -3316,6 +6777,20 @@ chmod -R 777 *
                 # noinspection PyUnboundLocalVariable
                 test_cases_hash[test_case_name] = test_case_path
 
+            return test_cases_hash
+
+        def get_test_cases(self):
+            """
+            The function is setting hash with test case packages
+            :return:
+            """
+
+            project_name = self.msip_ese_object.get_reference_project_name
+            if project_name is None:
+                project_name = self.msip_ese_object.get_target_project_name
+
+            test_cases_hash = self.find_test_cases()
+
             if get_list_length(test_cases_hash.keys()) > 0:
                 self.msip_ese_object.set_project_test_cases(test_cases_hash)
             else:
@@ -3323,6 +6798,58 @@ chmod -R 777 *
                     self.msip_ese_object.get_test_cases_directory) +
                                 "'")
 
+        def get_selected_test_cases(self):
+            """
+            The function is returning hash with the test cases of the test case specs, or all test cases if there is no test case spec.
+            Key = test case name, Value = test case path
+            :return:
+            """
+
+            if self.msip_ese_object.get_executed_test_case_package is not None or get_list_length(self.msip_ese_object.get_excel_specs) < 1:
+                return self.find_test_cases()
+
+            project_name = self.msip_ese_object.get_reference_project_name
+            if project_name is None:
+                project_name = self.msip_ese_object.get_target_project_name
+
+            test_cases_hash = {}
+            for excel_file, sheet_name, excel_setup in self.msip_ese_object.get_excel_specs:
+                test_case_name = str(excel_setup[available_excel_options[0]])
+                test_cases_hash[test_case_name] = os.path.join(self.msip_ese_object.get_test_cases_directory, test_case_name, project_name)
+
+            return test_cases_hash
+
+        def get_required_metal_stacks(self):
+            """
+            The function is returning set of metal stacks, which are used by GDS files of the selected test cases
+            :return:
+            """
+
+            required_metal_stacks = set()
+
+            for test_case_name, test_case_path in self.get_selected_test_cases().items():
+                gds_directory = os.path.join(test_case_path, project_test_case_directories_list[1])
+                for file_name in get_directory_items_list(gds_directory):
+                    if file_name.endswith(gds_file_extension) and check_for_file_existence(gds_directory, file_name + gds_config_file_extension):
+                        required_metal_stacks.add(self.get_top_cell_name_and_metal(test_case_path, file_name)[1])
+
+            return required_metal_stacks
+
+        def get_sample_runscript_template(self, sample_file_directory):
+            """
+            The function is returning the compiled template of the stored sample runscript. Each sample runscript is read only once
+            :param sample_file_directory:
+            :return:
+            """
+
+            with self.sample_runscript_templates_lock:
+                if sample_file_directory not in self.sample_runscript_templates:
+                    sample_file_object = open_file_for_reading(sample_file_directory, project_sample_runscript_file_name)
+                    self.sample_runscript_templates[sample_file_directory] = compile_sample_runscript_template(sample_file_object.read())
+                    sample_file_object.close()
+
+                return self.sample_runscript_templates[sample_file_directory]
+
         def create_sample_runscript(self, extract_run_directory, extract_output_dir, test_case_path, file_name, top_cell_name, sample_file_directory):
             """
             The function is generating environment for execution extract
@@ -3356,19 +6883,16 @@ chmod -R 777 *
             except FileExistsError:
                 print_to_stdout(self.msip_ese_object, "Link files already exist:\t" + os.path.join(extract_run_directory, file_name + gds_config_file_extension))
 
-            sample_file_object = open_file_for_reading(sample_file_directory, project_sample_runscript_file_name)
+            sample_runscript_template = self.get_sample_runscript_template(sample_file_directory)
             block_extract_command_file_object = open_file_for_writing(extract_run_directory, file_base_name + "_" + project_extract_directory_name + ".sh")
-
-            for line in sample_file_object.readlines():
-                line = line.replace('export RUN_DIR="";', "export RUN_DIR=" + extract_run_directory + ";")
-                line = line.replace("export TOP_CELL_NAME=\"\";", "export TOP_CELL_NAME=" + top_cell_name + ";")
-                line = line.replace("export GDS_FILE=\"\";", "export GDS_FILE=" + file_base_name + gds_file_extension + ";")
-                line = line.replace("export LVS_NETLIST=\"\";", "export LVS_NETLIST=" + file_base_name + ".cdl")
-                line = line.replace("export OUTPUT_DIR=\"\"", "export OUTPUT_DIR=" + extract_output_dir)
-                line = line.replace("cd ${RUN_DIR};", "cd ${RUN_DIR};\nmkdir STAR_rcc_typical\nmkdir STAR_rc_typical\nmkdir STAR_srccpcc_typical\nmkdir STAR_cc_typical\n")
-                block_extract_command_file_object.writelines(line)
-
-            sample_file_object.close()
+            block_extract_command_file_object.write(render_sample_runscript_template(sample_runscript_template,
+                                                                                     {"RUN_DIR": extract_run_directory,
+                                                                                      "TOP_CELL_NAME": top_cell_name,
+                                                                                      "GDS_FILE": file_base_name + gds_file_extension,
+                                                                                      "LVS_NETLIST": file_base_name + ".cdl",
+                                                                                      "OUTPUT_DIR": extract_output_dir,
+                                                                                      "STAR_DIRECTORIES": "".join(["mkdir " + star_directory + "\n" for star_directory in
+                                                                                                                   extract_star_directories_list])}))
             block_extract_command_file_object.close()
 
             self.create_top_cell_subckt_file(top_cell_name, file_base_name + ".cdl", extract_run_directory)
@@ -3379,7 +6903,7 @@ chmod -R 777 *
             :return:
             """
 
-            return_variable = ["", "12M_2X_vh_1Ya_v_4Y_hvhv_2Yy2Z"]
+            return_variable = ["", default_metal_stack]
 
             config_file = os.path.join(test_case_path, project_test_case_directories_list[1], gds_file_name + gds_config_file_extension)
             if not check_for_file_existence(os.path.join(test_case_path, project_test_case_directories_list[1]), gds_file_name + gds_config_file_extension):
@@ -3389,6 +6913,8 @@ chmod -R 777 *
                 for line in config_file_object.readlines():
                     if "TOP_CELL_NAME:" in line:
                         return_variable[0] = line.split()[1]
+                    elif "METAL_STACK:" in line and get_list_length(line.split()) > 1:
+                        return_variable[1] = line.split()[1]
 
                 config_file_object.close()
 
@@ -3421,6 +6947,136 @@ chmod -R 777 *
             lvs_file_object.close()
             subckt_file_object.close()
 
+        def create_gds_extract_environment(self, test_case_name, test_case_path, file_name):
+            """
+            The function is creating extraction environments of one GDS file for target and reference projects
+            :param test_case_name:
+            :param test_case_path:
+            :param file_name:
+            :return: List of [project name, project release, PEX sh command] for each created extraction environment
+            """
+
+            file_abs_name = get_file_name_from_path(file_name)
+            pex_command_name = file_abs_name.replace(gds_file_extension, "") + "_" + project_extract_directory_name + ".sh"
+
+            gds_info = self.get_top_cell_name_and_metal(test_case_path, file_name)
+            metal_stack = gds_info[1]
+
+            all_projects = [[self.msip_ese_object.get_target_project_type, self.msip_ese_object.get_target_project_name,
+                             self.msip_ese_object.get_target_project_release]]
+            if self.msip_ese_object.check_for_reference_project_execution():
+                all_projects.append([self.msip_ese_object.get_reference_project_type, self.msip_ese_object.get_reference_project_name,
+                                     self.msip_ese_object.get_reference_project_release])
+
+            pex_commands_list = []
+            for project_type, project_name, project_release in all_projects:
+                test_case_extract_dir = create_directories_hierarchy(self.msip_ese_object.get_script_run_directory,
+                                                                     [test_case_name, project_name, project_release, project_extract_directory_name,
+                                                                      file_abs_name.upper()])
+                test_case_output_dir = create_directories_hierarchy(self.msip_ese_object.get_results_directory,
+                                                                    [test_case_name, project_name, project_release, project_SPF_directory_name,
+                                                                     file_abs_name.upper()])
+
+                sample_file_directory = os.path.join(self.msip_ese_object.get_data_directory,
+                                                     project_sample_runscript_location_dir_name,
+                                                     project_type,
+                                                     project_name,
+                                                     project_release,
+                                                     metal_stack,
+                                                     project_extract_directory_name)
+                self.create_sample_runscript(test_case_extract_dir, test_case_output_dir, test_case_path, file_name, gds_info[0], sample_file_directory)
+
+                pex_command = os.path.join(test_case_extract_dir, pex_command_name)
+                with self.pex_fingerprints_lock:
+                    self.pex_fingerprints[pex_command] = [test_case_output_dir, self.get_pex_fingerprint(test_case_extract_dir, file_name, sample_file_directory)]
+                pex_commands_list.append([project_name, project_release, pex_command])
+
+            return pex_commands_list
+
+        def get_pex_fingerprint(self, extract_run_directory, file_name, sample_file_directory):
+            """
+            The function is returning the fingerprint of all PEX inputs: GDS, GDS config, LVS netlist, top cell subckt, the generated PEX sh command,
+            the content of the decks, option files and StarRC starcmd referenced by it and the fingerprint of the project setup used for the sample runscript generation
+            :param extract_run_directory:
+            :param file_name:
+            :param sample_file_directory:
+            :return:
+            """
+
+            file_base_name = get_file_name_from_path(file_name).replace(gds_file_extension, "")
+
+            # The GDS files are big, so their digests are taken from the GDS config cache, when the file is not changed
+            fingerprint_values = [self.msip_ese_object.get_gds_config_cache.get_gds_file_digest(os.path.realpath(os.path.join(extract_run_directory, file_name)))]
+            for input_file_name in [file_name + gds_config_file_extension, file_base_name + ".cdl", top_cell_subckt_file_name,
+                                    file_base_name + "_" + project_extract_directory_name + ".sh"]:
+                fingerprint_values.append(get_file_digest(os.path.join(extract_run_directory, input_file_name)))
+
+            # The decks, option files and StarRC starcmd can be changed in place, so the content of all files referenced by the PEX sh command is used
+            for referenced_file in get_referenced_files(os.path.join(extract_run_directory, file_base_name + "_" + project_extract_directory_name + ".sh")):
+                fingerprint_values += [referenced_file, get_file_digest(referenced_file)]
+
+            if check_for_file_existence(sample_file_directory, project_sample_runscript_fingerprint_file_name):
+                fingerprint_file_object = open_file_for_reading(sample_file_directory, project_sample_runscript_fingerprint_file_name)
+                fingerprint_values.append(fingerprint_file_object.read().strip())
+                fingerprint_file_object.close()
+
+            return hashlib.sha1("\n".join(fingerprint_values).encode("utf-8")).hexdigest()
+
+        def check_if_pex_is_up_to_date(self, pex_script):
+            """
+            The function is checking if the PEX output is complete and was generated from the current PEX inputs
+            :param pex_script:
+            :return: True if up to date, False if not
+            """
+
+            with self.pex_fingerprints_lock:
+                pex_fingerprint_info = self.pex_fingerprints.get(pex_script)
+
+            if pex_fingerprint_info is None:
+                return False
+
+            output_directory, fingerprint = pex_fingerprint_info
+            if not check_for_file_existence(output_directory, pex_inputs_fingerprint_file_name):
+                return False
+
+            fingerprint_file_object = open_file_for_reading(output_directory, pex_inputs_fingerprint_file_name)
+            stored_fingerprint = fingerprint_file_object.read().strip()
+            fingerprint_file_object.close()
+
+            if stored_fingerprint != fingerprint:
+                return False
+
+            for file_entry in scan_directory_files(output_directory):
+                if file_entry.name.endswith(project_extract_file_extension) and get_file_size(file_entry.path):
+                    return True
+
+            return False
+
+        def write_pex_fingerprint(self, pex_script):
+            """
+            The function is storing the PEX inputs fingerprint next to the PEX output, after the successful PEX run
+            :param pex_script:
+            :return:
+            """
+
+            with self.pex_fingerprints_lock:
+                pex_fingerprint_info = self.pex_fingerprints.get(pex_script)
+
+            if pex_fingerprint_info is not None:
+                fingerprint_file_object = open_file_for_writing(pex_fingerprint_info[0], pex_inputs_fingerprint_file_name)
+                fingerprint_file_object.write(pex_fingerprint_info[1] + "\n")
+                fingerprint_file_object.close()
+
+        def get_test_case_gds_files(self, test_case_path):
+            """
+            The function is returning all GDS files names of the test case
+            :param test_case_path:
+            :return:
+            """
+
+            return sorted([file_name for file_name in get_directory_items_list(os.path.join(test_case_path, project_test_case_directories_list[1]))
+                           if file_name.endswith(gds_file_extension)])
+
         def create_extract_environment(self, test_case_name, test_case_path):
             """
             The function is creating extraction environments
@@ -3429,72 +7085,8 @@ chmod -R 777 *
 
             shell_command_path = os.path.join(self.msip_ese_object.get_script_run_directory, test_case_name)
 
-            test_case_target_root_dir = create_directories_hierarchy(self.msip_ese_object.get_script_run_directory,
-                                                                     [test_case_name,
-                                                                      self.msip_ese_object.get_target_project_name,
-                                                                      self.msip_ese_object.get_target_project_release,
-                                                                      project_extract_directory_name])
-
-            test_case_target_result_directory = create_directories_hierarchy(self.msip_ese_object.get_results_directory,
-                                                                             [test_case_name,
-                                                                              self.msip_ese_object.get_target_project_name,
-                                                                              self.msip_ese_object.get_target_project_release,
-                                                                              project_SPF_directory_name])
-
-            if self.msip_ese_object.check_for_reference_project_execution():
-                test_case_reference_root_dir = create_directories_hierarchy(self.msip_ese_object.get_script_run_directory,
-                                                                            [test_case_name,
-                                                                             self.msip_ese_object.get_reference_project_name,
-                                                                             self.msip_ese_object.get_reference_project_release,
-                                                                             project_extract_directory_name])
-
-                test_case_reference_result_directory = create_directories_hierarchy(self.msip_ese_object.get_results_directory,
-                                                                                    [test_case_name,
-                                                                                     self.msip_ese_object.get_reference_project_name,
-                                                                                     self.msip_ese_object.get_reference_project_release,
-                                                                                     project_SPF_directory_name])
-
-            test_case_all_gds_files = get_directory_items_list(os.path.join(test_case_path, project_test_case_directories_list[1]))
-
-            for file_name in test_case_all_gds_files:
-                if file_name.endswith(gds_file_extension):
-                    file_abs_name = get_file_name_from_path(file_name)
-
-                    create_directory(test_case_target_root_dir, file_abs_name.upper())
-                    create_directory(test_case_target_result_directory, file_abs_name.upper())
-
-                    test_case_target_dir = os.path.join(test_case_target_root_dir, file_abs_name.upper())
-                    test_case_target_output_dir = os.path.join(test_case_target_result_directory, file_abs_name.upper())
-
-                    gds_info = self.get_top_cell_name_and_metal(test_case_path, file_name)
-                    metal_stack = gds_info[1]
-
-                    self.create_sample_runscript(test_case_target_dir, test_case_target_output_dir, test_case_path, file_name, gds_info[0],
-                                                 os.path.join(self.msip_ese_object.get_data_directory,
-                                                              project_sample_runscript_location_dir_name,
-                                                              self.msip_ese_object.get_target_project_type,
-                                                              self.msip_ese_object.get_target_project_name,
-                                                              self.msip_ese_object.get_target_project_release,
-                                                              metal_stack,
-                                                              project_extract_directory_name))
-
-                    # Reference Project Part
-
-                    if self.msip_ese_object.check_for_reference_project_execution():
-                        create_directory(test_case_reference_root_dir, file_abs_name.upper())
-                        create_directory(test_case_reference_result_directory, file_abs_name.upper())
-
-                        test_case_reference_dir = os.path.join(test_case_reference_root_dir, file_abs_name.upper())
-                        test_case_reference_output_dir = os.path.join(test_case_reference_result_directory, file_abs_name.upper())
-
-                        self.create_sample_runscript(test_case_reference_dir, test_case_reference_output_dir, test_case_path, file_name, gds_info[0],
-                                                     os.path.join(self.msip_ese_object.get_data_directory,
-                                                                  project_sample_runscript_location_dir_name,
-                                                                  self.msip_ese_object.get_reference_project_type,
-                                                                  self.msip_ese_object.get_reference_project_name,
-                                                                  self.msip_ese_object.get_reference_project_release,
-                                                                  metal_stack,
-                                                                  project_extract_directory_name))
+            for file_name in self.get_test_case_gds_files(test_case_path):
+                self.create_gds_extract_environment(test_case_name, test_case_path, file_name)
 
             return shell_command_path
 
@@ -3514,20 +7106,109 @@ chmod -R 777 *
 
             return all_shell_files
 
-        def execute_pex(self, test_case_dirs):
+        @staticmethod
+        def find_pex_scripts(test_case_dirs):
             """
-            The function is executing all sh commands found under RUN_DIR
+            The function is returning all PEX sh commands found under the test case run directories
             :param test_case_dirs:
             :return:
             """
 
+            pex_scripts_list = []
             for directory in test_case_dirs:
-                for root, directories, files in os.walk(directory):
-                    for file_name in files:
-                        if (file_name.endswith("_" + project_extract_directory_name + ".sh")) and ("UNTAR" not in root):
-                            process = execute_external_command(os.path.join(root, file_name))
-                            print_to_stdout(self.msip_ese_object, "EXECUTING EXTERNAL PEX COMMAND:\t" + os.path.join(root, file_name))
-                            process.wait()
+                for directory_entry in scan_directory_files(directory):
+                    if directory_entry.name.endswith("_" + project_extract_directory_name + ".sh") and (untar_directory_name not in get_file_path(directory_entry.path)):
+                        pex_scripts_list.append(directory_entry.path)
+
+            return sorted(pex_scripts_list)
+
+        def run_pex_script(self, pex_script):
+            """
+            The function is executing one PEX sh command as the unit of the run journal, unless its output is up to date or it is finished by the resumed run
+            :param pex_script:
+            :return: The PEX command exit status
+            """
+
+            if self.check_if_pex_is_up_to_date(pex_script) or self.msip_ese_object.get_run_journal.check_if_unit_is_finished("PEX", pex_script):
+                print_to_stdout(self.msip_ese_object, "PEX output is up to date, skipping PEX command:\t" + pex_script)
+                with self.pex_fingerprints_lock:
+                    self.up_to_date_pex_scripts.add(pex_script)
+                return 0
+
+            return self.msip_ese_object.get_run_journal.run_unit("PEX", pex_script, self.execute_pex_script, [pex_script], lambda exit_status: exit_status != 0)
+
+        def execute_pex_script(self, pex_script):
+            """
+            The function is executing one PEX sh command and storing the PEX inputs fingerprint after the successful run
+            :param pex_script:
+            :return: The PEX command exit status
+            """
+
+            with self.pex_fingerprints_lock:
+                pex_fingerprint_info = self.pex_fingerprints.get(pex_script)
+            if pex_fingerprint_info is not None and check_for_file_existence(pex_fingerprint_info[0], pex_inputs_fingerprint_file_name):
+                # The output of the previous inputs is not valid anymore, even if this run fails
+                os.remove(os.path.join(pex_fingerprint_info[0], pex_inputs_fingerprint_file_name))
+
+            process = execute_external_command(pex_script)
+            print_to_stdout(self.msip_ese_object, "EXECUTING EXTERNAL PEX COMMAND:\t" + pex_script)
+
+            exit_status = wait_for_external_command(process)
+            if exit_status == 0:
+                self.write_pex_fingerprint(pex_script)
+
+            return exit_status
+
+        def execute_pex(self, test_case_dirs):
+            """
+            The function is executing all PEX sh commands found under RUN_DIR in parallel and reporting summary of all PEX jobs at the end.
+            The failed PEX jobs are reported as warnings, so the other PEX jobs results are still used
+            :param test_case_dirs:
+            :return: List of [PEX command, exit status, exception]
+            """
+
+            pex_scripts_list = self.find_pex_scripts(test_case_dirs)
+            print_to_stdout(self.msip_ese_object, "Executing " + str(get_list_length(pex_scripts_list)) + " PEX command(s), maximum " +
+                            str(self.msip_ese_object.get_max_parallel_pex_jobs) + " in parallel")
+
+            pex_jobs_results = []
+            for job_arguments, job_result, job_exception in run_parallel_jobs(self.run_pex_script, [[pex_script] for pex_script in pex_scripts_list],
+                                                                              self.msip_ese_object.get_max_parallel_pex_jobs):
+                pex_jobs_results.append([job_arguments[0], job_result, job_exception])
+
+            self.report_pex_jobs_results(pex_jobs_results)
+
+            return pex_jobs_results
+
+        def report_pex_jobs_results(self, pex_jobs_results):
+            """
+            The function is reporting summary of all PEX jobs. The failed PEX jobs are reported as warnings
+            :param pex_jobs_results: List of [PEX command, exit status, exception]
+            :return:
+            """
+
+            failed_pex_jobs_report = ""
+            for pex_script, exit_status, job_exception in pex_jobs_results:
+                if job_exception is not None:
+                    failed_pex_jobs_report += "\n\t" + pex_script + "\n\t\t" + str(job_exception)
+                elif exit_status != 0:
+                    failed_pex_jobs_report += "\n\t" + pex_script + "\n\t\tExit status:\t" + str(exit_status)
+
+            with self.pex_fingerprints_lock:
+                up_to_date_pex_scripts = set(self.up_to_date_pex_scripts)
+
+            pex_summary = "PEX SUMMARY:\t" + str(get_list_length(pex_jobs_results)) + " job(s)\t" + \
+                          str(get_list_length([result for result in pex_jobs_results if result[2] is None and result[1] == 0 and
+                                               result[0] not in up_to_date_pex_scripts])) + " passed\t" + \
+                          str(get_list_length([result for result in pex_jobs_results if result[2] is not None or result[1] != 0])) + " failed\t" + \
+                          str(get_list_length([result for result in pex_jobs_results if result[0] in up_to_date_pex_scripts])) + " up to date"
+            print("\t\t" + pex_summary)
+            print_to_stdout(self.msip_ese_object, pex_summary)
+            if get_string_length(failed_pex_jobs_report) > 0:
+                print_to_stdout(self.msip_ese_object, "WARNING!:\tThe following PEX command(s) failed:" + failed_pex_jobs_report)
+
+            # The GDS files digests of the PEX inputs fingerprints
+            self.msip_ese_object.get_gds_config_cache.save()
 
     class Simulation:
         """
@@ -3549,6 +7230,15 @@ chmod -R 777 *
 
             print_to_stdout(self.msip_ese_object, "Executing Simulation")
 
+        def run_test_case_simulation(self, test_case_name):
+            """
+            The function is executing simulations of one test case
+            :param test_case_name:
+            :return:
+            """
+
+            print_to_stdout(self.msip_ese_object, "Executing Simulation for test case:\t" + test_case_name)
+
     class Report:
         """
         The Reporting class
@@ -3569,16 +7259,70 @@ chmod -R 777 *
 
             print_to_stdout(self.msip_ese_object, "Generating excel report")
 
+    def run_flow_steps(self, project_environment, test_cases_extract, simulation):
+        """
+        The function is executing environment update, test case update, PEX and SIM steps one after another
+        :param project_environment:
+        :param test_cases_extract:
+        :param simulation:
+        :return:
+        """
+
+        # The test cases are updated first, as the metal stacks of the environment update are taken from their GDS config files
+        if self.check_if_update_test_case():
+            print("\tSTEP2:\tTIME:" + get_current_time() + "\tPROCESSING ...\t\t# Checking For Test Case Update")
+            # Updating test cases of all test case specs
+            self.update_all_test_cases()
+            print("\t\tTIME:" + get_current_time() + "\tCOMPLETED")
+        else:
+            print("\tSTEP2:\tSkipping STEP 'Checking For Test Case Update'\tTIME:" + get_current_time())
+
+        if self.check_if_update_environment():
+            print("\tSTEP3:\tTIME:" + get_current_time() + "\tPROCESSING ...\t\t# Checking For Project Environment Update")
+            # Only the metal stacks used by the selected test cases are extracted
+            project_environment.limit_metal_stacks(test_cases_extract.get_required_metal_stacks())
+
+            # The sample library extraction part
+            project_environment.run_all_sample_extracts()
+
+            # Grabbing and updating in the script environment the sample runscript files
+            project_environment.grab_all_sample_run_scripts()
+            print("\t\tTIME:" + get_current_time() + "\tCOMPLETED")
+        else:
+            print("\tSTEP3:\tSkipping STEP 'Checking For Project Environment Update'\tTIME:" + get_current_time())
+
+        if self.check_if_execute_pex():
+            print("\tSTEP4:\tTIME:" + get_current_time() + "\tPROCESSING ...\t\t# Running PEX on Test Case(s)")
+            # Do extraction
+            test_cases_extract.get_test_cases()
+            test_case_dirs_list = test_cases_extract.create_all_test_cases_extract_environments()
+            test_cases_extract.execute_pex(test_case_dirs_list)
+            print("\t\tTIME:" + get_current_time() + "\tCOMPLETED")
+        else:
+            print("\tSTEP4:\tSkipping STEP 'Running PEX on Test Case(s)'\tTIME:" + get_current_time())
+
+        if self.check_if_execute_simulation():
+            print("\tSTEP5:\tTIME:" + get_current_time() + "\tPROCESSING ...\t\t# Running SIM on Test Case(s)")
+            self.get_run_journal.run_unit("SIM", "ALL", simulation.run_simulation)
+            print("\t\tTIME:" + get_current_time() + "\tCOMPLETED")
+        else:
+            print("\tSTEP5:\tSkipping STEP 'Running SIM on Test Case(s)'\tTIME:" + get_current_time())
+
     def main(self):
         """
         Main Function of the MsipEse Class
         :return:
         """
 
+        startup_time_stamps.append(["MAIN", time.time()])
+
         script_inputs_instance = self.ScriptInputs(self)
         script_arguments = script_inputs_instance.get_script_arguments()
         script_inputs_instance.set_script_inputs(script_arguments)
 
+        if self.get_time_startup_option:
+            print(get_startup_time_report())
+
         print("\nPROCESSING ...\n")
 
         # Creating environment directories
@@ -3592,6 +7336,12 @@ chmod -R 777 *
         # The script stderr file object
         self.object_stderr_file = open_file_for_writing(self.script_log_dir, self.object_log_name + ".stderr")
 
+        # All external commands are executed through the selected job backend, and all thread pools are sharing -maxParallelJobs slots
+        set_active_job_backend(self.get_job_backend)
+        set_parallel_jobs_limit(self.get_max_parallel_jobs)
+
+        self.get_run_journal.record("RUN", self.object_log_name, "START", {"resume": self.get_resume_option})
+
         print_to_stdout(self, "READING SCRIPT ARGUMENTS")
         print_to_stdout(self, "Script Inputs Is:\n" + string_column_decoration(list(script_arguments.keys()), list(script_arguments.values()), 5, 4))
 
@@ -3603,9 +7353,6 @@ chmod -R 777 *
         # The initialisation of ProjectEnvironment class instance
         project_environment = self.ProjectEnvironment(self)
 
-        # The initialisation of TestCases class instance
-        test_cases = self.TestCases(self)
-
         # The initialisation of Extract class instance
         test_cases_extract = self.Extract(self)
 
@@ -3623,48 +7370,34 @@ chmod -R 777 *
         self.check_script_setup_correctness()
         print("\t\tTIME:" + get_current_time() + "\tCOMPLETED")
 
-        if self.check_if_update_environment():
-            print("\tSTEP2:\tTIME:" + get_current_time() + "\tPROCESSING ...\t\t# Checking For Project Environment Update")
-            # The sample library extraction part
-            project_environment.run_all_sample_extracts()
-
-            # Grabbing and updating in the script environment the sample runscript files
-            project_environment.grab_all_sample_run_scripts()
+        if self.get_flow_scheduler == available_flow_schedulers[1]:
+            print("\tSTEP2-5:\tTIME:" + get_current_time() + "\tPROCESSING ...\t\t# Running Flow Graph")
+            self.run_flow_graph(project_environment, test_cases_extract, simulation)
             print("\t\tTIME:" + get_current_time() + "\tCOMPLETED")
         else:
-            print("\tSTEP2:\tSkipping STEP 'Checking For Project Environment Update'\tTIME:" + get_current_time())
+            self.run_flow_steps(project_environment, test_cases_extract, simulation)
 
-        if self.check_if_update_test_case():
-            print("\tSTEP3:\tTIME:" + get_current_time() + "\tPROCESSING ...\t\t# Checking For Test Case Update")
-            # Updating test cases
-            test_cases.update_test_cases()
+        if self.check_if_execute_report():
+            print("\tSTEP6:\tTIME:" + get_current_time() + "\tPROCESSING ...\t\t# Running Reporting step\tTIME:" + get_current_time())
+            report.gen_excel_report()
             print("\t\tTIME:" + get_current_time() + "\tCOMPLETED")
         else:
-            print("\tSTEP3:\tSkipping STEP 'Checking For Test Case Update'\tTIME:" + get_current_time())
+            print("\tSTEP6:\tSkipping STEP 'Running Reporting step'\tTIME:" + get_current_time())
 
-        if self.check_if_execute_pex():
-            print("\tSTEP4:\tTIME:" + get_current_time() + "\tPROCESSING ...\t\t# Running PEX on Test Case(s)")
-            # Do extraction
-            test_cases_extract.get_test_cases()
-            test_case_dirs_list = test_cases_extract.create_all_test_cases_extract_environments()
-            test_cases_extract.execute_pex(test_case_dirs_list)
+        if self.check_if_execute_clean_project():
+            print("\tSTEP7:\tTIME:" + get_current_time() + "\tPROCESSING ...\t\t# Cleaning temporary files")
+            # The extracted packages are not needed anymore, the test case files are in the object store or copied
+            clean_directories(self, self.get_script_run_directory)
+            if test_case_object_store_enabled:
+                self.get_object_store.collect_garbage()
             print("\t\tTIME:" + get_current_time() + "\tCOMPLETED")
         else:
-            print("\tSTEP4:\tSkipping STEP 'Running PEX on Test Case(s)'\tTIME:" + get_current_time())
+            print("\tSTEP7:\tSkipping STEP 'Cleaning temporary files'\tTIME:" + get_current_time())
 
-        if self.check_if_execute_simulation():
-            print("\tSTEP5:\tTIME:" + get_current_time() + "\tPROCESSING ...\t\t# Running SIM on Test Case(s)")
-            simulation.run_simulation()
-            print("\t\tTIME:" + get_current_time() + "\tCOMPLETED")
-        else:
-            print("\tSTEP5:\tSkipping STEP 'Running SIM on Test Case(s)'\tTIME:" + get_current_time())
+        # The logs of the finished jobs of this run are already collected
+        self.get_job_backend.clean_jobs()
 
-        if self.check_if_execute_report():
-            print("\tSTEP6:\tTIME:" + get_current_time() + "\tPROCESSING ...\t\t# Running Reporting step\tTIME:" + get_current_time())
-            report.gen_excel_report()
-            print("\t\tTIME:" + get_current_time() + "\tCOMPLETED")
-        else:
-            print("\tSTEP6:\tSkipping STEP 'Running Reporting step'\tTIME:" + get_current_time())
+        self.get_run_journal.record("RUN", self.object_log_name, "DONE")
 
 
 def main():
@@ -3674,8 +7407,10 @@ def main():
     """
 
     user_script_inputs = ScriptArguments().get_user_all_inputs()
+    startup_time_stamps.append(["ARGUMENTS", time.time()])
 
     evaluation_object = MsipEse()
+    startup_time_stamps.append(["INIT", time.time()])
     evaluation_object.set_user_script_arguments(user_script_inputs)
     evaluation_object.main()
 
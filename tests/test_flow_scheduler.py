@@ -0,0 +1,75 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import msip_ESE
+
+
+class FlowSchedulerTest(unittest.TestCase):
+    """
+    The flow graph scheduling tests
+    """
+
+    def setUp(self):
+        msip_ESE.set_parallel_jobs_limit(4)
+        self.running_nodes_lock = threading.Lock()
+        # Key = node pool, Value = [number of running nodes, maximum number of running nodes]
+        self.running_nodes = {}
+
+    def run_pool_node(self, node_pool):
+        with self.running_nodes_lock:
+            for running_nodes in [self.running_nodes.setdefault(node_pool, [0, 0]), self.running_nodes.setdefault("ALL", [0, 0])]:
+                running_nodes[0] += 1
+                running_nodes[1] = max(running_nodes[1], running_nodes[0])
+        time.sleep(0.05)
+        with self.running_nodes_lock:
+            for running_nodes in [self.running_nodes[node_pool], self.running_nodes["ALL"]]:
+                running_nodes[0] -= 1
+
+        return node_pool
+
+    @staticmethod
+    def get_node_statuses(flow_graph_results):
+        return dict([[node_name, node_status] for node_name, node_status, node_result, node_exception, node_arguments in flow_graph_results])
+
+    @staticmethod
+    def fail_node():
+        raise RuntimeError("node failed")
+
+    def test_failed_node_skips_its_dependents(self):
+        flow_graph = msip_ESE.FlowScheduler(4)
+        flow_graph.add_node("UPDATE", self.fail_node)
+        flow_graph.add_node("PEX", lambda: 0, (), ["UPDATE"])
+        flow_graph.add_node("SIM", lambda: 0, (), ["PEX"])
+        flow_graph.add_node("OTHER_SIM", lambda: 0)
+
+        node_statuses = self.get_node_statuses(flow_graph.run())
+        self.assertEqual(node_statuses, {"UPDATE": "FAILED", "PEX": "SKIPPED", "SIM": "SKIPPED", "OTHER_SIM": "DONE"})
+
+    def test_never_added_dependency_skips_the_node(self):
+        flow_graph = msip_ESE.FlowScheduler(4)
+        flow_graph.add_node("PEX", lambda: 0, (), ["NEVER_ADDED"])
+        flow_graph.add_node("SIM", lambda: 0, (), ["PEX"])
+        flow_graph.add_node("OTHER_SIM", lambda: 0)
+
+        node_statuses = self.get_node_statuses(flow_graph.run())
+        self.assertEqual(node_statuses, {"PEX": "SKIPPED", "SIM": "SKIPPED", "OTHER_SIM": "DONE"})
+
+    def test_pool_limit_is_kept_within_max_jobs(self):
+        flow_graph = msip_ESE.FlowScheduler(4, {"PEX": 2})
+        for node_index in range(8):
+            flow_graph.add_node("PEX:" + str(node_index), self.run_pool_node, ["PEX"], node_pool="PEX")
+            flow_graph.add_node("SIM:" + str(node_index), self.run_pool_node, ["DEFAULT"])
+
+        node_statuses = self.get_node_statuses(flow_graph.run())
+        self.assertEqual(set(node_statuses.values()), {"DONE"})
+        self.assertEqual(self.running_nodes["PEX"][1], 2)
+        self.assertLessEqual(self.running_nodes["ALL"][1], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import struct
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import msip_ESE
+
+
+def get_gds_record(record_name, data_type, record_data=b""):
+    return struct.pack(">HBB", 4 + len(record_data), msip_ESE.gds_record_types.get(record_name, record_name), data_type) + record_data
+
+
+def get_gds_string_record(record_name, string_value):
+    string_data = string_value.encode("ascii")
+    if len(string_data) % 2:
+        string_data += b"\0"
+
+    return get_gds_record(record_name, 6, string_data)
+
+
+def get_gds_short_record(record_name, short_value):
+    return get_gds_record(record_name, 2, struct.pack(">H", short_value))
+
+
+class GdsFileInfoTest(unittest.TestCase):
+    """
+    The native GDS file reading tests
+    """
+
+    def setUp(self):
+        self.gds_directory = tempfile.mkdtemp()
+
+        # BGNLIB, LIBNAME, BGNSTR, STRNAME, BOUNDARY, SREF and ENDEL records, which are not in gds_record_types
+        gds_content = get_gds_short_record("HEADER", 600) + get_gds_record(0x01, 2, b"\0" * 24) + get_gds_string_record(0x02, "LIB")
+        gds_content += get_gds_record(0x05, 2, b"\0" * 24) + get_gds_string_record("STRNAME", "CHILD") + get_gds_record(0x08, 0)
+        gds_content += get_gds_short_record("LAYER", 40000) + get_gds_short_record("DATATYPE", 65535) + get_gds_record(0x11, 0) + get_gds_record(0x07, 0)
+        gds_content += get_gds_record(0x05, 2, b"\0" * 24) + get_gds_string_record("STRNAME", "TOP") + get_gds_record(0x0A, 0)
+        gds_content += get_gds_string_record("SNAME", "CHILD") + get_gds_record(0x11, 0)
+        gds_content += get_gds_record(0x08, 0) + get_gds_short_record("LAYER", 3) + get_gds_short_record("DATATYPE", 0) + get_gds_record(0x11, 0)
+        gds_content += get_gds_record(0x07, 0) + get_gds_record("ENDLIB", 0)
+        self.gds_content = gds_content
+
+    def write_gds_file(self, file_name, gds_content):
+        gds_file = os.path.join(self.gds_directory, file_name)
+        with open(gds_file, mode="wb") as gds_file_object:
+            gds_file_object.write(gds_content)
+
+        return gds_file
+
+    def test_layers_above_32767_are_unsigned(self):
+        gds_file_info = msip_ESE.read_gds_file_info(self.write_gds_file("top.gds", self.gds_content))
+
+        self.assertEqual(gds_file_info, ["TOP", ["3:0", "40000:65535"]])
+
+    def test_empty_and_truncated_files_are_not_read(self):
+        self.assertIsNone(msip_ESE.read_gds_file_info(self.write_gds_file("empty.gds", b"")))
+        # Cut inside the record, and at the record boundary before ENDLIB record
+        self.assertIsNone(msip_ESE.read_gds_file_info(self.write_gds_file("cut_record.gds", self.gds_content[:-7])))
+        self.assertIsNone(msip_ESE.read_gds_file_info(self.write_gds_file("cut_library.gds", self.gds_content[:-4])))
+        self.assertIsNone(msip_ESE.read_gds_file_info(self.write_gds_file("not_gds.gds", b"junk")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import msip_ESE
+
+
+class SpoolJobBackendTest(unittest.TestCase):
+    """
+    The spool job backend submit, wait, cancel and clean tests
+    """
+
+    def setUp(self):
+        self.spool_directory = tempfile.mkdtemp()
+        self.log_directory = tempfile.mkdtemp()
+        self.job_backend = msip_ESE.SpoolJobBackend(self.spool_directory, 1)
+
+    def submit(self, command, log_name):
+        return self.job_backend.submit(command, os.path.join(self.log_directory, log_name))
+
+    def wait_for_state(self, job, state):
+        end_time = time.time() + 10
+        while self.job_backend.read_job_file(job.job_id, "state") != state:
+            self.assertLess(time.time(), end_time, "The job is not " + state)
+            time.sleep(0.05)
+
+    def test_submit_and_wait_collects_exit_status_and_logs(self):
+        job = self.submit("echo job_stdout; echo job_stderr 1>&2; exit 3", "a")
+
+        self.assertEqual(self.job_backend.wait(job), 3)
+        self.assertEqual(self.job_backend.read_job_file(job.job_id, "state"), "DONE")
+        with open(os.path.join(self.log_directory, "a.stdout"), mode="r") as log_file_object:
+            self.assertEqual(log_file_object.read(), "job_stdout\n")
+        with open(os.path.join(self.log_directory, "a.stderr"), mode="r") as log_file_object:
+            self.assertEqual(log_file_object.read(), "job_stderr\n")
+        self.assertIn("job_stdout", self.job_backend.collect_logs(job))
+
+    def test_cancel_queued_and_running_jobs(self):
+        running_job = self.submit("sleep 30", "running")
+        queued_job = self.submit("echo never", "queued")
+        self.wait_for_state(running_job, "RUNNING")
+
+        # The only job slot is used, so the second job is still queued
+        self.job_backend.cancel(queued_job)
+        self.assertEqual(self.job_backend.poll(queued_job), -9)
+        self.assertEqual(self.job_backend.read_job_file(queued_job.job_id, "state"), "CANCELLED")
+        self.assertFalse(os.path.isfile(os.path.join(self.job_backend.get_job_directory(queued_job.job_id), "stdout")))
+
+        self.job_backend.cancel(running_job)
+        self.assertNotEqual(self.job_backend.wait(running_job), 0)
+        self.assertEqual(self.job_backend.read_job_file(running_job.job_id, "state"), "CANCELLED")
+
+    def test_clean_jobs_removes_only_own_finished_jobs(self):
+        other_run_job_directory = os.path.join(self.spool_directory, "other_run_job")
+        os.makedirs(other_run_job_directory)
+        with open(os.path.join(other_run_job_directory, "state"), mode="w") as state_file_object:
+            state_file_object.write("DONE\n")
+
+        finished_job = self.submit("exit 0", "finished")
+        self.assertEqual(self.job_backend.wait(finished_job), 0)
+        running_job = self.submit("sleep 30", "running")
+        self.wait_for_state(running_job, "RUNNING")
+
+        self.job_backend.clean_jobs()
+        self.assertFalse(os.path.isdir(self.job_backend.get_job_directory(finished_job.job_id)))
+        self.assertTrue(os.path.isdir(self.job_backend.get_job_directory(running_job.job_id)))
+        self.assertTrue(os.path.isdir(other_run_job_directory))
+
+        self.job_backend.cancel(running_job)
+        self.job_backend.wait(running_job)
+        self.job_backend.clean_jobs()
+        self.assertFalse(os.path.isdir(self.job_backend.get_job_directory(running_job.job_id)))
+
+
+if __name__ == '__main__':
+    unittest.main()
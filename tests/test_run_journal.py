@@ -0,0 +1,62 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import msip_ESE
+
+
+class RunJournalTest(unittest.TestCase):
+    """
+    The run journal replay tests
+    """
+
+    def setUp(self):
+        self.log_directory = tempfile.mkdtemp()
+        self.journal_file = os.path.join(self.log_directory, msip_ESE.run_journal_file_name)
+
+    def get_run_journal(self, resume):
+        msip_ese_object = msip_ESE.MsipEse()
+        msip_ese_object.object_stdout_file = open(os.devnull, "w")
+        msip_ese_object.set_log_directory(self.log_directory)
+        if resume:
+            msip_ese_object.enable_resume()
+
+        run_journal = msip_ese_object.get_run_journal
+        run_journal.record("RUN", "MsipEse", "START", {"resume": resume})
+
+        return run_journal
+
+    def test_killed_run_then_fresh_run_then_resume(self):
+        run_journal = self.get_run_journal(False)
+        run_journal.run_unit("PEX", "a_PEX.sh", lambda: 0)
+        # The script is killed during the record writing
+        with open(self.journal_file, mode="a") as journal_file_object:
+            journal_file_object.write('{"name": "b_PEX.sh", "sta')
+
+        run_journal = self.get_run_journal(False)
+        run_journal.run_unit("PEX", "b_PEX.sh", lambda: 0)
+
+        run_journal = self.get_run_journal(True)
+        self.assertFalse(run_journal.check_if_unit_is_finished("PEX", "a_PEX.sh"))
+        self.assertTrue(run_journal.check_if_unit_is_finished("PEX", "b_PEX.sh"))
+
+        with open(self.journal_file, mode="r") as journal_file_object:
+            self.assertNotIn('"sta{', journal_file_object.read())
+
+    def test_resume_skips_only_finished_units(self):
+        run_journal = self.get_run_journal(False)
+        run_journal.run_unit("PEX", "a_PEX.sh", lambda: 0)
+        run_journal.run_unit("PEX", "b_PEX.sh", lambda: 1, failed_result_check=lambda exit_status: exit_status != 0)
+        run_journal.record("SIM", "tc", "START")
+
+        run_journal = self.get_run_journal(True)
+        self.assertTrue(run_journal.check_if_unit_is_finished("PEX", "a_PEX.sh"))
+        self.assertFalse(run_journal.check_if_unit_is_finished("PEX", "b_PEX.sh"))
+        self.assertFalse(run_journal.check_if_unit_is_finished("SIM", "tc"))
+
+
+if __name__ == '__main__':
+    unittest.main()